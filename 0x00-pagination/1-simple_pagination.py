@@ -9,10 +9,12 @@ retrieve specific pages of data.
 
 Usage:
     To use this module, create an instance of the Server class and call
-    the `get_page` method with the desired page number and page size.
+    the `get_page` method with the desired page number and page size,
+    or `iter_pages` to stream the whole dataset page by page.
 """
 import csv
-from typing import List, Tuple
+import itertools
+from typing import Iterator, List, Tuple
 
 
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
@@ -91,3 +93,45 @@ class Server:
             return []
 
         return dataset[start_index:end_index]
+
+    def iter_rows(self) -> Iterator[List[str]]:
+        """Stream the rows of the dataset straight from the CSV file.
+
+        Returns:
+        Iterator[List[str]]: The data rows, read and parsed one at a time
+                             without loading or caching the dataset.
+        """
+        with open(self.DATA_FILE) as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            yield from reader
+
+    def iter_pages(self, page_size: int = 10,
+                   start_page: int = 1) -> Iterator[List[List[str]]]:
+        """Stream the dataset page by page, holding one page at a time.
+
+        Parameters:
+        page_size (int): The number of items per page (default is 10).
+        start_page (int): The first page to yield, 1-indexed
+                          (default is 1).
+
+        Returns:
+        Iterator[List[List[str]]]: The pages get_page would return for
+                                   start_page, start_page + 1, ... up to
+                                   the last, possibly shorter, page.
+
+        Raises:
+        AssertionError: If page_size or start_page is not a positive
+                        integer.
+        """
+        assert (isinstance(start_page, int) and start_page > 0), \
+            "start_page must be a positive integer"
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
+
+        start_index, _ = index_range(start_page, page_size)
+        rows = itertools.islice(self.iter_rows(), start_index, None)
+        page = list(itertools.islice(rows, page_size))
+        while page:
+            yield page
+            page = list(itertools.islice(rows, page_size))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Page-size agnostic block cache in front of Server.get_page.
+
+The dataset is cut into blocks of BLOCK_SIZE rows, and a page is assembled
+from the blocks that `index_range(page, page_size)` overlaps. The blocks
+are stored in a cache keyed by (block number, dataset version), so pages
+of any size share the same cached rows, and a reloaded dataset never
+serves stale blocks. Any cache with `put(key, item)` and `get(key)` will
+do, typically one of the 0x01-caching policies, which bounds the blocks
+kept and decides which one to evict. Without one, every block of the
+current version is kept, and those of older versions are dropped.
+
+Usage:
+    LRUCache = __import__('3-lru_cache').LRUCache   # from 0x01-caching
+    server = Server(LRUCache(max_items=256, listener=None))
+    server = Server(cache, source=mmap_server) caches another backend.
+"""
+from typing import Any, List, Optional
+
+hypermedia = __import__('2-hypermedia_pagination')
+index_range = hypermedia.index_range
+
+
+class LatestVersionCache:
+    """Cache keeping every block of one dataset version, used when no
+    cache is given.
+
+    Keys end with the dataset version. Storing an item of another version
+    drops those of the version before, so a reload frees the old blocks
+    instead of keeping them forever.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self.cache_data = {}
+        self.version = None
+
+    def put(self, key: Any, item: Any) -> None:
+        """Store item under key, first dropping every item of another
+        version than the one key ends with.
+        """
+        if key[-1] != self.version:
+            self.cache_data = {}
+            self.version = key[-1]
+        self.cache_data[key] = item
+
+    def get(self, key: Any) -> Any:
+        """Return the item stored under key, or None."""
+        return self.cache_data.get(key)
+
+
+class Server(hypermedia.Server):
+    """Server class answering pages from cached blocks of rows.
+
+    Attributes:
+    BLOCK_SIZE (int): The number of rows per block.
+    cache: Where blocks are stored, with put(key, item) and get(key).
+    source (hypermedia.Server): The server whose dataset is cached, None
+                                for the dataset of this one.
+    """
+    BLOCK_SIZE = 64
+
+    def __init__(self, cache: Any = None,
+                 source: Optional[hypermedia.Server] = None) -> None:
+        """Initialize the Server.
+
+        Parameters:
+        cache: The block cache, e.g. a 0x01-caching policy instance
+               (default is None, a LatestVersionCache keeping every block
+               of the current dataset version).
+        source (hypermedia.Server): Another server to read blocks from,
+                                    e.g. a memory-mapped one (default is
+                                    None).
+        """
+        super().__init__()
+        self.cache = LatestVersionCache() if cache is None else cache
+        self.source = source
+
+    def dataset(self) -> List[List[str]]:
+        """Return the dataset of the source server, or this one's."""
+        if self.source is not None:
+            return self.source.dataset()
+        return super().dataset()
+
+    def dataset_version(self) -> int:
+        """Return the version of the dataset blocks are read from."""
+        if self.source is not None:
+            return self.source.dataset_version()
+        return super().dataset_version()
+
+    def block(self, number: int) -> List[List[str]]:
+        """Return a block of rows, from the cache when it is there.
+
+        Parameters:
+        number (int): The block number; block n holds the rows from
+                      n * BLOCK_SIZE on.
+
+        Returns:
+        List[List[str]]: Up to BLOCK_SIZE rows. They are only cached if
+        the dataset version did not change while they were read, so a
+        reload in the meantime never files old rows under the new
+        version.
+        """
+        version = self.dataset_version()
+        dataset = self.dataset()
+        key = (number, version)
+        rows = self.cache.get(key)
+        if rows is None:
+            start = number * self.BLOCK_SIZE
+            rows = dataset[start:start + self.BLOCK_SIZE]
+            if self.dataset_version() == version:
+                self.cache.put(key, rows)
+        return rows
+
+    def get_page(self, page: int = 1, page_size: int = 10) -> List[List[str]]:
+        """Return a specific page of the dataset, assembled from blocks.
+
+        Parameters:
+        page (int): The page number (1-indexed, default is 1).
+        page_size (int): The number of items per page (default is 10).
+
+        Returns:
+        List[List[str]]: A list containing the rows of the dataset for the
+                         requested page. Returns an empty list if the page
+                         is out of range.
+
+        Raises:
+        AssertionError: If page or page_size is not a positive integer.
+        """
+        assert (isinstance(page, int) and page > 0), \
+            "page must be a positive integer"
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
+
+        start_index, end_index = index_range(page, page_size)
+        end_index = min(end_index, len(self.dataset()))
+        if start_index >= end_index:
+            return []
+
+        size = self.BLOCK_SIZE
+        first, last = start_index // size, (end_index - 1) // size
+        if first == last:
+            offset = first * size
+            return self.block(first)[start_index - offset:end_index - offset]
+        rows = self.block(first)[start_index - first * size:]
+        for number in range(first + 1, last):
+            rows.extend(self.block(number))
+        rows.extend(self.block(last)[:end_index - last * size])
+        return rows
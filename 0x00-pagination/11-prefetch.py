@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Read-ahead prefetching of the pages clients are about to ask for.
+
+Clients almost always follow the next_page or next_index link of the page
+they were served. Prefetcher wraps a server and, once a page is served,
+loads the pages behind that link in a background thread so they are
+ready when asked for. The read-ahead depth adapts to the access pattern:
+it doubles, up to max_depth, every time a client follows the link, and
+falls to zero, cancelling the pages loaded ahead, as soon as an access is
+not the one predicted. Pages loaded ahead never hold more than budget
+rows, and are keyed by dataset version, so a changed dataset is never
+served from them.
+
+Usage:
+    server = Prefetcher(__import__('5-mmap_dataset').Server())
+    server.get_hyper(1, 100)   # then pages 2, 3... are loaded ahead
+"""
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+
+class Prefetcher:
+    """Wrapper of a server loading the next pages ahead of time.
+
+    Attributes:
+    server: The server answering get_hyper and/or get_hyper_index, with
+            dataset_version().
+    max_depth (int): The most pages loaded ahead.
+    budget (int): The most rows held in pages loaded ahead.
+    depth (int): The current read-ahead depth, 1 until the first access
+                 pattern is seen.
+    hits (int): Pages served from the read-ahead.
+    misses (int): Pages loaded on demand.
+    """
+
+    def __init__(self, server: Any, max_depth: int = 4,
+                 budget: int = 10000,
+                 executor: Optional[Executor] = None) -> None:
+        """Initialize the Prefetcher.
+
+        Parameters:
+        server: The server to wrap.
+        max_depth (int): The most pages loaded ahead (default is 4).
+        budget (int): The most rows held ahead (default is 10000).
+        executor (Executor): Where pages are loaded ahead (default is
+                             None, a thread of the Prefetcher's own).
+        """
+        self.server = server
+        self.max_depth = max_depth
+        self.budget = budget
+        self.depth = 1
+        self.hits = 0
+        self.misses = 0
+        self.__own_executor = executor is None
+        self.executor = (ThreadPoolExecutor(max_workers=1)
+                         if executor is None else executor)
+        self.__lock = threading.Lock()
+        self.__pages = {}
+        self.__rows = 0
+        self.__expected = None
+        self.__version = None
+        self.__cancelled = threading.Event()
+
+    def __fetch(self, kind: str, position: int, page_size: int) -> Dict:
+        """Load a page from the server."""
+        if kind == "page":
+            return self.server.get_hyper(position, page_size)
+        return self.server.get_hyper_index(position, page_size)
+
+    @staticmethod
+    def __next(kind: str, result: Dict) -> Optional[int]:
+        """Return the position of the page after result, if any."""
+        return result['next_page' if kind == "page" else 'next_index']
+
+    def __serve(self, kind: str, position: int, page_size: int) -> Dict:
+        """Return a page, from the read-ahead when it is there, and load
+        the pages after it ahead.
+        """
+        version = self.server.dataset_version()
+        key = (kind, position, page_size, version)
+        with self.__lock:
+            self.__sync(version)
+            if key[:3] == self.__expected:
+                self.depth = min(self.max_depth, max(1, self.depth * 2))
+            elif self.__expected is not None:
+                self.depth = 0
+                self.__cancel()
+            result = self.__pages.pop(key, None)
+            if result is not None:
+                self.__rows -= len(result['data'])
+                self.hits += 1
+        if result is None:
+            self.misses += 1
+            result = self.__fetch(kind, position, page_size)
+
+        following = self.__next(kind, result)
+        version = self.server.dataset_version()
+        with self.__lock:
+            self.__sync(version)
+            self.__expected = (kind, following, page_size)
+            depth = self.depth
+            cancelled = self.__cancelled
+        if following is not None and depth:
+            self.executor.submit(self.__read_ahead, kind, following,
+                                 page_size, version, depth, cancelled)
+        return result
+
+    def __read_ahead(self, kind: str, position: int, page_size: int,
+                     version: int, depth: int,
+                     cancelled: threading.Event) -> None:
+        """Load depth pages from position on, stopping when cancelled, out
+        of budget, or at the last page.
+        """
+        for _ in range(depth):
+            if cancelled.is_set() or position is None:
+                return
+            key = (kind, position, page_size, version)
+            with self.__lock:
+                result = self.__pages.get(key)
+            if result is None:
+                if self.server.dataset_version() != version:
+                    return
+                result = self.__fetch(kind, position, page_size)
+                with self.__lock:
+                    rows = len(result['data'])
+                    if (cancelled.is_set() or key in self.__pages or
+                            self.__rows + rows > self.budget):
+                        return
+                    self.__pages[key] = result
+                    self.__rows += rows
+            position = self.__next(kind, result)
+
+    def __sync(self, version: int) -> None:
+        """Drop the pages read ahead for another dataset version. The
+        caller holds the lock.
+        """
+        if version != self.__version:
+            self.__cancel()
+            self.__version = version
+
+    def __cancel(self) -> None:
+        """Stop reading ahead and drop the pages loaded ahead. The caller
+        holds the lock.
+        """
+        self.__cancelled.set()
+        self.__cancelled = threading.Event()
+        self.__pages.clear()
+        self.__rows = 0
+
+    def cancel(self) -> None:
+        """Stop reading ahead and drop the pages loaded ahead."""
+        with self.__lock:
+            self.__cancel()
+            self.__expected = None
+
+    def close(self) -> None:
+        """Cancel the read-ahead and stop the Prefetcher's own thread."""
+        self.cancel()
+        if self.__own_executor:
+            self.executor.shutdown(wait=True)
+
+    def pending(self) -> Tuple[int, int]:
+        """Return the number of pages and of rows held ahead."""
+        with self.__lock:
+            return len(self.__pages), self.__rows
+
+    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+        """Return the get_hyper dictionary of the server, reading the
+        following pages ahead.
+        """
+        return self.__serve("page", page, page_size)
+
+    def get_hyper_index(self, index: int = None,
+                        page_size: int = 10) -> Dict:
+        """Return the get_hyper_index dictionary of the server, reading the
+        following pages ahead.
+        """
+        return self.__serve("index", index, page_size)
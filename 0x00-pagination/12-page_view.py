@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Zero-copy pages of the baby names dataset.
+
+`dataset[start_index:end_index]` copies a page into a new list on every
+call, which for large page sizes dominates the cost of a request. A
+PageView is a read-only sequence over a range of its backing store: making
+one copies nothing, rows are only read from the store when the view is
+indexed or iterated, and slicing a view gives another view. Views compare
+equal to lists holding the same rows, print like them and concatenate with
+them into lists, so code reading a page as a sequence takes them as is.
+
+A view is not a list, though: `json.dumps` rejects it, so encode pages with
+`json.dumps(hyper, default=list)`, as 13-serialized_pages.py does, or call
+`list(page)` where a real list is needed, e.g. to modify it.
+
+A view reads the store it was made from: a reloaded dataset is a new
+store, so the views already handed out keep their rows.
+
+Usage:
+    server = Server()
+    page = server.get_page(3, 1000)     # a PageView, nothing copied
+    for row in page: ...                # rows read CHUNK at a time
+    server = Server(source=mmap_server) gives views over another backend.
+"""
+import itertools
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Iterator, List, Optional, Sequence, Union
+
+hypermedia = __import__('2-hypermedia_pagination')
+index_range = hypermedia.index_range
+
+
+class PageView(SequenceABC):
+    """Read-only view of the rows start to stop of a sequence.
+
+    Attributes:
+    CHUNK (int): The number of rows sliced from source at a time while
+                 iterating.
+    source (Sequence): The backing store, e.g. the dataset list.
+    """
+    CHUNK = 256
+
+    def __init__(self, source: Sequence, start: int = 0,
+                 stop: Optional[int] = None) -> None:
+        """Initialize a view of source[start:stop].
+
+        Parameters:
+        source (Sequence): The backing store.
+        start (int): The first row of the view (default is 0).
+        stop (int): The row after the last one, clamped to the length of
+                    source (default is None, the end of source).
+        """
+        self.source = source
+        self.__range = range(len(source))[start:stop]
+
+    @classmethod
+    def __over(cls, source: Sequence, rows: range) -> "PageView":
+        """Return the view of source over the indexes in rows."""
+        view = cls.__new__(cls)
+        view.source = source
+        view.__range = rows
+        return view
+
+    @property
+    def start(self) -> int:
+        """The index in source of the first row of the view."""
+        return self.__range.start
+
+    @property
+    def stop(self) -> int:
+        """The index in source after the last row of the view."""
+        return self.__range.stop
+
+    def __len__(self) -> int:
+        """Return the number of rows in the view."""
+        return len(self.__range)
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union[Any, "PageView"]:
+        """Return the row at index, or a view of a slice of this view."""
+        if isinstance(index, slice):
+            return self.__over(self.source, self.__range[index])
+        try:
+            position = self.__range[index]
+        except IndexError:
+            raise IndexError("page index out of range") from None
+        return self.source[position]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Read the rows of the view from source, CHUNK rows at a time."""
+        rows = self.__range
+        if rows.step != 1:
+            return map(self.source.__getitem__, rows)
+        return itertools.chain.from_iterable(
+            self.source[start:min(start + self.CHUNK, rows.stop)]
+            for start in range(rows.start, rows.stop, self.CHUNK))
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if other is a list, tuple or view of equal rows."""
+        if not isinstance(other, (list, tuple, PageView)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other))
+
+    __hash__ = None
+
+    def __add__(self, other: Sequence) -> List[Any]:
+        """Return a new list of the rows of the view followed by other."""
+        if not isinstance(other, (list, tuple, PageView)):
+            return NotImplemented
+        return list(self) + list(other)
+
+    def __radd__(self, other: Sequence) -> List[Any]:
+        """Return a new list of the rows of other followed by the view."""
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return list(other) + list(self)
+
+    def __repr__(self) -> str:
+        """Return the repr of the list of rows, as get_page printed it."""
+        return repr(list(self))
+
+
+class Server(hypermedia.Server):
+    """Server class answering pages as PageViews of the dataset.
+
+    Attributes:
+    source (hypermedia.Server): The server whose dataset is viewed, None
+                                for the dataset of this one.
+    """
+
+    def __init__(self, source: Optional[hypermedia.Server] = None) -> None:
+        """Initialize the Server.
+
+        Parameters:
+        source (hypermedia.Server): Another server to view the dataset
+                                    of, e.g. a memory-mapped one (default
+                                    is None).
+        """
+        super().__init__()
+        self.source = source
+
+    def dataset(self) -> List[List[str]]:
+        """Return the dataset of the source server, or this one's."""
+        if self.source is not None:
+            return self.source.dataset()
+        return super().dataset()
+
+    def dataset_version(self) -> int:
+        """Return the version of the dataset pages are views of."""
+        if self.source is not None:
+            return self.source.dataset_version()
+        return super().dataset_version()
+
+    def get_page(self, page: int = 1, page_size: int = 10) -> PageView:
+        """Return a view of a specific page of the dataset.
+
+        Parameters:
+        page (int): The page number (1-indexed, default is 1).
+        page_size (int): The number of items per page (default is 10).
+
+        Returns:
+        PageView: The rows of the dataset for the requested page, copied
+                  from nothing. The view is empty if the page is out of
+                  range. Encode it with json.dumps(..., default=list).
+
+        Raises:
+        AssertionError: If page or page_size is not a positive integer.
+        """
+        assert (isinstance(page, int) and page > 0), \
+            "page must be a positive integer"
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
+
+        start_index, end_index = index_range(page, page_size)
+        return PageView(self.dataset(), start_index, end_index)
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Pre-serialized pagination payloads.
+
+Responses built from get_hyper are encoded from Python lists on every
+request, even when neither the page nor the dataset changed. PayloadServer
+wraps a server and keeps the encoded body of each page it served, keyed
+by dataset version, together with a strong ETag, so a repeated request
+costs a cache lookup and a write of ready-made bytes.
+
+Bodies come in two encodings, each optionally compressed:
+- "json": compact JSON, the dictionary of get_hyper as it is;
+- "binary": a tagged encoding where each distinct string is written once
+  and then referred to by number, decoded by `decode_binary`.
+Compression is "identity", "gzip" or "deflate" (zlib), named like the
+Content-Encoding header values.
+
+Usage:
+    server = PayloadServer(__import__('2-hypermedia_pagination').Server())
+    payload = server.hyper_payload(1, 100, "json", "gzip")
+    payload['body'], payload['etag'], payload['content_type']...
+"""
+import gzip
+import hashlib
+import json
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+block_cache = __import__('10-block_cache')
+
+NONE, TRUE, FALSE, INT, STR, REF, LIST, DICT = range(8)
+BINARY_MAGIC = b"PGB\x01"
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a pagination dictionary as compact JSON.
+
+    Any sequence that is not a list, e.g. a PageView, is written as a
+    list.
+    """
+    return json.dumps(value, separators=(",", ":"),
+                      default=list).encode()
+
+
+def append_varint(out: bytearray, number: int) -> None:
+    """Append a non-negative int to out, 7 bits per byte."""
+    while number > 0x7f:
+        out.append(number & 0x7f | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def encode_binary(value: Any) -> bytes:
+    """Encode a pagination dictionary in the compact binary encoding.
+
+    Parameters:
+    value: None, bool, int, str, dict with str keys, or any sequence of
+           those, e.g. the dictionary of get_hyper.
+
+    Returns:
+    bytes: BINARY_MAGIC then the tagged value. Ints are zigzag varints,
+           and a str already written is written as the number it was
+           first seen with.
+    """
+    out = bytearray(BINARY_MAGIC)
+    strings = {}
+
+    def write(item: Any) -> None:
+        """Append the tagged item to out."""
+        if item is None:
+            out.append(NONE)
+        elif item is True or item is False:
+            out.append(TRUE if item else FALSE)
+        elif isinstance(item, int):
+            out.append(INT)
+            append_varint(out, item << 1 if item >= 0 else (~item << 1) | 1)
+        elif isinstance(item, str):
+            number = strings.get(item)
+            if number is not None:
+                out.append(REF)
+                append_varint(out, number)
+                return
+            strings[item] = len(strings)
+            data = item.encode()
+            out.append(STR)
+            append_varint(out, len(data))
+            out.extend(data)
+        elif isinstance(item, dict):
+            out.append(DICT)
+            append_varint(out, len(item))
+            for key, member in item.items():
+                write(key)
+                write(member)
+        else:
+            out.append(LIST)
+            append_varint(out, len(item))
+            for member in item:
+                write(member)
+
+    write(value)
+    return bytes(out)
+
+
+def decode_binary(data: bytes) -> Any:
+    """Decode a value written by encode_binary.
+
+    Raises:
+    ValueError: If data is not in the binary encoding.
+    """
+    if data[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+        raise ValueError("not a binary page payload")
+    strings = []
+    position = len(BINARY_MAGIC)
+
+    def varint() -> int:
+        """Read a varint at position."""
+        nonlocal position
+        number = shift = 0
+        while True:
+            byte = data[position]
+            position += 1
+            number |= (byte & 0x7f) << shift
+            shift += 7
+            if byte < 0x80:
+                return number
+
+    def read() -> Any:
+        """Read the tagged value at position."""
+        nonlocal position
+        tag = data[position]
+        position += 1
+        if tag == NONE:
+            return None
+        if tag in (TRUE, FALSE):
+            return tag == TRUE
+        if tag == INT:
+            number = varint()
+            return ~(number >> 1) if number & 1 else number >> 1
+        if tag == STR:
+            size = varint()
+            position += size
+            strings.append(data[position - size:position].decode())
+            return strings[-1]
+        if tag == REF:
+            return strings[varint()]
+        if tag == LIST:
+            return [read() for _ in range(varint())]
+        if tag == DICT:
+            return {read(): read() for _ in range(varint())}
+        raise ValueError("unknown tag {} in page payload".format(tag))
+
+    try:
+        return read()
+    except IndexError:
+        raise ValueError("truncated page payload") from None
+
+
+ENCODINGS = {
+    "json": ("application/json", encode_json),
+    "binary": ("application/x-page-binary", encode_binary),
+}
+COMPRESSIONS = {
+    "identity": None,
+    "gzip": lambda body: gzip.compress(body, mtime=0),
+    "deflate": zlib.compress,
+}
+
+
+def etag(body: bytes) -> str:
+    """Return the strong ETag of a body: a quoted digest of its bytes, so
+    every encoding and compression of a page has its own.
+    """
+    return '"{}"'.format(hashlib.blake2b(body, digest_size=16).hexdigest())
+
+
+class PayloadServer:
+    """Wrapper of a server caching the encoded bodies of its pages.
+
+    Attributes:
+    server: The server answering get_hyper and/or get_hyper_index, with
+            dataset_version().
+    cache: Where payloads are stored, with put(key, item) and get(key),
+           typically a 0x01-caching policy bounding how many are kept.
+    """
+
+    def __init__(self, server: Any, cache: Any = None) -> None:
+        """Initialize the PayloadServer.
+
+        Parameters:
+        server: The server to wrap.
+        cache: The payload cache (default is None, a LatestVersionCache
+               keeping every payload of the current dataset version).
+        """
+        self.server = server
+        self.cache = (block_cache.LatestVersionCache() if cache is None
+                      else cache)
+
+    def __payload(self, kind: str, position: Any, page_size: int,
+                  encoding: str, compression: str,
+                  fetch: Callable[[], Dict]) -> Dict[str, Any]:
+        """Return the cached payload of a page, encoding it on a miss.
+
+        The identity body of a page is cached too, so its other
+        compressions are made from it without calling fetch again.
+        """
+        assert encoding in ENCODINGS, \
+            "unknown encoding: {}".format(encoding)
+        assert compression in COMPRESSIONS, \
+            "unknown compression: {}".format(compression)
+        page = (kind, position, page_size)
+        key = page + (encoding, compression, self.server.dataset_version())
+        payload = self.cache.get(key)
+        if payload is not None:
+            return payload
+
+        content_type, encode = ENCODINGS[encoding]
+        identity = key[:4] + ("identity", key[5])
+        plain = None if compression == "identity" else self.cache.get(identity)
+        if plain is None:
+            result, version = self.__fetch(fetch)
+            identity = identity[:5] + (version,)
+            plain = self.__store(identity, encode(result), content_type,
+                                 "identity")
+        if compression == "identity":
+            return plain
+        body = COMPRESSIONS[compression](plain['body'])
+        key = identity[:4] + (compression, identity[5])
+        return self.__store(key, body, content_type, compression)
+
+    def __fetch(self, fetch: Callable[[], Dict]
+                ) -> Tuple[Dict, Optional[int]]:
+        """Call fetch and return its result with the dataset version it was
+        built from: the version read both before and after the call.
+
+        A call during which the version changed, e.g. because it loaded
+        or reloaded the dataset, is made once more; if the version changes
+        again the version returned is None.
+        """
+        for _ in range(2):
+            version = self.server.dataset_version()
+            result = fetch()
+            if self.server.dataset_version() == version:
+                return result, version
+        return result, None
+
+    def __store(self, key: Tuple, body: bytes, content_type: str,
+                compression: str) -> Dict[str, Any]:
+        """Return the payload of body, cached under key unless the dataset
+        version it was built from is unknown.
+        """
+        payload = {
+            'body': body,
+            'etag': etag(body),
+            'content_type': content_type,
+            'content_encoding': compression,
+            'version': key[-1]
+        }
+        if key[-1] is not None:
+            self.cache.put(key, payload)
+        return payload
+
+    def hyper_payload(self, page: int = 1, page_size: int = 10,
+                      encoding: str = "json",
+                      compression: str = "identity") -> Dict[str, Any]:
+        """Return the encoded get_hyper dictionary of a page.
+
+        Parameters:
+        page (int): The page number (1-indexed, default is 1).
+        page_size (int): The number of items per page (default is 10).
+        encoding (str): A key of ENCODINGS (default is "json").
+        compression (str): A key of COMPRESSIONS (default is "identity").
+
+        Returns:
+        Dict[str, Any]: The body bytes, its strong etag, its content_type
+                        and content_encoding, and the dataset version it
+                        was encoded from, None if the dataset kept
+                        changing while the page was built, in which case
+                        the payload is not cached. Otherwise the same
+                        dictionary is returned until the dataset changes;
+                        do not modify it.
+
+        Raises:
+        AssertionError: If encoding or compression is unknown.
+        """
+        return self.__payload(
+            "page", page, page_size, encoding, compression,
+            lambda: self.server.get_hyper(page, page_size))
+
+    def hyper_index_payload(self, index: int = None, page_size: int = 10,
+                            encoding: str = "json",
+                            compression: str = "identity"
+                            ) -> Dict[str, Any]:
+        """Return the encoded get_hyper_index dictionary of a page.
+
+        Parameters:
+        index (int): The starting index for pagination (default is None).
+        page_size (int): The number of items to return (default is 10).
+        encoding (str): A key of ENCODINGS (default is "json").
+        compression (str): A key of COMPRESSIONS (default is "identity").
+
+        Returns:
+        Dict[str, Any]: The payload, as hyper_payload returns it.
+
+        Raises:
+        AssertionError: If encoding or compression is unknown.
+        """
+        return self.__payload(
+            "index", index, page_size, encoding, compression,
+            lambda: self.server.get_hyper_index(index, page_size))
+
+    @staticmethod
+    def not_modified(payload: Dict[str, Any],
+                     if_none_match: Optional[str]) -> bool:
+        """Return True if an If-None-Match header value matches the ETag of
+        payload, compared weakly as the header requires, so a 304 answer
+        with no body will do.
+        """
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        tags = [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+        return "*" in tags or payload['etag'] in tags
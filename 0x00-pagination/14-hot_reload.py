@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Hot reload of the baby names dataset.
+
+The servers load DATA_FILE once, so a new export of the CSV file is only
+picked up by restarting the process. DatasetManager watches the file and,
+when its size or modification time changes and its content digest does
+too, builds the new dataset and its deletion-resilient index in a
+background thread. The result is an immutable Snapshot with the next
+version number, swapped in with a single assignment.
+
+Requests never take a lock: each one reads the current snapshot once and
+answers from it, so a request running during a swap finishes on the old
+version. Caches keyed by dataset_version() (page metadata, block cache,
+prefetcher, payloads) stop matching the old version on a swap: its
+entries age out of bounded caches, and the default caches of blocks and
+payloads drop them when the first entry of the new version is stored.
+
+Usage:
+    server = Server()   # then replace Popular_Baby_Names.csv in place
+    server.get_hyper(1, 10) answers from the new file once it is loaded.
+"""
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+hypermedia = __import__('2-hypermedia_pagination')
+async_server = __import__('8-async_server')
+
+
+def file_digest(path: str) -> Tuple[Tuple[int, int], str]:
+    """Return the (size, mtime_ns) stamp of a file and the digest of its
+    content, stamped before reading so a change while reading is seen by
+    the next check.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return (stat.st_size, stat.st_mtime_ns), digest.hexdigest()
+
+
+class Snapshot:
+    """One version of the dataset, never changed once built.
+
+    Attributes:
+    version (int): The number of the snapshot, 1 for the first load.
+    digest (str): The content digest of the file it was built from.
+    server (hypermedia.Server): Pages of get_page and get_hyper.
+    indexed (IndexServer): Pages of get_hyper_index and get_cursor_page,
+                           over the rows of server.
+    """
+    __slots__ = ("version", "digest", "server", "indexed")
+
+    def __init__(self, version: int, digest: str, path: str) -> None:
+        """Load the dataset at path and build its index."""
+        self.version = version
+        self.digest = digest
+        self.server = hypermedia.Server()
+        self.server.DATA_FILE = path
+        self.server.dataset()
+        self.indexed = async_server.IndexServer(self.server)
+        self.indexed.indexed_dataset()
+
+
+class DatasetManager:
+    """Owner of the current Snapshot of a CSV file, reloading it in the
+    background when the file changes.
+
+    Attributes:
+    path (str): The CSV file.
+    check_interval (float): The fewest seconds between two checks of
+                            the file, 0 to check on every request.
+    """
+
+    def __init__(self, path: str, check_interval: float = 1.0,
+                 executor: Optional[Executor] = None) -> None:
+        """Initialize the DatasetManager; the file is loaded on first use.
+
+        Parameters:
+        path (str): The CSV file.
+        check_interval (float): The fewest seconds between two checks
+                                (default is 1.0).
+        executor (Executor): Where snapshots are built (default is None,
+                             a thread of the manager's own).
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self.__own_executor = executor is None
+        self.executor = (ThreadPoolExecutor(max_workers=1)
+                         if executor is None else executor)
+        self.__snapshot = None
+        self.__stamp = None
+        self.__version = 0
+        self.__next_check = 0.0
+        self.__building = threading.Lock()
+        self.__submitting = threading.Lock()
+        self.__pending = None
+
+    def snapshot(self) -> Snapshot:
+        """Return the current snapshot, starting a reload in the background
+        if the file changed.
+
+        Only the first call waits, for the first load.
+        """
+        snapshot = self.__snapshot
+        if snapshot is None:
+            return self.reload()
+        self.poll()
+        return snapshot
+
+    def changed(self) -> bool:
+        """Return True if the size or modification time of the file differ
+        from those of the last load.
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) != self.__stamp
+
+    def poll(self) -> Optional[Future]:
+        """Start a background reload if check_interval passed and the file
+        changed, never waiting for a lock.
+
+        Returns:
+        Future: The reload in flight, None if there is none.
+        """
+        pending = self.__pending
+        if pending is not None and not pending.done():
+            return pending
+        now = time.monotonic()
+        if now < self.__next_check:
+            return None
+        self.__next_check = now + self.check_interval
+        if not self.changed() or not self.__submitting.acquire(False):
+            return None
+        try:
+            pending = self.__pending
+            if pending is None or pending.done():
+                pending = self.executor.submit(self.reload)
+                self.__pending = pending
+            return pending
+        finally:
+            self.__submitting.release()
+
+    def reload(self, force: bool = False) -> Snapshot:
+        """Build a snapshot of the file and swap it in, unless the content
+        digest is that of the current snapshot.
+
+        Parameters:
+        force (bool): Rebuild even if the content is unchanged (default is
+                      False).
+
+        Returns:
+        Snapshot: The current snapshot after the reload.
+
+        Raises:
+        OSError: If the file cannot be read; the current snapshot is kept.
+        """
+        with self.__building:
+            stamp, digest = file_digest(self.path)
+            current = self.__snapshot
+            if current is not None and not force and digest == current.digest:
+                self.__stamp = stamp
+                return current
+            snapshot = Snapshot(self.__version + 1, digest, self.path)
+            self.__version = snapshot.version
+            self.__stamp = stamp
+            self.__snapshot = snapshot
+            return snapshot
+
+    def wait(self) -> Snapshot:
+        """Check the file, wait for the reload in flight, if any, and return
+        the current snapshot.
+
+        Raises:
+        Exception: Whatever the reload raised.
+        """
+        if self.__snapshot is None:
+            return self.reload()
+        pending = self.poll()
+        if pending is not None:
+            pending.result()
+        return self.__snapshot
+
+    def close(self) -> None:
+        """Stop the manager's own reload thread."""
+        if self.__own_executor:
+            self.executor.shutdown(wait=True)
+
+
+class Server(hypermedia.Server):
+    """Server class to paginate the baby names dataset, reloaded when
+    DATA_FILE changes.
+
+    Every method reads the current snapshot once and answers from it.
+
+    Attributes:
+    manager (DatasetManager): The owner of the snapshots.
+    """
+
+    def __init__(self, manager: Optional[DatasetManager] = None) -> None:
+        """Initialize the Server.
+
+        Parameters:
+        manager (DatasetManager): The snapshots to serve (default is None,
+                                  a manager of DATA_FILE).
+        """
+        super().__init__()
+        self.manager = (DatasetManager(self.DATA_FILE) if manager is None
+                        else manager)
+
+    def snapshot(self) -> Snapshot:
+        """Return the current snapshot, to answer several calls from."""
+        return self.manager.snapshot()
+
+    def dataset(self) -> List[List[str]]:
+        """Return the rows of the current snapshot."""
+        return self.snapshot().server.dataset()
+
+    def dataset_version(self) -> int:
+        """Return the version of the current snapshot, bumped by every
+        reload that changed the content.
+        """
+        return self.snapshot().version
+
+    def count_items(self, query: Hashable = None) -> int:
+        """Count the rows of the current snapshot."""
+        return self.snapshot().server.count_items(query)
+
+    def estimate_items(self, query: Hashable = None) -> int:
+        """Count the rows of the current snapshot, which is always
+        loaded.
+        """
+        return self.snapshot().server.estimate_items(query)
+
+    def page_metadata(self, page_size: int, query: Hashable = None,
+                      approximate: bool = False) -> Dict[str, Any]:
+        """Return the totals of the current snapshot, cached with it."""
+        return self.snapshot().server.page_metadata(page_size, query,
+                                                    approximate)
+
+    def get_page(self, page: int = 1, page_size: int = 10) -> List[List[str]]:
+        """Return a page of the current snapshot, as hypermedia.Server."""
+        return self.snapshot().server.get_page(page, page_size)
+
+    def get_hyper(self, page: int = 1, page_size: int = 10,
+                  approximate: bool = False) -> Dict[str, Any]:
+        """Return the get_hyper dictionary of the current snapshot, data
+        and totals of the same version.
+        """
+        return self.snapshot().server.get_hyper(page, page_size,
+                                                approximate)
+
+    def get_hyper_index(self, index: int = None,
+                        page_size: int = 10) -> Dict:
+        """Return the get_hyper_index dictionary of the current snapshot.
+        """
+        return self.snapshot().indexed.get_hyper_index(index, page_size)
+
+    def get_cursor_page(self, cursor: Optional[str] = None,
+                        page_size: int = 10) -> Dict:
+        """Return the get_cursor_page dictionary of the current snapshot.
+        """
+        return self.snapshot().indexed.get_cursor_page(cursor, page_size)
@@ -10,12 +10,15 @@ retrieve specific pages of data.
 Usage:
     To use this module, create an instance of the Server class and call
     the `get_page` or `get_hyper` method with the desired page number
-    and page size.
+    and page size, or `iter_pages` to stream the whole dataset page by
+    page.
 """
 
 import csv
+import itertools
 import math
-from typing import List, Tuple, Dict, Any
+import os
+from typing import List, Tuple, Dict, Any, Hashable, Iterator
 
 
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
@@ -44,29 +47,139 @@ class Server:
 
     Attributes:
     DATA_FILE (str): The path to the CSV file containing baby names data.
+    ESTIMATE_SAMPLE (int): Bytes of the CSV file read to estimate its
+                           number of rows.
     __dataset (List[List[str]]): Cached dataset loaded from the CSV file.
     """
     DATA_FILE = "Popular_Baby_Names.csv"
+    ESTIMATE_SAMPLE = 1 << 16
 
     def __init__(self):
         """Initialize the Server instance with an empty dataset."""
         self.__dataset = None
+        self.__version = 0
+        self.__metadata = {}
+        self.__metadata_version = 0
 
     def dataset(self) -> List[List[str]]:
         """Load and cache the dataset from the CSV file.
 
         Returns:
         List[List[str]]: The dataset containing baby names data.
-        If the dataset has not been loaded yet, it reads from the CSV file
-        and caches the result for future access.
+        If the dataset has not been loaded yet, it is read by
+        load_dataset, cached for future access, and the dataset version
+        is bumped.
         """
         if self.__dataset is None:
-            with open(self.DATA_FILE) as f:
-                reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
+            self.__dataset = self.load_dataset()
+            self.__version += 1
         return self.__dataset
 
+    def load_dataset(self) -> List[List[str]]:
+        """Read the dataset from the CSV file.
+
+        Backends storing the dataset differently override this rather than
+        dataset(), so every load goes through the same caching and
+        version bump.
+
+        Returns:
+        List[List[str]]: The data rows, without the header.
+        """
+        with open(self.DATA_FILE) as f:
+            reader = csv.reader(f)
+            dataset = [row for row in reader]
+        return dataset[1:]
+
+    def dataset_version(self) -> int:
+        """Return the version of the dataset.
+
+        Returns:
+        int: A number that changes whenever the dataset is (re)loaded, so
+        anything derived from the dataset can be cached per version, and
+        is 0 until it is first loaded.
+        """
+        return self.__version
+
+    def count_items(self, query: Hashable = None) -> int:
+        """Count the items matched by a query.
+
+        Parameters:
+        query (Hashable): What to count, None for the whole dataset.
+                          Servers with filters or views count their own
+                          queries.
+
+        Returns:
+        int: The exact number of items.
+        """
+        return len(self.dataset())
+
+    def estimate_items(self, query: Hashable = None) -> int:
+        """Estimate the items matched by a query without loading the
+        dataset.
+
+        Returns:
+        int: The exact count once the dataset is loaded, otherwise the
+        size of the CSV file divided by the mean size of the rows of its
+        first ESTIMATE_SAMPLE bytes.
+        """
+        if self.dataset_version():
+            return self.count_items(query)
+        with open(self.DATA_FILE, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            sample = f.read(self.ESTIMATE_SAMPLE)
+        header = sample.find(b"\n") + 1
+        rows = sample.count(b"\n", header)
+        if not header or not rows:
+            return self.count_items(query)
+        row_size = (sample.rfind(b"\n") + 1 - header) / rows
+        return round((size - header) / row_size)
+
+    def page_metadata(self, page_size: int, query: Hashable = None,
+                      approximate: bool = False) -> Dict[str, Any]:
+        """Return the totals of a query, cached per dataset version.
+
+        Parameters:
+        page_size (int): The number of items per page.
+        query (Hashable): What to count, None for the whole dataset.
+        approximate (bool): Accept an estimate instead of loading the
+                            dataset (default is False).
+
+        Returns:
+        Dict[str, Any]: The total_items, the total_pages and whether they
+                        are approximate. Totals cached for an older
+                        dataset version are dropped.
+
+        Raises:
+        AssertionError: If page_size is not a positive integer.
+        """
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
+        key = (query, page_size, approximate)
+        metadata = self.__versioned_metadata().get(key)
+        if metadata is None:
+            estimated = approximate and not self.dataset_version()
+            if estimated:
+                total_items = self.estimate_items(query)
+            else:
+                total_items = self.count_items(query)
+            metadata = {
+                'total_items': total_items,
+                'total_pages': math.ceil(total_items / page_size),
+                'approximate': estimated
+            }
+            self.__versioned_metadata()[key] = metadata
+        return metadata
+
+    def __versioned_metadata(self) -> Dict[Tuple, Dict[str, Any]]:
+        """Return the cached totals, emptied when the dataset version
+        changed since they were computed.
+        """
+        version = self.dataset_version()
+        if self.__metadata_version != version:
+            self.__metadata = {}
+            self.__metadata_version = version
+        return self.__metadata
+
     def get_page(self, page: int = 1, page_size: int = 10) -> List[List[str]]:
         """Return a specific page of the dataset.
 
@@ -96,26 +209,89 @@ class Server:
 
         return dataset[start_index:end_index]
 
-    def get_hyper(self, page: int = 1, page_size: int = 10) -> Dict[str, Any]:
+    def iter_rows(self) -> Iterator[List[str]]:
+        """Stream the rows of the dataset straight from the CSV file.
+
+        Returns:
+        Iterator[List[str]]: The data rows, read and parsed one at a time
+                             without loading or caching the dataset.
+        """
+        with open(self.DATA_FILE) as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            yield from reader
+
+    def iter_pages(self, page_size: int = 10,
+                   start_page: int = 1) -> Iterator[List[List[str]]]:
+        """Stream the dataset page by page, holding one page at a time.
+
+        Parameters:
+        page_size (int): The number of items per page (default is 10).
+        start_page (int): The first page to yield, 1-indexed
+                          (default is 1).
+
+        Returns:
+        Iterator[List[List[str]]]: The pages get_page would return for
+                                   start_page, start_page + 1, ... up to
+                                   the last, possibly shorter, page.
+
+        Raises:
+        AssertionError: If page_size or start_page is not a positive
+                        integer.
+        """
+        assert (isinstance(start_page, int) and start_page > 0), \
+            "start_page must be a positive integer"
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
+
+        start_index, _ = index_range(start_page, page_size)
+        rows = itertools.islice(self.iter_rows(), start_index, None)
+        page = list(itertools.islice(rows, page_size))
+        while page:
+            yield page
+            page = list(itertools.islice(rows, page_size))
+
+    def get_hyper(self, page: int = 1, page_size: int = 10,
+                  approximate: bool = False) -> Dict[str, Any]:
         """Return a hypermedia pagination dictionary.
 
         Parameters:
         page (int): The page number (1-indexed, default is 1).
         page_size (int): The number of items per page (default is 10).
+        approximate (bool): Do not load the dataset to answer (default is
+                            False). Until it is loaded, the page is
+                            streamed from DATA_FILE, with one row more
+                            to tell whether a next page exists, and
+                            total_pages is estimated, corrected to the
+                            page itself or the next one where the
+                            stream shows the estimate is too small.
 
         Returns:
         Dict[str, Any]: A dictionary containing pagination information
                          including page size, current page, data,
-                         next page, previous page, and total pages.
+                         next page, previous page, and total pages, plus
+                         whether total_pages is an estimate in
+                         approximate mode.
         """
-        data = self.get_page(page, page_size)
-        total_items = len(self.dataset())
-        total_pages = math.ceil(total_items / page_size)
+        metadata = self.page_metadata(page_size, approximate=approximate)
+        total_pages = metadata['total_pages']
+        if metadata['approximate']:
+            assert (isinstance(page, int) and page > 0), \
+                "page must be a positive integer"
+            start_index, end_index = index_range(page, page_size)
+            rows = list(itertools.islice(self.iter_rows(), start_index,
+                                         end_index + 1))
+            data = rows[:page_size]
+            if data:
+                total_pages = (max(total_pages, page + 1)
+                               if len(rows) > page_size else page)
+        else:
+            data = self.get_page(page, page_size)
 
         next_page = page + 1 if page < total_pages else None
         prev_page = page - 1 if page > 1 else None
 
-        return {
+        hyper = {
             'page_size': len(data),
             'page': page,
             'data': data,
@@ -123,3 +299,6 @@ class Server:
             'prev_page': prev_page,
             'total_pages': total_pages
         }
+        if approximate:
+            hyper['approximate'] = metadata['approximate']
+        return hyper
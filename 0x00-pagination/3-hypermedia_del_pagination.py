@@ -3,8 +3,144 @@
 Deletion-resilient hypermedia pagination
 """
 
+import base64
+import binascii
 import csv
-from typing import List, Dict
+from array import array
+from bisect import bisect_left, insort
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, Iterator, List, Optional
+
+_DELETED = object()
+
+
+def encode_cursor(index: int) -> str:
+    """Return the opaque cursor token that resumes a listing at index.
+    """
+    token = base64.urlsafe_b64encode("i:{}".format(index).encode())
+    return token.decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Return the index a cursor token made by encode_cursor resumes at.
+
+    Raises:
+    ValueError: If cursor is not a valid token.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        text = base64.urlsafe_b64decode(cursor + padding).decode()
+    except (TypeError, binascii.Error, UnicodeDecodeError) as error:
+        raise ValueError("invalid cursor") from error
+    prefix, _, index = text.partition(":")
+    if prefix != "i" or not (index.isascii() and index.isdigit()):
+        raise ValueError("invalid cursor")
+    return int(index)
+
+
+class IndexedDataset(MutableMapping):
+    """Rows keyed by their position in the dataset, starting at 0.
+
+    Rows live in a list where deleted positions hold a tombstone, so a
+    position is never reused and a row is never stored twice: the list of
+    the dataset is shared until the first mutation. The live positions are
+    kept sorted (a range while there is no gap, an array after), so the
+    live rows from any position on are found with a binary search however
+    many rows were deleted before it.
+
+    Attributes:
+    version (int): The number of mutations so far.
+    """
+
+    def __init__(self, rows: Iterable[List] = ()) -> None:
+        """Index rows by their position, sharing rows if it is a list."""
+        self.__rows = rows if isinstance(rows, list) else list(rows)
+        self.__shared = self.__rows is rows
+        self.__keys = range(len(self.__rows))
+        self.version = 0
+
+    def __own(self) -> None:
+        """Stop sharing the row list before changing it."""
+        if self.__shared:
+            self.__rows = list(self.__rows)
+            self.__shared = False
+
+    def __sparse(self) -> None:
+        """Switch the live positions from a range to an array."""
+        if isinstance(self.__keys, range):
+            self.__keys = array('q', self.__keys)
+
+    def __getitem__(self, key: int) -> List:
+        """Return the row at position key."""
+        if isinstance(key, int) and 0 <= key < len(self.__rows):
+            row = self.__rows[key]
+            if row is not _DELETED:
+                return row
+        raise KeyError(key)
+
+    def __setitem__(self, key: int, row: List) -> None:
+        """Store row at position key, which must not be negative."""
+        if not isinstance(key, int) or key < 0:
+            raise KeyError(key)
+        self.__own()
+        self.version += 1
+        rows = self.__rows
+        if key >= len(rows):
+            rows.extend([_DELETED] * (key - len(rows)))
+            rows.append(row)
+            if key == len(self.__keys):
+                self.__keys = range(key + 1)
+            else:
+                self.__sparse()
+                self.__keys.append(key)
+        elif rows[key] is _DELETED:
+            rows[key] = row
+            self.__sparse()
+            insort(self.__keys, key)
+        else:
+            rows[key] = row
+
+    def __delitem__(self, key: int) -> None:
+        """Delete the row at position key."""
+        if key not in self:
+            raise KeyError(key)
+        self.__own()
+        self.version += 1
+        self.__rows[key] = _DELETED
+        self.__sparse()
+        del self.__keys[bisect_left(self.__keys, key)]
+
+    def __contains__(self, key: object) -> bool:
+        """Tell whether a row lives at position key."""
+        return (isinstance(key, int) and 0 <= key < len(self.__rows) and
+                self.__rows[key] is not _DELETED)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over the positions of live rows in order."""
+        return iter(self.__keys)
+
+    def __len__(self) -> int:
+        """Return the number of live rows."""
+        return len(self.__keys)
+
+    def append(self, row: List) -> int:
+        """Store row after every position used so far, deleted ones
+        included, and return its position.
+        """
+        key = len(self.__rows)
+        self[key] = row
+        return key
+
+    def end(self) -> int:
+        """Return the position after the last live row."""
+        return self.__keys[-1] + 1 if self.__keys else 0
+
+    def keys_from(self, index: int, count: int) -> List[int]:
+        """Return the positions of the first count live rows at or after
+        index, in O(log n + count).
+        """
+        start = bisect_left(self.__keys, index)
+        return list(self.__keys[start:start + count])
 
 
 class Server:
@@ -26,23 +162,62 @@ class Server:
             self.__dataset = dataset[1:]
         return self.__dataset
 
-    def indexed_dataset(self) -> Dict[int, List]:
+    def indexed_dataset(self) -> IndexedDataset:
         """Dataset indexed by sorting position, starting at 0
         """
         if self.__indexed_dataset is None:
-            dataset = self.dataset()
-            truncated_dataset = dataset[:1000]
-            self.__indexed_dataset = {
-                i: dataset[i]
-                for i in range(len(dataset))
-            }
+            self.__indexed_dataset = IndexedDataset(self.dataset())
         return self.__indexed_dataset
 
+    def dataset_version(self) -> int:
+        """Return the version of the indexed dataset.
+
+        Returns:
+        int: A number that changes with every insert, delete or update,
+        so pages can be cached per version.
+        """
+        return self.indexed_dataset().version
+
+    def insert(self, row: List) -> int:
+        """Add a row to the indexed dataset.
+
+        Parameters:
+        row (List): The row to add.
+
+        Returns:
+        int: The index of the row, after every index used so far, so no
+        cursor or next_index handed out before moves.
+        """
+        return self.indexed_dataset().append(row)
+
+    def delete(self, index: int) -> None:
+        """Delete the row at index from the indexed dataset.
+
+        Raises:
+        KeyError: If no row lives at index.
+        """
+        del self.indexed_dataset()[index]
+
+    def update(self, index: int, row: List) -> None:
+        """Replace the row at index in the indexed dataset.
+
+        Raises:
+        KeyError: If no row lives at index.
+        """
+        indexed_data = self.indexed_dataset()
+        if index not in indexed_data:
+            raise KeyError(index)
+        indexed_data[index] = row
+
     def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
         """Return a hypermedia pagination dictionary.
 
+        Rows deleted since the previous request are skipped, so the page
+        holds page_size live rows unless the dataset ends first.
+
         Parameters:
-        index (int): The starting index for pagination (default is None).
+        index (int): The starting index for pagination (default is None,
+                     the first row).
         page_size (int): The number of items to return (default is 10).
 
         Returns:
@@ -52,20 +227,56 @@ class Server:
         Raises:
         AssertionError: If index is out of range.
         """
-        assert index >= 0 and index < len(self.__indexed_dataset), \
+        indexed_data = self.indexed_dataset()
+        if index is None:
+            index = 0
+        assert isinstance(index, int) and 0 <= index < indexed_data.end(), \
             "Index out of range"
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
 
-        indexed_data = self.indexed_dataset()
+        keys = indexed_data.keys_from(index, page_size)
 
-        result = {
+        return {
             'index': index,
-            'data': [],
+            'data': [indexed_data[key] for key in keys],
             'page_size': page_size,
-            'next_index': index + page_size
+            'next_index': keys[-1] + 1
         }
 
-        for i in range(page_size):
-            if index + i in indexed_data:
-                result['data'].append(indexed_data[index + i])
+    def get_cursor_page(self, cursor: Optional[str] = None,
+                        page_size: int = 10) -> Dict:
+        """Return a page of live rows resumed from an opaque cursor.
+
+        The cursor remembers the position after the last row returned, so
+        rows deleted or added before it never shift the following pages.
 
-        return result
+        Parameters:
+        cursor (str): The next_cursor of the previous page (default is
+                      None, the first page).
+        page_size (int): The number of items to return (default is 10).
+
+        Returns:
+        Dict: A dictionary containing the cursor, page_size, data, and
+        next_cursor, None after the last page.
+
+        Raises:
+        AssertionError: If page_size is not a positive integer.
+        ValueError: If cursor is not a valid token.
+        """
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
+        index = 0 if cursor is None else decode_cursor(cursor)
+        indexed_data = self.indexed_dataset()
+        keys = indexed_data.keys_from(index, page_size)
+
+        next_cursor = None
+        if keys and keys[-1] + 1 < indexed_data.end():
+            next_cursor = encode_cursor(keys[-1] + 1)
+
+        return {
+            'cursor': cursor,
+            'data': [indexed_data[key] for key in keys],
+            'page_size': len(keys),
+            'next_cursor': next_cursor
+        }
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Columnar, typed in-memory representation of the baby names dataset.
+
+Instead of one list of six str objects per row, every column is stored
+once: integer columns (Year of Birth, Count, Rank) in compact `array`s and
+text columns (Gender, Ethnicity, Child's First Name) dictionary-encoded,
+each distinct value kept once and referenced by an integer code. Rows are
+rebuilt on demand, so `get_page` and `get_hyper` return exactly the same
+data as with the list-of-lists dataset.
+
+Usage:
+    Use this module's Server instead of the one of
+    2-hypermedia_pagination.py to opt in to the columnar backend.
+"""
+import csv
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Union
+
+hypermedia = __import__('2-hypermedia_pagination')
+
+
+class Column:
+    """A single column, integer-typed while every value is a canonical
+    signed 64-bit integer and dictionary-encoded text otherwise.
+
+    Attributes:
+    name (str): The column header.
+    values (array): Integers, or codes into `categories` for text.
+    categories (List[str]): Distinct text values, None for integers.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize an empty integer column."""
+        self.name = name
+        self.values = array('q')
+        self.categories = None
+        self.__codes = None
+
+    def append(self, value: str) -> None:
+        """Append a raw CSV value, switching the column to text the first
+        time a value does not round-trip as an integer or does not fit a
+        signed 64-bit integer.
+        """
+        if self.categories is None:
+            try:
+                number = int(value)
+            except ValueError:
+                number = None
+            if number is not None and str(number) == value:
+                try:
+                    self.values.append(number)
+                    return
+                except OverflowError:
+                    pass
+            self.__encode()
+        self.values.append(self.__code(value))
+
+    def __code(self, value: str) -> int:
+        """Return the code of a text value, adding it if it is new."""
+        code = self.__codes.get(value)
+        if code is None:
+            code = self.__codes[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def extend(self, other: "Column") -> None:
+        """Append the values of another column, re-coding its text values
+        into the categories of this one.
+        """
+        if other.categories is None:
+            if self.categories is None:
+                self.values.extend(other.values)
+            else:
+                for number in other.values:
+                    self.append(str(number))
+            return
+        if self.categories is None:
+            self.__encode()
+        codes = [self.__code(value) for value in other.categories]
+        self.values.extend(array('I', map(codes.__getitem__, other.values)))
+
+    def __encode(self) -> None:
+        """Convert the integers read so far into text codes."""
+        self.categories = []
+        self.__codes = {}
+        integers, self.values = self.values, array('I')
+        for number in integers:
+            self.append(str(number))
+
+    def typed(self, index: int) -> Union[int, str]:
+        """Return the value at index as an int or a str."""
+        if self.categories is None:
+            return self.values[index]
+        return self.categories[self.values[index]]
+
+    def __getitem__(self, index: int) -> str:
+        """Return the value at index as it appears in the CSV."""
+        if self.categories is None:
+            return str(self.values[index])
+        return self.categories[self.values[index]]
+
+
+class ColumnarDataset(Sequence):
+    """Read-only sequence of dataset rows backed by typed columns.
+
+    Indexing returns a row as a list of str and slicing a list of such
+    rows, like the list-of-lists dataset.
+
+    Attributes:
+    header (List[str]): Column names.
+    columns (List[Column]): One Column per header name.
+    """
+
+    def __init__(self, header: List[str], rows: Iterable[List[str]]) -> None:
+        """Build the columns from the rows of a CSV reader.
+
+        Blank lines, which csv.reader gives as empty rows, are skipped,
+        as csv.DictReader does.
+
+        Raises:
+        ValueError: If a row has more or fewer fields than the header.
+        """
+        self.header = list(header)
+        self.columns = [Column(name) for name in self.header]
+        self.__length = 0
+        for number, row in enumerate(rows, 1):
+            if not row:
+                continue
+            if len(row) != len(self.columns):
+                raise ValueError("data row {} has {} fields, expected {}"
+                                 .format(number, len(row), len(self.columns)))
+            for column, value in zip(self.columns, row):
+                column.append(value)
+            self.__length += 1
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self.__length
+
+    def extend(self, other: "ColumnarDataset") -> None:
+        """Append the rows of another dataset with the same header."""
+        for column, values in zip(self.columns, other.columns):
+            column.extend(values)
+        self.__length += len(other)
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union[List[str], List[List[str]]]:
+        """Return the row at index, or the list of rows of a slice."""
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("dataset index out of range")
+        return self.row(index)
+
+    def row(self, index: int) -> List[str]:
+        """Rebuild the row at a non-negative index as a list of str."""
+        return [column[index] for column in self.columns]
+
+    def typed_row(self, index: int) -> Dict[str, Union[int, str]]:
+        """Return the row at index with integer columns as int."""
+        return {column.name: column.typed(index) for column in self.columns}
+
+    def column(self, name: str) -> Column:
+        """Return the column named name."""
+        return self.columns[self.header.index(name)]
+
+
+class Server(hypermedia.Server):
+    """Server class to paginate the baby names dataset held in columns.
+    """
+
+    def load_dataset(self) -> ColumnarDataset:
+        """Read the dataset as a ColumnarDataset.
+
+        Returns:
+        ColumnarDataset: The dataset, parsed row by row from the CSV file
+        without ever holding it as a list of lists.
+        """
+        with open(self.DATA_FILE) as f:
+            reader = csv.reader(f)
+            return ColumnarDataset(next(reader), reader)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped access to the baby names dataset through a row-offset index.
+
+The CSV file is mapped with `mmap` instead of being read and parsed up
+front. A compact index of the byte offset where every row starts is built
+on the first run and saved next to the file (DATA_FILE + ".idx"), so later
+runs start almost instantly. A page is read by parsing only the bytes of
+its rows, which makes `get_page(page, page_size)` cost O(page_size) no
+matter how large the dataset is.
+
+Usage:
+    Use this module's Server instead of the one of
+    2-hypermedia_pagination.py to opt in to the memory-mapped backend.
+"""
+import csv
+import io
+import mmap
+import os
+import tempfile
+from array import array
+from collections.abc import Sequence
+from typing import List, Optional, Union
+
+hypermedia = __import__('2-hypermedia_pagination')
+
+
+class MmapDataset(Sequence):
+    """Read-only sequence of the data rows of a memory-mapped CSV file.
+
+    Attributes:
+    path (str): The CSV file.
+    offsets (array): Start offset of every data row, followed by the end
+                     offset of the last one.
+    """
+    INDEX_SUFFIX = ".idx"
+    INDEX_MAGIC = 0x32584449534f4652
+
+    def __init__(self, path: str) -> None:
+        """Map the file and load, or build and save, its row index."""
+        self.path = path
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            self.__source = (stat.st_size, stat.st_mtime_ns)
+            if stat.st_size:
+                self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self.__map = b""
+        self.offsets = self.__load_index()
+        if self.offsets is None:
+            self.offsets = self.__build_index()
+            self.__save_index()
+
+    def __build_index(self) -> array:
+        """Scan the mapped file once for row boundaries, skipping the
+        header and newlines inside quoted fields.
+        """
+        data = self.__map
+        offsets = array('Q')
+        start = position = 0
+        in_quotes = past_header = False
+        while position < len(data):
+            end = data.find(b"\n", position)
+            end = len(data) if end == -1 else end + 1
+            if (data.find(b'"', position, end) != -1 and
+                    data[position:end].count(b'"') % 2):
+                in_quotes = not in_quotes
+            position = end
+            if not in_quotes:
+                if past_header:
+                    offsets.append(start)
+                past_header = True
+                start = position
+        offsets.append(len(data))
+        return offsets
+
+    def __index_header(self, rows: int) -> array:
+        """Return the header identifying the file an index of rows data
+        rows belongs to.
+        """
+        return array('Q', [self.INDEX_MAGIC, *self.__source, rows])
+
+    def __load_index(self) -> Optional[array]:
+        """Return the saved index when it matches the file, else None.
+
+        An index is only used whole: its header must name the file and
+        its row count, and its offsets must end at the end of the file,
+        so a truncated or stale index is rebuilt rather than trusted.
+        """
+        try:
+            with open(self.path + self.INDEX_SUFFIX, "rb") as f:
+                saved = array('Q')
+                saved.frombytes(f.read())
+        except (OSError, ValueError):
+            return None
+        if len(saved) < 5:
+            return None
+        rows = saved[3]
+        header = self.__index_header(rows)
+        offsets = saved[len(header):]
+        if (saved[:len(header)] != header or len(offsets) != rows + 1 or
+                offsets[-1] != self.__source[0]):
+            return None
+        return offsets
+
+    def __save_index(self) -> None:
+        """Save the index next to the file, if the directory allows it.
+
+        The index is written to a temporary file renamed over the old
+        one, so a reader never sees a partly written index.
+        """
+        path = self.path + self.INDEX_SUFFIX
+        try:
+            fd, temp = tempfile.mkstemp(dir=os.path.dirname(path) or ".",
+                                        prefix=os.path.basename(path))
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.__index_header(len(self)).tobytes())
+                f.write(self.offsets.tobytes())
+            os.replace(temp, path)
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+
+    def __len__(self) -> int:
+        """Return the number of data rows."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union[List[str], List[List[str]]]:
+        """Return the row at index, or the list of rows of a slice, parsing
+        only the bytes they span.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            if start >= stop:
+                return []
+            return self.rows(start, stop)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("dataset index out of range")
+        return self.rows(index, index + 1)[0]
+
+    def rows(self, start: int, stop: int) -> List[List[str]]:
+        """Parse rows start (included) to stop (excluded)."""
+        chunk = self.__map[self.offsets[start]:self.offsets[stop]]
+        return list(csv.reader(io.StringIO(chunk.decode())))
+
+    def close(self) -> None:
+        """Unmap the file."""
+        if isinstance(self.__map, mmap.mmap):
+            self.__map.close()
+
+
+class Server(hypermedia.Server):
+    """Server class to paginate the baby names dataset straight from a
+    memory-mapped CSV file.
+    """
+
+    def load_dataset(self) -> MmapDataset:
+        """Map the dataset file and its row index.
+
+        Returns:
+        MmapDataset: The dataset. Rows are parsed only when a page
+        needs them.
+        """
+        return MmapDataset(self.DATA_FILE)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Filtered and sorted pagination of the baby names dataset through
+secondary indexes.
+
+Every column used in a filter gets an index mapping each of its values to
+the ascending array of the ids (positions) of the rows holding it, built
+once on first use. A multi-column filter intersects those arrays, starting
+from the smallest, and every sort column gets a precomputed row order.
+The matching ids of a (filters, sort) query are cached, so a page is
+answered in time proportional to its size and `total_pages` comes from
+the number of matching ids instead of a scan.
+
+Usage:
+    server.get_hyper(1, 10, filters={"Gender": "FEMALE",
+                                     "Year of Birth": 2016},
+                     sort="Rank")
+    A sort column prefixed with "-" sorts in descending order.
+"""
+import csv
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+hypermedia = __import__('2-hypermedia_pagination')
+index_range = hypermedia.index_range
+
+
+class Server(hypermedia.Server):
+    """Server class to paginate the baby names dataset filtered on column
+    values and sorted on a column.
+
+    Attributes:
+    MAX_CACHED_QUERIES (int): Number of (filters, sort) results kept.
+    """
+    MAX_CACHED_QUERIES = 128
+
+    def __init__(self):
+        """Initialize the Server with no index built yet."""
+        super().__init__()
+        self.__header = None
+        self.__indexes = {}
+        self.__orders = {}
+        self.__ranks = {}
+        self.__queries = OrderedDict()
+
+    def header(self) -> List[str]:
+        """Return the column names of the CSV file."""
+        if self.__header is None:
+            with open(self.DATA_FILE) as f:
+                self.__header = next(csv.reader(f))
+        return self.__header
+
+    def __position(self, column: str) -> int:
+        """Return the position of column in a row."""
+        header = self.header()
+        assert column in header, "unknown column: {}".format(column)
+        return header.index(column)
+
+    def column_index(self, column: str) -> Dict[str, array]:
+        """Return the secondary index of column.
+
+        Parameters:
+        column (str): A column name.
+
+        Returns:
+        Dict[str, array]: The ids of the rows holding each value of the
+                          column, in ascending order.
+        """
+        index = self.__indexes.get(column)
+        if index is None:
+            position = self.__position(column)
+            index = {}
+            for row_id, row in enumerate(self.dataset()):
+                ids = index.get(row[position])
+                if ids is None:
+                    ids = index[row[position]] = array('I')
+                ids.append(row_id)
+            self.__indexes[column] = index
+        return index
+
+    def sort_order(self, column: str) -> array:
+        """Return the ids of all rows sorted on column, numerically when
+        every value of the column is an integer. Ties keep dataset order.
+        """
+        order = self.__orders.get(column)
+        if order is None:
+            position = self.__position(column)
+            dataset = self.dataset()
+            values = [row[position] for row in dataset]
+            try:
+                keys = [int(value) for value in values]
+            except ValueError:
+                keys = values
+            order = array('I', sorted(range(len(keys)),
+                                      key=keys.__getitem__))
+            self.__orders[column] = order
+        return order
+
+    def __rank(self, column: str) -> array:
+        """Return the place of every row id in the sort order of column."""
+        ranks = self.__ranks.get(column)
+        if ranks is None:
+            order = self.sort_order(column)
+            ranks = array('I', bytes(4 * len(order)))
+            for place, row_id in enumerate(order):
+                ranks[row_id] = place
+            self.__ranks[column] = ranks
+        return ranks
+
+    @staticmethod
+    def __intersect(id_arrays: List[array]) -> array:
+        """Return the ids present in every ascending array, probing the
+        larger arrays with a binary search for each id of the smallest.
+        """
+        id_arrays = sorted(id_arrays, key=len)
+        matches = array('I')
+        for row_id in id_arrays[0]:
+            for ids in id_arrays[1:]:
+                i = bisect_left(ids, row_id)
+                if i == len(ids) or ids[i] != row_id:
+                    break
+            else:
+                matches.append(row_id)
+        return matches
+
+    @staticmethod
+    def filter_key(filters: Optional[Dict[str, Any]]) -> Tuple:
+        """Return filters as a hashable, order-independent key."""
+        return tuple(sorted((column, str(value))
+                            for column, value in (filters or {}).items()))
+
+    def count_items(self, query: Hashable = None) -> int:
+        """Count the rows matching the filters of a filter_key."""
+        return len(self.row_ids(dict(query or ())))
+
+    def row_ids(self, filters: Optional[Dict[str, Any]] = None,
+                sort: Optional[str] = None) -> Sequence[int]:
+        """Return the ids of the rows matching a query, in order.
+
+        Parameters:
+        filters (Dict[str, Any]): Column names and the value each row must
+                                  hold, compared as str (default is None).
+        sort (str): Column to sort on, descending when prefixed with "-"
+                    (default is None, dataset order).
+
+        Returns:
+        Sequence[int]: The matching row ids. The results of the last
+                       MAX_CACHED_QUERIES queries are cached.
+        """
+        query = (self.filter_key(filters), sort)
+        ids = self.__queries.get(query)
+        if ids is not None:
+            self.__queries.move_to_end(query)
+            return ids
+
+        descending = sort is not None and sort.startswith("-")
+        column = sort[1:] if descending else sort
+        if query[0]:
+            ids = self.__intersect([
+                self.column_index(name).get(value, array('I'))
+                for name, value in query[0]])
+            if column is not None:
+                ids = array('I', sorted(ids,
+                                        key=self.__rank(column).__getitem__))
+        elif column is not None:
+            ids = self.sort_order(column)
+        else:
+            ids = range(len(self.dataset()))
+        if descending:
+            ids = ids[::-1]
+
+        self.__queries[query] = ids
+        if len(self.__queries) > self.MAX_CACHED_QUERIES:
+            self.__queries.popitem(last=False)
+        return ids
+
+    def get_page(self, page: int = 1, page_size: int = 10,
+                 filters: Optional[Dict[str, Any]] = None,
+                 sort: Optional[str] = None) -> List[List[str]]:
+        """Return a page of the rows matching filters, sorted on sort.
+
+        Parameters:
+        page (int): The page number (1-indexed, default is 1).
+        page_size (int): The number of items per page (default is 10).
+        filters (Dict[str, Any]): Column values to match (default is None).
+        sort (str): Column to sort on, "-" prefixed for descending order
+                    (default is None).
+
+        Returns:
+        List[List[str]]: The rows of the requested page, an empty list if
+                         the page is out of range.
+
+        Raises:
+        AssertionError: If page or page_size is not a positive integer, or
+                        a column is unknown.
+        """
+        if not filters and sort is None:
+            return super().get_page(page, page_size)
+
+        assert (isinstance(page, int) and page > 0), \
+            "page must be a positive integer"
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
+
+        start_index, end_index = index_range(page, page_size)
+        dataset = self.dataset()
+        return [dataset[i]
+                for i in self.row_ids(filters, sort)[start_index:end_index]]
+
+    def get_hyper(self, page: int = 1, page_size: int = 10,
+                  filters: Optional[Dict[str, Any]] = None,
+                  sort: Optional[str] = None) -> Dict[str, Any]:
+        """Return a hypermedia pagination dictionary for a filtered and
+        sorted query.
+
+        Parameters:
+        page (int): The page number (1-indexed, default is 1).
+        page_size (int): The number of items per page (default is 10).
+        filters (Dict[str, Any]): Column values to match (default is None).
+        sort (str): Column to sort on, "-" prefixed for descending order
+                    (default is None).
+
+        Returns:
+        Dict[str, Any]: A dictionary containing pagination information
+                         including page size, current page, data,
+                         next page, previous page, and total pages.
+        """
+        data = self.get_page(page, page_size, filters, sort)
+        total_pages = self.page_metadata(
+            page_size, self.filter_key(filters) or None)['total_pages']
+
+        next_page = page + 1 if page < total_pages else None
+        prev_page = page - 1 if page > 1 else None
+
+        return {
+            'page_size': len(data),
+            'page': page,
+            'data': data,
+            'next_page': next_page,
+            'prev_page': prev_page,
+            'total_pages': total_pages
+        }
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Deduplicated, aggregated views of the baby names dataset.
+
+Popular_Baby_Names.csv repeats many rows verbatim, and spells the same
+name in different cases across years ("JAYDEN", "Jayden"). The Aggregates
+built here keep every distinct row once and, in the same pass, sum the
+`Count` of every group of each view (e.g. per name, per year and name),
+grouping names case-insensitively. Each view is ranked by total count
+once and then paged over like the dataset.
+
+When the CSV file changes the aggregates are refreshed: rows appended to
+the file are folded in incrementally, any other change rebuilds them.
+
+Usage:
+    server.get_hyper(1, 10, view="names") pages over the names of all
+    years, most popular first. The views are listed in Server.VIEWS.
+"""
+import csv
+import io
+import math
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+hypermedia = __import__('2-hypermedia_pagination')
+index_range = hypermedia.index_range
+
+NAME = "Child's First Name"
+COUNT = "Count"
+
+
+class Aggregates:
+    """Distinct rows of a CSV file and the count rollups of its views.
+
+    Attributes:
+    path (str): The CSV file.
+    views (Dict[str, Tuple[str, ...]]): The grouping columns of each view.
+    header (List[str]): Column names of the CSV file.
+    rows (List[List[str]]): Distinct rows, in the order first seen.
+    duplicates (int): Number of repeated rows dropped.
+    """
+    TAIL = 64
+
+    def __init__(self, path: str, views: Dict[str, Tuple[str, ...]]) -> None:
+        """Aggregate the CSV file at path into views."""
+        self.path = path
+        self.views = views
+        self.__reset()
+        self.refresh()
+
+    def __reset(self) -> None:
+        """Forget everything read from the file."""
+        self.header = None
+        self.rows = []
+        self.duplicates = 0
+        self.__seen = set()
+        self.__spellings = {}
+        self.__totals = {name: {} for name in self.views}
+        self.__ranked = {}
+        self.__stamp = None
+        self.__offset = 0
+        self.__tail = b""
+
+    def refresh(self) -> bool:
+        """Fold the rows appended to the file since the last refresh into
+        the aggregates, or rebuild them if the file was otherwise changed.
+
+        Returns:
+        bool: True if the file changed.
+        """
+        stat = os.stat(self.path)
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        if stamp == self.__stamp:
+            return False
+        with open(self.path, "rb") as f:
+            appended = False
+            if self.__offset and stat.st_size >= self.__offset:
+                f.seek(self.__offset - len(self.__tail))
+                appended = f.read(len(self.__tail)) == self.__tail
+            if not appended:
+                self.__reset()
+                f.seek(0)
+            data = f.read()
+        # appended rows may still be being written: hold back a partial
+        # last line, which a full rebuild reads like any other row
+        end = data.rfind(b"\n") + 1 if appended else len(data)
+        reader = csv.reader(io.StringIO(data[:end].decode()))
+        if self.header is None:
+            self.header = next(reader, None)
+            if self.header is None:
+                return True
+            self.__columns()
+        for row in reader:
+            self.__add(row)
+        if appended or data[end - 1:end] == b"\n":
+            self.__tail = (self.__tail + data[:end])[-self.TAIL:]
+            self.__offset += end
+        else:
+            # rows appended later could extend the unterminated last line
+            self.__offset = 0
+        self.__stamp = stamp
+        self.__ranked.clear()
+        return True
+
+    def __columns(self) -> None:
+        """Resolve the column positions used by the views."""
+        self.__count = self.header.index(COUNT)
+        self.__name = self.header.index(NAME)
+        self.__groups = {name: [self.header.index(column)
+                                for column in columns]
+                         for name, columns in self.views.items()}
+
+    def __add(self, row: List[str]) -> None:
+        """Add a row to the distinct rows and the totals of every view."""
+        key = tuple(row)
+        if key in self.__seen:
+            self.duplicates += 1
+            return
+        self.__seen.add(key)
+        self.rows.append(row)
+
+        spelling = row[self.__name]
+        folded = spelling.casefold()
+        known = self.__spellings.get(folded)
+        if known is None or (known.isupper() and not spelling.isupper()):
+            self.__spellings[folded] = spelling
+
+        count = int(row[self.__count])
+        for name, positions in self.__groups.items():
+            group = tuple(folded if i == self.__name else row[i]
+                          for i in positions)
+            totals = self.__totals[name]
+            totals[group] = totals.get(group, 0) + count
+
+    def view(self, name: str) -> List[List[str]]:
+        """Return the rows of a view, most popular first.
+
+        Parameters:
+        name (str): A key of views.
+
+        Returns:
+        List[List[str]]: One row per group: the grouping columns, the
+                         summed Count and the dense Rank by count, all as
+                         str like the dataset rows.
+        """
+        ranked = self.__ranked.get(name)
+        if ranked is None:
+            positions = self.__groups[name]
+            groups = sorted(self.__totals[name].items(),
+                            key=lambda item: (-item[1], item[0]))
+            ranked = []
+            rank = 0
+            previous = None
+            for group, count in groups:
+                if count != previous:
+                    rank += 1
+                    previous = count
+                values = [self.__spellings[value] if i == self.__name
+                          else value for i, value in zip(positions, group)]
+                ranked.append(values + [str(count), str(rank)])
+            self.__ranked[name] = ranked
+        return ranked
+
+
+class Server(hypermedia.Server):
+    """Server class to paginate aggregated views of the baby names dataset.
+
+    Attributes:
+    VIEWS (Dict[str, Tuple[str, ...]]): The grouping columns of each view.
+    """
+    VIEWS = {
+        "names": (NAME,),
+        "names_by_year": ("Year of Birth", NAME),
+        "names_by_gender": ("Gender", NAME),
+        "names_by_year_gender": ("Year of Birth", "Gender", NAME),
+    }
+
+    def __init__(self):
+        """Initialize the Server with no aggregate built yet."""
+        super().__init__()
+        self.__aggregates = None
+
+    def aggregates(self) -> Aggregates:
+        """Return the aggregates, refreshed if the CSV file changed."""
+        if self.__aggregates is None:
+            self.__aggregates = Aggregates(self.DATA_FILE, self.VIEWS)
+        else:
+            self.__aggregates.refresh()
+        return self.__aggregates
+
+    def view(self, view: Optional[str] = None) -> List[List[str]]:
+        """Return the rows of a view, or the dataset if view is None.
+
+        Raises:
+        AssertionError: If view is not a key of VIEWS or "dedup", which
+                        holds the distinct rows of the dataset.
+        """
+        if view is None:
+            return self.dataset()
+        assert view == "dedup" or view in self.VIEWS, \
+            "unknown view: {}".format(view)
+        aggregates = self.aggregates()
+        if view == "dedup":
+            return aggregates.rows
+        return aggregates.view(view)
+
+    def get_page(self, page: int = 1, page_size: int = 10,
+                 view: Optional[str] = None) -> List[List[str]]:
+        """Return a page of a view.
+
+        Parameters:
+        page (int): The page number (1-indexed, default is 1).
+        page_size (int): The number of items per page (default is 10).
+        view (str): The view to page over (default is None, the dataset).
+
+        Returns:
+        List[List[str]]: The rows of the requested page, an empty list if
+                         the page is out of range.
+
+        Raises:
+        AssertionError: If page or page_size is not a positive integer, or
+                        view is unknown.
+        """
+        if view is None:
+            return super().get_page(page, page_size)
+
+        assert (isinstance(page, int) and page > 0), \
+            "page must be a positive integer"
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
+
+        start_index, end_index = index_range(page, page_size)
+        return self.view(view)[start_index:end_index]
+
+    def get_hyper(self, page: int = 1, page_size: int = 10,
+                  view: Optional[str] = None) -> Dict[str, Any]:
+        """Return a hypermedia pagination dictionary for a view.
+
+        Parameters:
+        page (int): The page number (1-indexed, default is 1).
+        page_size (int): The number of items per page (default is 10).
+        view (str): The view to page over (default is None, the dataset).
+
+        Returns:
+        Dict[str, Any]: A dictionary containing pagination information
+                         including page size, current page, data,
+                         next page, previous page, and total pages, data
+                         and totals read from the same refresh of the
+                         view.
+
+        Raises:
+        AssertionError: If page or page_size is not a positive integer, or
+                        view is unknown.
+        """
+        assert (isinstance(page, int) and page > 0), \
+            "page must be a positive integer"
+        assert (isinstance(page_size, int) and page_size > 0), \
+            "page_size must be a positive integer"
+
+        rows = self.view(view)
+        start_index, end_index = index_range(page, page_size)
+        data = rows[start_index:end_index]
+        total_pages = math.ceil(len(rows) / page_size)
+
+        next_page = page + 1 if page < total_pages else None
+        prev_page = page - 1 if page > 1 else None
+
+        return {
+            'page_size': len(data),
+            'page': page,
+            'data': data,
+            'next_page': next_page,
+            'prev_page': prev_page,
+            'total_pages': total_pages
+        }
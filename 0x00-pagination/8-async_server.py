@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Asynchronous pagination of the baby names dataset.
+
+The synchronous servers read and parse the CSV file inside their first
+`dataset()` call, which under asyncio stalls the event loop for the whole
+parse. AsyncServer loads the dataset, and the index of
+3-hypermedia_del_pagination.py over the same rows, in a thread pool. All
+the requests arriving before the load is over await one shared future,
+so the file is parsed once however many first hits there are, and the
+event loop keeps serving other tasks meanwhile.
+
+Usage:
+    server = AsyncServer()
+    await server.get_hyper(1, 10)
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional
+
+hypermedia = __import__('2-hypermedia_pagination')
+del_pagination = __import__('3-hypermedia_del_pagination')
+
+
+class IndexServer(del_pagination.Server):
+    """Deletion-resilient server indexing the rows of another server, so
+    both share a single parse of the dataset.
+
+    Attributes:
+    source (hypermedia.Server): The server whose dataset is indexed.
+    """
+
+    def __init__(self, source: hypermedia.Server) -> None:
+        """Initialize the IndexServer over the dataset of source."""
+        super().__init__()
+        self.source = source
+
+    def dataset(self) -> List[List]:
+        """Return the dataset of the source server."""
+        return self.source.dataset()
+
+
+class AsyncServer:
+    """Server class to paginate the baby names dataset from coroutines.
+
+    Attributes:
+    server (hypermedia.Server): The synchronous server answering pages.
+    indexed (IndexServer): The deletion-resilient server over its rows.
+    executor (Executor): Where the dataset is loaded, None for the default
+                         thread pool of the event loop.
+    """
+
+    def __init__(self, server: Optional[hypermedia.Server] = None,
+                 executor: Optional[Executor] = None) -> None:
+        """Initialize the AsyncServer around a synchronous server.
+
+        Parameters:
+        server (hypermedia.Server): The server to serve pages from, a new
+                                    2-hypermedia_pagination Server if None.
+        executor (Executor): Where to load the dataset (default is None,
+                             the default executor of the loop).
+        """
+        self.server = hypermedia.Server() if server is None else server
+        self.indexed = IndexServer(self.server)
+        self.executor = executor
+        self.__loading = None
+
+    def __load(self) -> None:
+        """Load the dataset and build its index, off the event loop."""
+        self.server.dataset()
+        self.indexed.indexed_dataset()
+
+    def __loaded(self, future: asyncio.Future) -> None:
+        """Forget a failed load so that the next request retries it."""
+        if future.cancelled() or future.exception() is not None:
+            self.__loading = None
+
+    async def load(self) -> None:
+        """Load the dataset in the executor, once.
+
+        Concurrent callers share the same in-flight load, and one of them
+        being cancelled does not cancel it for the others.
+
+        Raises:
+        Exception: Whatever loading the dataset raised.
+        """
+        loading = self.__loading
+        if loading is None:
+            loop = asyncio.get_running_loop()
+            loading = loop.run_in_executor(self.executor, self.__load)
+            loading.add_done_callback(self.__loaded)
+            self.__loading = loading
+        elif loading.done() and loading.exception() is None:
+            return
+        await asyncio.shield(loading)
+
+    async def get_page(self, page: int = 1,
+                       page_size: int = 10) -> List[List[str]]:
+        """Return a page of the dataset once it is loaded.
+
+        Parameters:
+        page (int): The page number (1-indexed, default is 1).
+        page_size (int): The number of items per page (default is 10).
+
+        Returns:
+        List[List[str]]: The rows of the requested page.
+        """
+        await self.load()
+        return self.server.get_page(page, page_size)
+
+    async def get_hyper(self, page: int = 1,
+                        page_size: int = 10) -> Dict[str, Any]:
+        """Return a hypermedia pagination dictionary once the dataset is
+        loaded.
+
+        Parameters:
+        page (int): The page number (1-indexed, default is 1).
+        page_size (int): The number of items per page (default is 10).
+
+        Returns:
+        Dict[str, Any]: The dictionary of Server.get_hyper.
+        """
+        await self.load()
+        return self.server.get_hyper(page, page_size)
+
+    async def get_hyper_index(self, index: int = None,
+                              page_size: int = 10) -> Dict:
+        """Return a deletion-resilient pagination dictionary once the
+        dataset is indexed.
+
+        Parameters:
+        index (int): The starting index for pagination (default is None).
+        page_size (int): The number of items to return (default is 10).
+
+        Returns:
+        Dict: The dictionary of Server.get_hyper_index.
+        """
+        await self.load()
+        return self.indexed.get_hyper_index(index, page_size)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Parallel loading of large CSV files.
+
+The file is split into one byte range per worker, each range ending on a
+row boundary: a newline that is not inside a quoted field. The ranges are
+parsed with `csv.reader` in a process pool and the results are gathered
+in file order, into a list of rows or into a ColumnarDataset of
+4-columnar_dataset.py. Files smaller than MIN_CHUNK per worker are parsed
+in the calling process.
+
+Sending rows back from a worker costs about as much as parsing them, so
+the list of rows loads little faster than with a single reader. Columnar
+chunks travel as compact arrays, so the columnar load scales with the
+number of cores.
+
+Usage:
+    rows = list(iter_parallel_rows("Popular_Baby_Names.csv", workers=8))
+    dataset = load_columnar("Popular_Baby_Names.csv", workers=8)
+    or use this module's Server, whose load_dataset() loads in parallel.
+"""
+import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Any, Callable, Iterator, List, Optional, Sequence,
+                    Tuple, Union)
+
+hypermedia = __import__('2-hypermedia_pagination')
+columnar = __import__('4-columnar_dataset')
+
+MIN_CHUNK = 1 << 20
+SCAN_BLOCK = 1 << 20
+
+
+def quote_parity(data: Sequence, start: int, end: int) -> int:
+    """Return the parity of the number of double quotes in data[start:end],
+    counted block by block so no large copy is made.
+    """
+    parity = 0
+    for block in range(start, end, SCAN_BLOCK):
+        parity ^= data[block:min(block + SCAN_BLOCK, end)].count(b'"') & 1
+    return parity
+
+
+def row_end(data: Sequence, position: int, in_quotes: bool) -> int:
+    """Return the offset after the row going on at position, that is after
+    the first newline from there on that is outside quoted fields.
+    """
+    while position < len(data):
+        newline = data.find(b"\n", position)
+        end = len(data) if newline == -1 else newline + 1
+        in_quotes ^= bool(quote_parity(data, position, end))
+        position = end
+        if not in_quotes:
+            break
+    return position
+
+
+def chunk_bounds(path: str, chunks: int) -> List[Tuple[int, int]]:
+    """Split the data rows of a CSV file into byte ranges.
+
+    Parameters:
+    path (str): The CSV file.
+    chunks (int): The number of ranges wanted.
+
+    Returns:
+    List[Tuple[int, int]]: Up to chunks (start, end) offsets covering every
+                           row but the header, each ending on a row
+                           boundary.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = position = row_end(data, 0, False)
+            bounds = []
+            for i in range(1, chunks):
+                target = start + (size - start) * i // chunks
+                if target <= position:
+                    continue
+                in_quotes = bool(quote_parity(data, position, target))
+                if in_quotes or data[target - 1:target] != b"\n":
+                    end = row_end(data, target, in_quotes)
+                else:
+                    end = target
+                bounds.append((position, end))
+                position = end
+    if position < size:
+        bounds.append((position, size))
+    return bounds
+
+
+def parse_chunk(path: str, start: int, end: int) -> List[List[str]]:
+    """Parse the rows between two offsets of a CSV file."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode()
+    return list(csv.reader(io.StringIO(text)))
+
+
+def parse_columnar_chunk(path: str, start: int,
+                         end: int) -> columnar.ColumnarDataset:
+    """Parse the rows between two offsets of a CSV file into columns."""
+    return columnar.ColumnarDataset(read_header(path),
+                                    parse_chunk(path, start, end))
+
+
+def read_header(path: str) -> List[str]:
+    """Return the column names of a CSV file."""
+    with open(path) as f:
+        return next(csv.reader(f), [])
+
+
+def map_chunks(path: str, parse: Callable[[str, int, int], Any],
+               workers: Optional[int] = None) -> Iterator[Any]:
+    """Parse the data rows of a CSV file chunk by chunk in a process pool.
+
+    Parameters:
+    path (str): The CSV file.
+    parse (Callable): Module-level function parsing (path, start, end).
+    workers (int): The number of processes (default is None, the number
+                   of CPUs).
+
+    Returns:
+    Iterator[Any]: The result of parse for every chunk, in file order.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(workers, os.path.getsize(path) // MIN_CHUNK))
+    bounds = chunk_bounds(path, chunks)
+    if len(bounds) < 2:
+        for start, end in bounds:
+            yield parse(path, start, end)
+        return
+    with ProcessPoolExecutor(min(workers, len(bounds))) as pool:
+        starts, ends = zip(*bounds)
+        yield from pool.map(parse, [path] * len(bounds), starts, ends)
+
+
+def iter_parallel_rows(path: str,
+                       workers: Optional[int] = None) -> Iterator[List[str]]:
+    """Parse the data rows of a CSV file in a process pool.
+
+    Parameters:
+    path (str): The CSV file.
+    workers (int): The number of processes (default is None, the number
+                   of CPUs).
+
+    Returns:
+    Iterator[List[str]]: The rows in file order. The rows of a chunk are
+                         yielded as soon as it and every chunk before it
+                         are parsed.
+    """
+    for rows in map_chunks(path, parse_chunk, workers):
+        yield from rows
+
+
+def load_columnar(path: str,
+                  workers: Optional[int] = None) -> columnar.ColumnarDataset:
+    """Parse the data rows of a CSV file into a ColumnarDataset, each
+    worker building the columns of its chunk.
+
+    Parameters:
+    path (str): The CSV file.
+    workers (int): The number of processes (default is None, the number
+                   of CPUs).
+
+    Returns:
+    ColumnarDataset: The dataset, rows in file order.
+    """
+    dataset = columnar.ColumnarDataset(read_header(path), ())
+    for part in map_chunks(path, parse_columnar_chunk, workers):
+        dataset.extend(part)
+    return dataset
+
+
+class Server(hypermedia.Server):
+    """Server class to paginate a large baby names dataset loaded by
+    several processes.
+
+    Attributes:
+    WORKERS (int): The number of loading processes, None for the number
+                   of CPUs.
+    COLUMNAR (bool): Build a ColumnarDataset instead of a list of rows.
+    """
+    WORKERS = None
+    COLUMNAR = False
+
+    def load_dataset(self) -> Union[List[List[str]],
+                                    columnar.ColumnarDataset]:
+        """Load the dataset in parallel.
+
+        Returns:
+        Union[List[List[str]], ColumnarDataset]: The dataset, as typed
+        columns when COLUMNAR is set.
+        """
+        if self.COLUMNAR:
+            return load_columnar(self.DATA_FILE, self.WORKERS)
+        return list(iter_parallel_rows(self.DATA_FILE, self.WORKERS))
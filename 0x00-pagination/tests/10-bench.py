@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Replay requests for random pages of a hot range of rows, with page sizes
+chosen at random by the clients, against the memory-mapped backend.
+Compare a memo of whole pages keyed by (page, page_size) with the block
+cache, both LRU caches holding about the same number of rows.
+
+Usage: ./10-bench.py [requests]
+"""
+import os
+import random
+import sys
+import time
+
+caching = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "..", "..", "0x01-caching")
+sys.path[:0] = [caching, os.path.join(caching, "tests")]
+
+LRUCache = __import__('3-lru_cache').LRUCache
+block_cache = __import__('10-block_cache')
+mmap_dataset = __import__('5-mmap_dataset')
+PAGE_SIZES = (10, 20, 25, 40, 50, 100)
+HOT_ROWS = 4000
+CACHED_ROWS = 8192
+
+
+def page_memo(source, requests):
+    """Serve requests from a (page, page_size) memo, return its stats."""
+    cache = LRUCache(max_items=CACHED_ROWS // 40, listener=None)
+    for page, page_size in requests:
+        if cache.get((page, page_size)) is None:
+            cache.put((page, page_size), source.get_page(page, page_size))
+    return cache.stats()
+
+
+def blocks(source, requests):
+    """Serve requests from the block cache, return its stats."""
+    cache = LRUCache(max_items=CACHED_ROWS // block_cache.Server.BLOCK_SIZE,
+                     listener=None)
+    server = block_cache.Server(cache, source)
+    for page, page_size in requests:
+        server.get_page(page, page_size)
+    return cache.stats()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = random.Random(0)
+    requests = []
+    for _ in range(count):
+        page_size = rng.choice(PAGE_SIZES)
+        requests.append((rng.randrange(HOT_ROWS // page_size) + 1,
+                         page_size))
+    source = mmap_dataset.Server()
+    source.dataset()
+    print("{:>10} {:>10} {:>10}".format("cache", "hit ratio", "time s"))
+    for name, serve in (("page memo", page_memo), ("blocks", blocks)):
+        start = time.perf_counter()
+        stats = serve(source, requests)
+        print("{:>10} {:>10.3f} {:>10.2f}".format(
+            name, stats["hits"] / (stats["hits"] + stats["misses"]),
+            time.perf_counter() - start))
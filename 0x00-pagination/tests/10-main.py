@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import sys
+
+caching = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "..", "..", "0x01-caching")
+sys.path[:0] = [caching, os.path.join(caching, "tests")]
+
+LRUCache = __import__('3-lru_cache').LRUCache
+block_cache = __import__('10-block_cache')
+mmap_dataset = __import__('5-mmap_dataset')
+Server = __import__('2-hypermedia_pagination').Server
+
+cache = LRUCache(max_items=8, listener=None)
+server = block_cache.Server(cache)
+
+print(server.get_hyper(1, 2))
+print("---")
+print(server.get_hyper(3000, 100))
+print("---")
+expected = Server()
+for page_size in (1, 7, 64, 100, 250):
+    for page in (1, 2, 3, 50, 77):
+        assert server.get_page(page, page_size) == \
+            expected.get_page(page, page_size), (page, page_size)
+print(server.get_page(1942, 10) == expected.get_page(1942, 10))
+print(sorted(cache.cache_data)[:3], len(cache.cache_data))
+print(cache.stats()["hits"] > 0)
+print("---")
+
+# overlapping pages of any size hit the same blocks
+cache = LRUCache(max_items=64, listener=None)
+server = block_cache.Server(cache, source=mmap_dataset.Server())
+for page_size in (10, 25, 32, 50):
+    for page in range(1, 4096 // page_size + 1):
+        server.get_page(page, page_size)
+stats = cache.stats()
+print(stats["hits"], stats["misses"], len(cache.cache_data))
+print(server.get_page(2, 3) == expected.get_page(2, 3))
+print("---")
+
+
+class ReloadingSource:
+    """Source whose dataset is reloaded while dataset() runs."""
+
+    def __init__(self):
+        """Start at version 1 with the old rows."""
+        self.version = 1
+        self.rows = [["old"]]
+
+    def dataset_version(self):
+        """Return the version of the current rows."""
+        return self.version
+
+    def dataset(self):
+        """Return the current rows, swapping in new ones meanwhile."""
+        rows = self.rows
+        if self.version == 1:
+            self.version, self.rows = 2, [["new"]]
+        return rows
+
+
+cache = LRUCache(max_items=8, listener=None)
+server = block_cache.Server(cache, source=ReloadingSource())
+print(server.block(0), sorted(cache.cache_data))
+print(server.block(0), sorted(cache.cache_data), server.block(0))
+
+# the default cache keeps the blocks of the current version only
+source = ReloadingSource()
+server = block_cache.Server(source=source)
+server.block(0)
+server.block(0)
+source.version, source.rows = 3, [["newer"]]
+print(server.block(0), sorted(server.cache.cache_data))
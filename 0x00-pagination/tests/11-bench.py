@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Measure the latency clients see when walking pages with a think time
+between requests, on a backend whose pages cost IO_DELAY seconds, with
+and without the Prefetcher. Sequential walks follow next_page; random
+walks jump around, where the read-ahead must stay out of the way.
+
+Usage: ./11-bench.py [pages]
+"""
+import random
+import sys
+import time
+
+Prefetcher = __import__('11-prefetch').Prefetcher
+Server = __import__('2-hypermedia_pagination').Server
+IO_DELAY = 0.002
+THINK = 0.003
+
+
+class SlowServer(Server):
+    """Server whose pages cost IO_DELAY seconds of I/O."""
+
+    def get_page(self, page=1, page_size=10):
+        """Return a page after a delay."""
+        time.sleep(IO_DELAY)
+        return super().get_page(page, page_size)
+
+
+def walk(server, pages):
+    """Request pages with a think time, return the mean latency in ms."""
+    total = 0
+    for page in pages:
+        start = time.perf_counter()
+        server.get_hyper(page, 50)
+        total += time.perf_counter() - start
+        time.sleep(THINK)
+    return total / len(pages) * 1e3
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(0)
+    walks = (("sequential", list(range(1, count + 1))),
+             ("random", [rng.randrange(1, 380) for _ in range(count)]))
+    base = SlowServer()
+    base.dataset()
+    print("{:>12} {:>10} {:>12} {:>6}".format("walk", "plain ms",
+                                              "prefetch ms", "hits"))
+    for name, pages in walks:
+        prefetcher = Prefetcher(base)
+        plain = walk(base, pages)
+        prefetched = walk(prefetcher, pages)
+        prefetcher.close()
+        print("{:>12} {:>10.2f} {:>12.2f} {:>6}".format(
+            name, plain, prefetched, prefetcher.hits))
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import time
+
+Prefetcher = __import__('11-prefetch').Prefetcher
+Server = __import__('2-hypermedia_pagination').Server
+DelServer = __import__('3-hypermedia_del_pagination').Server
+
+
+class SlowServer(Server):
+    """Server whose pages cost 10 ms of I/O."""
+
+    def get_page(self, page=1, page_size=10):
+        """Return a page after a delay."""
+        time.sleep(0.01)
+        return super().get_page(page, page_size)
+
+
+server = Prefetcher(SlowServer(), max_depth=4, budget=200)
+res = server.get_hyper(1, 10)
+print(res == Server().get_hyper(1, 10))
+for page in range(2, 12):
+    time.sleep(0.05)
+    res = server.get_hyper(page, 10)
+print(res['page'], res['data'][0][3], server.hits, server.misses,
+      server.depth)
+time.sleep(0.1)
+print(server.pending())
+
+# random access cancels the read-ahead
+server.get_hyper(500, 10)
+print(server.depth, server.pending())
+server.get_hyper(501, 10)
+time.sleep(0.05)
+print(server.depth, server.pending())
+server.close()
+print("---")
+
+# next_index links survive deletes; a mutation drops pages read ahead
+del_server = DelServer()
+server = Prefetcher(del_server, max_depth=2)
+res = server.get_hyper_index(0, 3)
+time.sleep(0.05)
+del_server.delete(4)
+res = server.get_hyper_index(res['next_index'], 3)
+print(res['index'], res['next_index'], [row[3] for row in res['data']])
+time.sleep(0.05)
+res = server.get_hyper_index(res['next_index'], 3)
+print(res == del_server.get_hyper_index(res['index'], 3), server.hits,
+      server.misses)
+server.close()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Serve large pages as list slices and as PageViews, and compare the time
+and the memory allocated per get_hyper call, with and without reading the
+rows of the page once like a response writer would.
+
+Usage: ./12-bench.py [page_size]
+"""
+import sys
+import time
+import tracemalloc
+
+hypermedia = __import__('2-hypermedia_pagination')
+page_view = __import__('12-page_view')
+ROUNDS = 200
+
+
+def measure(server, page_size, consume):
+    """Return the mean seconds and peak bytes of a get_hyper call."""
+    pages = server.page_metadata(page_size)['total_pages']
+    start = time.perf_counter()
+    for i in range(ROUNDS):
+        data = server.get_hyper(i % pages + 1, page_size)['data']
+        if consume:
+            for _ in data:
+                pass
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    tracemalloc.start()
+    server.get_hyper(1, page_size)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    page_size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    print("{:>8} {:>8} {:>10} {:>10}".format("server", "read", "us/call",
+                                             "peak B"))
+    for name, server in (("list", hypermedia.Server()),
+                         ("view", page_view.Server())):
+        server.dataset()
+        for consume in (False, True):
+            elapsed, peak = measure(server, page_size, consume)
+            print("{:>8} {:>8} {:>10.1f} {:>10}".format(
+                name, "yes" if consume else "no", elapsed * 1e6, peak))
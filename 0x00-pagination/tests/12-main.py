@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import json
+
+page_view = __import__('12-page_view')
+mmap_dataset = __import__('5-mmap_dataset')
+Server = __import__('2-hypermedia_pagination').Server
+PageView = page_view.PageView
+
+server = page_view.Server()
+expected = Server()
+
+print(server.get_hyper(1, 2))
+print("---")
+print(server.get_hyper(3000, 100))
+print("---")
+page = server.get_page(2, 1000)
+print(type(page).__name__, len(page), page.start, page.stop)
+print(page.source is server.dataset())
+print(page == expected.get_page(2, 1000), expected.get_page(2, 1000) == page)
+print(page[0], page[-1] == page[999])
+print(page[10:13] == page.source[1010:1013], page[10:13].start)
+print(page[::-250] == expected.get_page(2, 1000)[::-250])
+print(len(server.get_page(1942, 10)), server.get_page(1942, 10)[-1][3])
+print(list(server.get_page(5000, 10)), server.get_page(5000, 10) == [])
+print("---")
+
+# views of another backend read only the rows they are asked for
+server = page_view.Server(source=mmap_dataset.Server())
+page = server.get_page(19, 1000)
+print(type(page.source).__name__, len(page))
+print(page[:3] == expected.get_page(19, 1000)[:3])
+print(list(page) == expected.get_page(19, 1000))
+
+view = PageView([1, 2, 3, 4, 5], 1)
+print(view, view[1:], list(reversed(view)), 4 in view, view.index(4))
+try:
+    view[10]
+except IndexError as e:
+    print("IndexError:", e)
+print(view + [6], [0] + view, view + view[:1])
+print("---")
+
+# a view is not a list: JSON encoders need default=list
+hyper = page_view.Server().get_hyper(1, 2)
+try:
+    json.dumps(hyper)
+except TypeError as e:
+    print("TypeError:", e)
+print(json.loads(json.dumps(hyper, default=list)) == Server().get_hyper(1, 2))
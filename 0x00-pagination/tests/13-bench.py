@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Replay requests for a hot set of pages and compare json.dumps of
+get_hyper on every request with the payloads of PayloadServer, for each
+encoding and compression. Print the time per request and the body size.
+
+Usage: ./13-bench.py [requests] [page_size]
+"""
+import io
+import json
+import random
+import sys
+import time
+
+hypermedia = __import__('2-hypermedia_pagination')
+serialized = __import__('13-serialized_pages')
+HOT_PAGES = 50
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    rng = random.Random(0)
+    pages = [rng.randrange(HOT_PAGES) + 1 for _ in range(count)]
+    server = hypermedia.Server()
+    server.dataset()
+    out = io.BytesIO()
+
+    start = time.perf_counter()
+    for page in pages:
+        out.seek(0)
+        out.write(json.dumps(server.get_hyper(page, page_size)).encode())
+    elapsed = time.perf_counter() - start
+    size = len(json.dumps(server.get_hyper(1, page_size)).encode())
+    print("{:>18} {:>10} {:>10}".format("body", "us/req", "bytes"))
+    print("{:>18} {:>10.1f} {:>10}".format("json.dumps", elapsed / count
+                                           * 1e6, size))
+
+    payloads = serialized.PayloadServer(server)
+    for encoding in serialized.ENCODINGS:
+        for compression in serialized.COMPRESSIONS:
+            start = time.perf_counter()
+            for page in pages:
+                payload = payloads.hyper_payload(page, page_size, encoding,
+                                                 compression)
+                out.seek(0)
+                out.write(payload['body'])
+            elapsed = time.perf_counter() - start
+            size = len(payloads.hyper_payload(1, page_size, encoding,
+                                              compression)['body'])
+            print("{:>18} {:>10.1f} {:>10}".format(
+                encoding + "/" + compression, elapsed / count * 1e6, size))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import gzip
+import json
+import os
+import sys
+import zlib
+
+caching = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "..", "..", "0x01-caching")
+sys.path[:0] = [caching, os.path.join(caching, "tests")]
+
+LRUCache = __import__('3-lru_cache').LRUCache
+serialized = __import__('13-serialized_pages')
+Server = __import__('2-hypermedia_pagination').Server
+IndexServer = __import__('3-hypermedia_del_pagination').Server
+page_view = __import__('12-page_view')
+
+server = serialized.PayloadServer(Server())
+payload = server.hyper_payload(1, 2)
+print(payload['body'].decode())
+print(payload['content_type'], payload['content_encoding'],
+      payload['version'], payload['etag'][:1], len(payload['etag']))
+print(server.hyper_payload(1, 2) is payload)
+print(json.loads(payload['body']) == Server().get_hyper(1, 2))
+print("---")
+
+expected = Server().get_hyper(3, 100)
+binary = server.hyper_payload(3, 100, "binary")
+text = server.hyper_payload(3, 100)
+print(binary['content_type'],
+      serialized.decode_binary(binary['body']) == expected,
+      len(binary['body']) < len(text['body']))
+compressed = server.hyper_payload(3, 100, "json", "gzip")
+print(gzip.decompress(compressed['body']) ==
+      server.hyper_payload(3, 100)['body'])
+deflated = server.hyper_payload(3, 100, "binary", "deflate")
+print(serialized.decode_binary(zlib.decompress(deflated['body'])) ==
+      expected)
+print(len({server.hyper_payload(3, 100, encoding, compression)['etag']
+           for encoding in serialized.ENCODINGS
+           for compression in serialized.COMPRESSIONS}))
+print(serialized.decode_binary(serialized.encode_binary(
+    [None, True, False, 0, -1, 300, -70000, "é", "é", {"a": []}])))
+print("---")
+
+print(server.not_modified(payload, payload['etag']),
+      server.not_modified(payload, '"x", W/' + payload['etag']),
+      server.not_modified(payload, "*"), server.not_modified(payload, None),
+      server.not_modified(payload, '"x"'))
+print("---")
+
+# pages of deletion-resilient pagination are re-encoded once deleted
+cache = LRUCache(max_items=16, listener=None)
+indexed = IndexServer()
+server = serialized.PayloadServer(indexed, cache)
+first = server.hyper_index_payload(0, 3)
+print(json.loads(first['body'])['next_index'], first['version'])
+print(server.hyper_index_payload(0, 3) is first)
+indexed.delete(1)
+second = server.hyper_index_payload(0, 3)
+print(json.loads(second['body'])['data'][1][3], second['version'],
+      second['etag'] != first['etag'])
+print(cache.stats()["hits"], cache.stats()["misses"])
+
+# views are written as lists
+server = serialized.PayloadServer(page_view.Server())
+print(json.loads(server.hyper_payload(2, 3)['body']) ==
+      Server().get_hyper(2, 3))
+for bad in (("xml", "identity"), ("json", "br")):
+    try:
+        server.hyper_payload(1, 10, *bad)
+    except AssertionError as e:
+        print("AssertionError:", e)
+print("---")
+
+
+class ReloadingServer:
+    """Server whose dataset is reloaded while get_hyper runs."""
+
+    def __init__(self, reloads):
+        """Reload during the first reloads calls of get_hyper."""
+        self.version = 1
+        self.reloads = reloads
+
+    def dataset_version(self):
+        """Return the version of the current rows."""
+        return self.version
+
+    def get_hyper(self, page, page_size):
+        """Return the rows of the version current when called."""
+        data = "v{}".format(self.version)
+        if self.reloads:
+            self.reloads -= 1
+            self.version += 1
+        return {'data': data}
+
+
+# a page is cached under the version it was built from, or not at all
+for reloads in (1, 2):
+    server = serialized.PayloadServer(ReloadingServer(reloads))
+    payload = server.hyper_payload(1, 10)
+    print(payload['body'], payload['version'], sorted(
+        key[-1] for key in server.cache.cache_data))
+
+# the default cache drops the payloads of older versions
+server = serialized.PayloadServer(ReloadingServer(0))
+server.hyper_payload(1, 10, "json", "gzip")
+server.server.version = 2
+server.hyper_payload(1, 10)
+print(sorted(key[-2:] for key in server.cache.cache_data))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Serve get_hyper requests in a loop while the CSV file is replaced, and
+report the request latencies before and during the background reload,
+how long the reload took, and that every response came whole from one
+version.
+
+Usage: ./14-bench.py [seconds]
+"""
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+hot_reload = __import__('14-hot_reload')
+
+
+def serve(server, seconds, versions):
+    """Request pages for seconds, return the latency of each."""
+    latencies = []
+    end = time.perf_counter() + seconds
+    page = 1
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        hyper = server.get_hyper(page, 100)
+        latencies.append(time.perf_counter() - start)
+        versions.add((hyper['total_pages'], len(hyper['data'])))
+        page = page % 50 + 1
+    return latencies
+
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "names.csv")
+    try:
+        shutil.copy("Popular_Baby_Names.csv", path)
+        manager = hot_reload.DatasetManager(path, check_interval=0.01)
+        server = hot_reload.Server(manager)
+        server.get_hyper(1, 100)
+        versions = set()
+        steady = serve(server, seconds, versions)
+
+        with open(path) as f:
+            lines = f.readlines()
+        with open(path, "w") as f:
+            f.writelines(lines + lines[1:1001])
+        start = time.perf_counter()
+        during = []
+        while server.dataset_version() == 1:
+            during.extend(serve(server, 0.01, versions))
+        reload_time = time.perf_counter() - start
+        serve(server, 0.01, versions)
+        manager.close()
+
+        print("{:>8} {:>9} {:>9} {:>9}".format("phase", "requests",
+                                               "p50 us", "max ms"))
+        for name, latencies in (("steady", steady), ("reload", during)):
+            print("{:>8} {:>9} {:>9.1f} {:>9.2f}".format(
+                name, len(latencies), statistics.median(latencies) * 1e6,
+                max(latencies) * 1e3))
+        print("reload took {:.0f} ms, responses {}".format(
+            reload_time * 1e3, sorted(versions)))
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+caching = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       "..", "..", "0x01-caching")
+sys.path[:0] = [caching, os.path.join(caching, "tests")]
+
+LRUCache = __import__('3-lru_cache').LRUCache
+hot_reload = __import__('14-hot_reload')
+block_cache = __import__('10-block_cache')
+
+directory = tempfile.mkdtemp()
+path = os.path.join(directory, "names.csv")
+shutil.copy("Popular_Baby_Names.csv", path)
+
+
+def rewrite(text, mtime):
+    """Replace the file content and set its modification time."""
+    with open(path, "w") as f:
+        f.write(text)
+    os.utime(path, ns=(mtime, mtime))
+
+
+try:
+    manager = hot_reload.DatasetManager(path, check_interval=0)
+    server = hot_reload.Server(manager)
+    print(server.get_hyper(1, 2))
+    print(server.dataset_version(), server.get_hyper_index(3, 1)['data'])
+    blocks = block_cache.Server(LRUCache(max_items=8, listener=None),
+                                source=server)
+    print(blocks.get_page(1, 2) == server.get_page(1, 2))
+
+    # a request in flight keeps the snapshot it started with
+    old = server.snapshot()
+    with open(path) as f:
+        lines = f.readlines()
+    rewrite("".join(lines[:1] + lines[4:8]), 10 ** 18)
+    print(manager.changed(), manager.poll() is not None)
+    new = manager.wait()
+    print(old.version, new.version, server.dataset_version())
+    print(old.server.get_hyper(1, 2)['total_pages'],
+          server.get_hyper(1, 2)['total_pages'])
+    print(server.get_page(1, 1)[0][3], old.server.get_page(1, 1)[0][3])
+    print(server.get_hyper_index(0, 2)['data'][0][3],
+          server.get_cursor_page(None, 10)['next_cursor'])
+    print(blocks.get_page(1, 2) == server.get_page(1, 2))
+
+    # a touched file with the same content keeps its version
+    os.utime(path, ns=(2 * 10 ** 18, 2 * 10 ** 18))
+    print(manager.changed(), manager.wait().version, manager.changed(),
+          server.dataset_version())
+    print(manager.reload(force=True).version)
+
+    # a file that cannot be read keeps the current snapshot
+    os.remove(path)
+    print(manager.poll(), server.dataset_version())
+    try:
+        manager.reload()
+    except OSError as e:
+        print(type(e).__name__, server.get_page(1, 1)[0][3])
+    manager.close()
+finally:
+    shutil.rmtree(directory)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Compare the peak RSS of the list-of-lists dataset with the columnar one
+when Popular_Baby_Names.csv is scaled by repeating its rows. Each backend
+is measured in a fresh child process.
+
+Usage: ./4-bench.py [scale]   (scale 1000 is about 19 million rows)
+"""
+import csv
+import itertools
+import resource
+import subprocess
+import sys
+from typing import Iterator, List
+
+columnar = __import__('4-columnar_dataset')
+DATA_FILE = "Popular_Baby_Names.csv"
+
+
+def scaled_rows(scale: int) -> Iterator[List[str]]:
+    """Yield the data rows of the CSV file scale times, re-parsing the
+    file each time so no str object is shared between copies.
+    """
+    for _ in range(scale):
+        with open(DATA_FILE) as f:
+            yield from itertools.islice(csv.reader(f), 1, None)
+
+
+def load(backend: str, scale: int) -> int:
+    """Load the scaled dataset with backend and return its row count."""
+    if backend == "list":
+        dataset = list(scaled_rows(scale))
+    else:
+        with open(DATA_FILE) as f:
+            header = next(csv.reader(f))
+        dataset = columnar.ColumnarDataset(header, scaled_rows(scale))
+    return len(dataset)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        rows = load(sys.argv[2], int(sys.argv[1]))
+        peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(rows, peak_kib)
+        sys.exit(0)
+
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print("{:>10} {:>10} {:>12}".format("backend", "rows", "peak RSS MiB"))
+    for backend in ("list", "columnar"):
+        output = subprocess.run(
+            [sys.executable, sys.argv[0], str(scale), backend],
+            check=True, stdout=subprocess.PIPE, universal_newlines=True)
+        rows, peak_kib = map(int, output.stdout.split())
+        print("{:>10} {:>10} {:>12.1f}".format(backend, rows,
+                                               peak_kib / 1024))
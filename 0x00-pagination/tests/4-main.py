@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('4-columnar_dataset').Server
+
+server = Server()
+
+print(server.get_hyper(1, 2))
+print("---")
+print(server.get_hyper(2, 2))
+print("---")
+print(server.get_hyper(100, 3))
+print("---")
+print(server.get_hyper(3000, 100))
+print("---")
+dataset = server.dataset()
+print(len(dataset), dataset[0], dataset[-1])
+print(dataset.typed_row(0))
+print([len(column.categories or []) for column in dataset.columns])
+ListServer = __import__('2-hypermedia_pagination').Server
+print(dataset[:] == ListServer().dataset())
+ColumnarDataset = __import__('4-columnar_dataset').ColumnarDataset
+wide = ColumnarDataset(['a', 'b'], [['1', 'x'],
+                                    ['99999999999999999999', 'y']])
+print(wide[:], wide.typed_row(0), wide.columns[0].categories)
+blank = ColumnarDataset(['a', 'b'], [['1', 'x'], [], ['2', 'y']])
+print(len(blank), blank[:])
+for ragged in (['3'], ['3', 'z', 'extra']):
+    try:
+        ColumnarDataset(['a', 'b'], [['1', 'x'], ragged])
+    except ValueError as error:
+        print(error)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Compare the time to answer the first get_page call, and then any page,
+with the list-of-lists dataset and the memory-mapped one, on a copy of
+Popular_Baby_Names.csv whose rows are repeated scale times. The mmap
+backend is timed twice: building its row index, then reusing the saved
+one.
+
+Usage: ./5-bench.py [scale]   (scale 100 is about 2 million rows)
+"""
+import os
+import sys
+import tempfile
+import time
+
+hypermedia = __import__('2-hypermedia_pagination')
+mmap_dataset = __import__('5-mmap_dataset')
+DATA_FILE = "Popular_Baby_Names.csv"
+
+
+def write_scaled(path: str, scale: int) -> None:
+    """Write the CSV file to path with its data rows repeated."""
+    with open(DATA_FILE) as f:
+        header = f.readline()
+        rows = f.read()
+    with open(path, "w") as f:
+        f.write(header)
+        for _ in range(scale):
+            f.write(rows)
+
+
+def timed_pages(server, total: int) -> (float, float):
+    """Return the seconds of the first get_page call and the mean seconds
+    of pages spread over the whole dataset afterwards.
+    """
+    start = time.perf_counter()
+    server.get_page(1, 10)
+    first = time.perf_counter() - start
+    pages = range(1, total // 10, max(1, total // 10000))
+    start = time.perf_counter()
+    for page in pages:
+        server.get_page(page, 10)
+    return first, (time.perf_counter() - start) / len(pages)
+
+
+if __name__ == "__main__":
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, DATA_FILE)
+        write_scaled(path, scale)
+        total = 19418 * scale
+        print("{:>12} {:>14} {:>14}".format("backend", "first page ms",
+                                            "page us"))
+        for name, server_class in (("list", hypermedia.Server),
+                                   ("mmap cold", mmap_dataset.Server),
+                                   ("mmap warm", mmap_dataset.Server)):
+            server = server_class()
+            server.DATA_FILE = path
+            first, page = timed_pages(server, total)
+            print("{:>12} {:>14.1f} {:>14.1f}".format(name, first * 1e3,
+                                                      page * 1e6))
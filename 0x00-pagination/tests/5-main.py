@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import shutil
+import tempfile
+
+Server = __import__('5-mmap_dataset').Server
+
+server = Server()
+
+print(server.get_hyper(1, 2))
+print("---")
+print(server.get_hyper(2, 2))
+print("---")
+print(server.get_hyper(100, 3))
+print("---")
+print(server.get_hyper(3000, 100))
+print("---")
+dataset = server.dataset()
+print(len(dataset), dataset[0], dataset[-1])
+print(os.path.exists(server.DATA_FILE + dataset.INDEX_SUFFIX))
+ListServer = __import__('2-hypermedia_pagination').Server
+print(dataset[:] == ListServer().dataset())
+print(Server().dataset().offsets == dataset.offsets)
+
+# a truncated index is rebuilt, not trusted
+MmapDataset = __import__('5-mmap_dataset').MmapDataset
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, "names.csv")
+    shutil.copyfile(server.DATA_FILE, path)
+    MmapDataset(path).close()
+    with open(path + MmapDataset.INDEX_SUFFIX, "r+b") as f:
+        f.truncate(os.path.getsize(f.name) // 2)
+    truncated = MmapDataset(path)
+    print(len(truncated) == len(dataset), sorted(os.listdir(directory)))
+    truncated.close()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Compare answering filtered and sorted pages by scanning the dataset on
+every request with answering them from the secondary indexes.
+
+Usage: ./6-bench.py
+"""
+import time
+
+Server = __import__('6-filtered_pagination').Server
+ROUNDS = 200
+QUERIES = [
+    ({"Gender": "FEMALE"}, None),
+    ({"Gender": "FEMALE", "Year of Birth": "2016"}, "Rank"),
+    ({"Gender": "MALE", "Year of Birth": "2012", "Ethnicity": "HISPANIC"},
+     "-Count"),
+]
+
+
+def scan_page(dataset, header, filters, sort, page, page_size):
+    """Filter and sort the whole dataset, then slice the page."""
+    positions = [(header.index(column), value)
+                 for column, value in filters.items()]
+    rows = [row for row in dataset
+            if all(row[i] == value for i, value in positions)]
+    if sort is not None:
+        column = header.index(sort.lstrip("-"))
+        rows.sort(key=lambda row: int(row[column]),
+                  reverse=sort.startswith("-"))
+    start = (page - 1) * page_size
+    return rows[start:start + page_size]
+
+
+def ms_per_page(function, *args) -> float:
+    """Return the mean milliseconds of function(*args)."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        function(*args)
+    return (time.perf_counter() - start) / ROUNDS * 1e3
+
+
+if __name__ == "__main__":
+    server = Server()
+    dataset = server.dataset()
+    header = server.header()
+    print("{:>8} {:>10} {:>12} {:>12}".format("filters", "matches",
+                                              "scan ms", "indexed ms"))
+    for filters, sort in QUERIES:
+        start = time.perf_counter()
+        server.get_hyper(2, 10, filters, sort)
+        build = time.perf_counter() - start
+        print("{:>8} {:>10} {:>12.3f} {:>12.3f}   (first query {:.1f} ms)"
+              .format(len(filters), len(server.row_ids(filters, sort)),
+                      ms_per_page(scan_page, dataset, header, filters,
+                                  sort, 2, 10),
+                      ms_per_page(server.get_hyper, 2, 10, filters, sort),
+                      build * 1e3))
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('6-filtered_pagination').Server
+
+server = Server()
+
+print(server.get_hyper(1, 2))
+print("---")
+filters = {"Gender": "FEMALE", "Year of Birth": 2016, "Ethnicity": "HISPANIC"}
+res = server.get_hyper(1, 3, filters=filters, sort="Rank")
+print(res)
+print("---")
+print(server.get_hyper(res['total_pages'], 3, filters, "-Count"))
+print("---")
+print(server.get_page(1, 3, sort="-Count"))
+print(server.get_page(1, 2, {"Child's First Name": "Nobody"}))
+olivia = {"Child's First Name": "Olivia"}
+print(server.get_hyper(2, 2, olivia, "Year of Birth"))
+print("---")
+dataset = server.dataset()
+scan = [row for row in dataset
+        if row[1] == "FEMALE" and row[0] == "2016" and row[2] == "HISPANIC"]
+scan.sort(key=lambda row: int(row[5]))
+print(len(scan), server.get_page(2, 100, filters, "Rank") == scan[100:200])
+print(len(server.column_index("Ethnicity")), len(server.row_ids(filters)))
+
+try:
+    server.get_page(1, 10, {"Color": "blue"})
+except AssertionError as error:
+    print("AssertionError:", error)
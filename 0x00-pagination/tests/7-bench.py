@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Compare answering "top 10 names across all years" by scanning the dataset
+on every request with paging over the precomputed "names" view.
+
+Usage: ./7-bench.py
+"""
+import time
+from collections import Counter
+
+Server = __import__('7-aggregated_views').Server
+ROUNDS = 50
+
+
+def scan_top(dataset, n):
+    """Deduplicate and sum the counts per name, then keep the top n."""
+    totals = Counter()
+    for row in set(map(tuple, dataset)):
+        totals[row[3].casefold()] += int(row[4])
+    return totals.most_common(n)
+
+
+def ms(function, *args) -> float:
+    """Return the mean milliseconds of function(*args)."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        function(*args)
+    return (time.perf_counter() - start) / ROUNDS * 1e3
+
+
+if __name__ == "__main__":
+    server = Server()
+    dataset = server.dataset()
+    start = time.perf_counter()
+    server.get_page(1, 10, "names")
+    print("build aggregates once: {:8.3f} ms".format(
+        (time.perf_counter() - start) * 1e3))
+    print("scan per request:      {:8.3f} ms".format(
+        ms(scan_top, dataset, 10)))
+    print("view page:             {:8.3f} ms".format(
+        ms(server.get_hyper, 1, 10, "names")))
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import os
+import shutil
+import tempfile
+
+Server = __import__('7-aggregated_views').Server
+
+server = Server()
+
+print(server.get_hyper(1, 3, view="names"))
+print("---")
+print(server.get_hyper(2, 3, view="names_by_year"))
+print("---")
+print(server.get_page(1, 2, view="names_by_gender"))
+aggregates = server.aggregates()
+print(len(server.dataset()), len(aggregates.rows), aggregates.duplicates)
+print(server.get_hyper(1, 1, view="dedup")['total_pages'])
+print(sum(int(row[-2]) for row in server.view("names")) ==
+      sum(int(row[4]) for row in aggregates.rows))
+print("---")
+
+# appended rows are folded in, any other change rebuilds
+with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, server.DATA_FILE)
+    shutil.copy(server.DATA_FILE, path)
+    server = Server()
+    server.DATA_FILE = path
+    print(server.get_page(1, 1, "names"))
+    aggregates = server.aggregates()
+    with open(path, "a") as f:
+        f.write("2017,MALE,HISPANIC,Ethan,1000,1\n")
+        f.write("2011,FEMALE,HISPANIC,ISABELLA,331,1\n")
+    print(server.get_page(1, 1, "names"), len(aggregates.rows),
+          aggregates.duplicates, server.aggregates() is aggregates)
+    with open(path, "w") as f:
+        f.write("Year of Birth,Gender,Ethnicity,Child's First Name,Count,"
+                "Rank\n2020,FEMALE,HISPANIC,Luna,5,1\n")
+    print(server.get_hyper(1, 10, "names"))
+    with open(path, "a") as f:
+        f.write("2020,FEMALE,HISPANIC,Ava,3")
+    print(len(server.view("dedup")), len(server.dataset()))
+
+    # the last row counts without a trailing newline
+    path = os.path.join(directory, "unterminated.csv")
+    server = Server()
+    server.DATA_FILE = path
+    with open(path, "w") as f:
+        f.write("Year of Birth,Gender,Ethnicity,Child's First Name,Count,"
+                "Rank\n2020,FEMALE,HISPANIC,Luna,5,1\n"
+                "2020,FEMALE,HISPANIC,Mia,2,2")
+    print([row[0] for row in server.view("names")],
+          len(server.view("dedup")))
+    with open(path, "a") as f:
+        f.write("\n2020,FEMALE,HISPANIC,Ava,3,2\n")
+    print([row[0] for row in server.view("names")])
+
+try:
+    server.get_page(1, 10, "colors")
+except AssertionError as error:
+    print("AssertionError:", error)
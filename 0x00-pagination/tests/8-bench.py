@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Load test of the event loop during warmup: many concurrent first requests
+hit a cold server while a heartbeat task measures how late the loop wakes
+it up. The blocking Server parses the CSV file on the loop; AsyncServer
+parses it once in a thread, so the heartbeat keeps beating. Its worst
+lag is the full garbage collection pass the parse triggers, which grows
+with the number of rows.
+
+Usage: ./8-bench.py [scale] [requests]   (the CSV rows are repeated scale
+                                          times)
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+Server = __import__('2-hypermedia_pagination').Server
+AsyncServer = __import__('8-async_server').AsyncServer
+DATA_FILE = "Popular_Baby_Names.csv"
+BEAT = 0.001
+
+
+async def heartbeat(lags, stop):
+    """Sleep BEAT seconds in a loop, recording how late each wake-up is."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(BEAT)
+        lags.append(time.perf_counter() - start - BEAT)
+
+
+async def warmup(path, requests, blocking):
+    """Send concurrent first requests, return the warmup time and lags."""
+    server = Server()
+    server.DATA_FILE = path
+
+    async def request(page):
+        """Serve a page like a handler of an asyncio web framework."""
+        await asyncio.sleep(0)
+        if blocking:
+            return server.get_hyper(page, 10)
+        return await async_server.get_hyper(page, 10)
+
+    async_server = AsyncServer(server)
+    lags = []
+    stop = asyncio.Event()
+    beats = asyncio.ensure_future(heartbeat(lags, stop))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+    await asyncio.gather(*(request(page) for page in range(1, requests + 1)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await beats
+    return elapsed, lags
+
+
+def main():
+    """Run the load test against both servers."""
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, DATA_FILE)
+        with open(DATA_FILE) as f:
+            header, rows = f.readline(), f.read()
+        with open(path, "w") as f:
+            f.write(header + rows * scale)
+        print("{:>10} {:>10} {:>8} {:>14} {:>14}".format(
+            "server", "warmup ms", "beats", "max lag ms", "p50 lag ms"))
+        for name, blocking in (("blocking", True), ("async", False)):
+            elapsed, lags = asyncio.run(warmup(path, requests, blocking))
+            lags.sort()
+            print("{:>10} {:>10.1f} {:>8} {:>14.2f} {:>14.2f}".format(
+                name, elapsed * 1e3, len(lags), lags[-1] * 1e3,
+                lags[len(lags) // 2] * 1e3))
+
+
+if __name__ == "__main__":
+    main()
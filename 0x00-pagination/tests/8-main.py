@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import asyncio
+
+async_server = __import__('8-async_server')
+Server = __import__('2-hypermedia_pagination').Server
+
+
+class CountingServer(Server):
+    """Server counting how often the CSV file is parsed."""
+    loads = 0
+
+    def dataset(self):
+        """Load the dataset, recording parses."""
+        if self._Server__dataset is None:
+            CountingServer.loads += 1
+        return super().dataset()
+
+
+async def main():
+    """Hit a cold AsyncServer with concurrent requests."""
+    server = async_server.AsyncServer(CountingServer())
+    pages = await asyncio.gather(*(server.get_page(page, 2)
+                                   for page in range(1, 51)))
+    print(len(pages), pages[0], CountingServer.loads)
+    print(await server.get_hyper(2, 2))
+    res = await server.get_hyper_index(3, 2)
+    print(res)
+    server.indexed.delete(3)
+    print(await server.get_hyper_index(3, 2))
+    print(len(server.server.dataset()), len(server.indexed.indexed_dataset()),
+          CountingServer.loads)
+
+    broken = Server()
+    broken.DATA_FILE = "missing.csv"
+    server = async_server.AsyncServer(broken)
+    for _ in range(2):
+        try:
+            await server.get_page()
+        except FileNotFoundError as error:
+            print("FileNotFoundError:", error.filename)
+    broken.DATA_FILE = Server.DATA_FILE
+    print(len(await server.get_page()))
+
+asyncio.run(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Time the cold load of a copy of Popular_Baby_Names.csv whose rows are
+repeated scale times, with the single csv.reader of Server.dataset() and
+with the parallel loader for 1, 2, 4, ... workers up to twice the CPU
+count, into a list of rows and into a ColumnarDataset. Speedups are
+relative to the single reader for rows and to one worker for columns.
+The columnar load speeds up near-linearly until the workers outnumber the
+cores; the list of rows is held back by sending every row back from the
+workers.
+
+Usage: ./9-bench.py [scale]   (scale 100 is about 2 million rows, 80 MB)
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+
+loader = __import__('9-parallel_loader')
+DATA_FILE = "Popular_Baby_Names.csv"
+
+
+def sequential(path):
+    """Load the rows like Server.dataset()."""
+    with open(path) as f:
+        return [row for row in csv.reader(f)][1:]
+
+
+def seconds(function, *args):
+    """Return the seconds of function(*args) and its number of rows."""
+    start = time.perf_counter()
+    rows = len(function(*args))
+    return time.perf_counter() - start, rows
+
+
+if __name__ == "__main__":
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    cpus = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, DATA_FILE)
+        with open(DATA_FILE) as f:
+            header, rows = f.readline(), f.read()
+        with open(path, "w") as f:
+            f.write(header + rows * scale)
+
+        base, count = seconds(sequential, path)
+        print("{} rows, {} CPUs, single reader {:.2f} s".format(
+            count, cpus, base))
+        print("{:>8} {:>8} {:>8} {:>10} {:>8}".format(
+            "workers", "rows s", "speedup", "columnar s", "speedup"))
+        columnar_base, _ = seconds(loader.load_columnar, path, 1)
+        workers = 1
+        while workers <= 2 * cpus:
+            rows_s, _ = seconds(
+                lambda: list(loader.iter_parallel_rows(path, workers)))
+            columnar_s, _ = seconds(loader.load_columnar, path, workers)
+            print("{:>8} {:>8.2f} {:>8.2f} {:>10.2f} {:>8.2f}".format(
+                workers, rows_s, base / rows_s, columnar_s,
+                columnar_base / columnar_s))
+            workers *= 2
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import csv
+import os
+import tempfile
+
+loader = __import__('9-parallel_loader')
+Server = __import__('2-hypermedia_pagination').Server
+
+
+if __name__ == "__main__":
+    loader.MIN_CHUNK = 4096
+    expected = Server().dataset()
+
+    bounds = loader.chunk_bounds(Server.DATA_FILE, 4)
+    print(len(bounds), bounds[0][0], bounds[-1][1] ==
+          os.path.getsize(Server.DATA_FILE))
+    server = loader.Server()
+    server.WORKERS = 4
+    print(server.get_hyper(2, 2))
+    print(server.dataset() == expected)
+    server = loader.Server()
+    server.WORKERS = 3
+    server.COLUMNAR = True
+    print(type(server.dataset()).__name__, server.dataset()[:] == expected)
+    print(server.get_hyper(3000, 3)['data'][0])
+    server = loader.Server()
+    print(server.dataset_version(), server.page_metadata(
+        10, approximate=True)['approximate'])
+    res = server.get_hyper(1941, 10, approximate=True)
+    print(server.dataset_version(), res['total_pages'], res['next_page'],
+          res['approximate'])
+
+    # quoted fields may hold newlines and quotes
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "quoted.csv")
+        rows = [["id", "text"]] + [
+            [str(i), 'line "{}"\nnext, line\n'.format(i) * (i % 3)]
+            for i in range(3000)]
+        with open(path, "w", newline="") as f:
+            csv.writer(f).writerows(rows)
+        for workers in (1, 2, 7):
+            parsed = list(loader.iter_parallel_rows(path, workers))
+            dataset = loader.load_columnar(path, workers)
+            print(workers, len(loader.chunk_bounds(path, workers)),
+                  parsed == rows[1:], dataset[:] == rows[1:])
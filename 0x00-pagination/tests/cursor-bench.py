@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Time get_cursor_page and get_hyper_index right before a gap of deleted
+rows, for growing gaps. The time per page stays flat because the ordered
+index jumps over the gap with a binary search.
+
+Usage: ./cursor-bench.py
+"""
+import time
+
+del_pagination = __import__('3-hypermedia_del_pagination')
+Server = del_pagination.Server
+encode_cursor = del_pagination.encode_cursor
+ROUNDS = 2000
+
+
+def page_us(method, *args) -> float:
+    """Return the mean microseconds of method(*args)."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        method(*args)
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+if __name__ == "__main__":
+    print("{:>8} {:>16} {:>16}".format("gap", "cursor page us",
+                                       "hyper index us"))
+    for gap in (0, 10, 100, 1000, 10000, 19000):
+        server = Server()
+        indexed = server.indexed_dataset()
+        for i in range(100, 100 + gap):
+            del indexed[i]
+        print("{:>8} {:>16.1f} {:>16.1f}".format(
+            gap,
+            page_us(server.get_cursor_page, encode_cursor(100), 10),
+            page_us(server.get_hyper_index, 100, 10)))
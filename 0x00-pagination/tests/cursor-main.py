@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+module = __import__('3-hypermedia_del_pagination')
+Server = module.Server
+
+server = Server()
+indexed = server.indexed_dataset()
+
+res = server.get_cursor_page(page_size=2)
+print(res)
+print(module.decode_cursor(res['next_cursor']))
+
+# delete a large gap right after the first page
+for i in range(2, 10000):
+    del indexed[i]
+print("Nb items: {}".format(len(indexed)))
+
+res = server.get_cursor_page(res['next_cursor'], 2)
+print(res)
+print(module.decode_cursor(res['next_cursor']))
+print(server.get_hyper_index(5, 3)['next_index'])
+
+# walk every page: each row exactly once, every page full but the last
+sizes = []
+cursor = None
+while True:
+    res = server.get_cursor_page(cursor, 1000)
+    sizes.append(res['page_size'])
+    cursor = res['next_cursor']
+    if cursor is None:
+        break
+print(len(sizes), sum(sizes), set(sizes[:-1]), sizes[-1])
+
+for cursor in ("not a cursor", module.encode_cursor(0)[:-1] + "!"):
+    try:
+        server.get_cursor_page(cursor)
+    except ValueError as error:
+        print("ValueError:", error)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('1-simple_pagination').Server
+HyperServer = __import__('2-hypermedia_pagination').Server
+
+server = Server()
+
+rows = server.iter_rows()
+print(next(rows))
+print(next(rows))
+print("---")
+pages = server.iter_pages(3, start_page=100)
+print(next(pages))
+print(next(pages) == server.get_page(101, 3))
+print("---")
+last = None
+for count, last in enumerate(server.iter_pages(1000), 1):
+    pass
+print(count, len(last))
+print(sum(map(len, HyperServer().iter_pages(7))))
+print(list(server.iter_pages(10, 3000)))
+print(Server()._Server__dataset is None)
+
+try:
+    next(server.iter_pages(0))
+except AssertionError as error:
+    print("AssertionError:", error)
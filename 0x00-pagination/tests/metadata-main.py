@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('2-hypermedia_pagination').Server
+
+
+class CountingServer(Server):
+    """Server counting how often the total is computed."""
+    counts = 0
+
+    def count_items(self, query=None):
+        """Count the items, recording the call."""
+        CountingServer.counts += 1
+        return super().count_items(query)
+
+
+server = CountingServer()
+
+print(server.dataset_version())
+print(server.page_metadata(100, approximate=True))
+print(server.dataset_version(), CountingServer.counts)
+res = server.get_hyper(1, 2, approximate=True)
+print(res['total_pages'], res['approximate'], server.dataset_version())
+print("---")
+for page in range(1, 50):
+    res = server.get_hyper(page, 2)
+print(res['total_pages'], 'approximate' in res, CountingServer.counts)
+server.get_hyper(1, 3)
+print(server.page_metadata(3), CountingServer.counts)
+print("---")
+
+# a reloaded dataset has a new version, so its totals are counted again
+server._Server__dataset = None
+server.dataset()
+print(server.dataset_version(), server.get_hyper(1, 3)['total_pages'],
+      CountingServer.counts)
+
+try:
+    server.get_hyper(1, 0)
+except AssertionError as error:
+    print("AssertionError:", error)
+print("---")
+
+# backends with their own storage bump the version when they load too
+MmapServer = __import__('5-mmap_dataset').Server
+server = MmapServer()
+print(server.page_metadata(10, approximate=True), server.dataset_version())
+res = server.get_hyper(1, 10, approximate=True)
+print(res['total_pages'], res['approximate'], server.dataset_version())
+res = server.get_hyper(1941, 10, approximate=True)
+print(res['total_pages'], res['next_page'], res['approximate'])
+res = server.get_hyper(1942, 10, approximate=True)
+print(res['total_pages'], res['next_page'], server.dataset_version())
+print(res['data'] == Server().get_page(1942, 10))
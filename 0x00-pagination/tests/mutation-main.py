@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+
+Server = __import__('3-hypermedia_del_pagination').Server
+
+server = Server()
+indexed = server.indexed_dataset()
+print("Nb items: {}".format(len(indexed)))
+
+res = server.get_hyper_index(0, 3)
+print(res['next_index'], [row[3] for row in res['data']])
+
+# deletes skip rows, inserts go after every index used so far
+server.delete(1)
+del server._Server__indexed_dataset[2]
+server.update(0, ['2016', 'FEMALE', 'HISPANIC', 'Zoe', '1', '1'])
+index = server.insert(['2017', 'MALE', 'HISPANIC', 'Noah', '1', '1'])
+print("Nb items: {}".format(len(indexed)))
+print(index, indexed.end(), index in indexed, 19419 in indexed)
+
+res = server.get_hyper_index(0, 3)
+print(res['next_index'], [row[3] for row in res['data']])
+print(server.get_hyper_index(19415, 10)['data'][-1])
+
+server.delete(index)
+print(server.insert(['2018', 'FEMALE', 'HISPANIC', 'Ava', '1', '1']))
+print(len(indexed), len(list(indexed)), sorted(indexed) == list(indexed))
+print(server.dataset()[1][3], len(server.dataset()))
+
+for mutation in (lambda: server.delete(1), lambda: server.update(1, [])):
+    try:
+        mutation()
+    except KeyError as error:
+        print("KeyError:", error)
@@ -1,22 +1,27 @@
 #!/usr/bin/env python3
 """ BasicCache module
 """
-from base_caching import BaseCaching
+from base_caching import BaseCaching, timed
 
 
 class BasicCache(BaseCaching):
     """ BasicCache class inherits from BaseCaching
     """
 
-    def put(self, key, item):
-        """ Add an item in the cache
+    @timed("put")
+    def put(self, key, item, ttl=None):
+        """ Add an item in the cache, expiring after ttl seconds
+        or the cache default TTL when one is given
         """
         if key is not None and item is not None:
-            self.cache_data[key] = item
+            self.expire()
+            self._store(key, item, 0, ttl)
 
+    @timed("get")
     def get(self, key):
         """ Get an item by key
         """
-        if key is None or key not in self.cache_data:
+        if (key is None or key not in self.cache_data or
+                self._expired(key)):
             return None
         return self.cache_data[key]
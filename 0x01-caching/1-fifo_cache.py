@@ -1,39 +1,54 @@
 #!/usr/bin/env python3
 """ FIFO caching module
 """
-from base_caching import BaseCaching
+from base_caching import BaseCaching, timed
 
 
 class FIFOCache(BaseCaching):
     """ FIFOCache class that inherits from BaseCaching
     """
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """ Initialize the FIFO cache
         """
-        super().__init__()
+        super().__init__(*args, **kwargs)
 
-    def put(self, key, item):
+    @timed("put")
+    def put(self, key, item, ttl=None):
         """ Assign to the dictionary self.cache_data the item value
         for the key key.
+        The item expires after ttl seconds, or the cache default TTL.
         If key or item is None, do nothing.
-        If self.cache_data exceeds MAX_ITEMS, discard
-        the first added item (FIFO).
+        If self.cache_data exceeds max_items or max_bytes, discard
+        the first added items (FIFO). Updating a key keeps its place.
         """
         if key is None or item is None:
             return
 
-        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            first_key = next(iter(self.cache_data))
-            print(f"DISCARD: {first_key}")
-            del self.cache_data[first_key]
+        self.expire()
+        size = self._size_of(item)
+        if self._oversized(key, size):
+            return
+
+        if key in self.cache_data:
+            self._store(key, item, size, ttl)
+            self._shrink()
+            return
 
-        self.cache_data[key] = item
+        self._make_room(size)
+        self._store(key, item, size, ttl)
 
+    @timed("get")
     def get(self, key):
         """ Return the value in self.cache_data linked to key.
-        If key is None or doesn't exist, return None.
+        If key is None, doesn't exist or expired, return None.
         """
-        if key is None or key not in self.cache_data:
+        if (key is None or key not in self.cache_data or
+                self._expired(key)):
             return None
         return self.cache_data[key]
+
+    def _victim(self):
+        """ The first added key is evicted first
+        """
+        return next(iter(self.cache_data))
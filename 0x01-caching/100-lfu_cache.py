@@ -3,7 +3,9 @@
 This module defines the LFUCache class, which implements a Least Frequently
 Used (LFU) caching mechanism, inheriting from BaseCaching.
 """
-from base_caching import BaseCaching
+from collections import OrderedDict
+
+from base_caching import BaseCaching, timed
 
 
 class LFUCache(BaseCaching):
@@ -19,35 +21,44 @@ class LFUCache(BaseCaching):
         cache_data (dict): A dictionary that holds the cached items.
         frequencies (dict): A dictionary that tracks the frequency of each
                             key.
-        order (dict): A dictionary that maps frequencies to a list of keys
-                      for LRU.
+        order (dict): A dictionary that maps each frequency to an
+                      OrderedDict of keys, oldest access first, so ties
+                      are broken by LRU.
         min_freq (int): The minimum frequency of keys currently in the cache.
+
+    Every bucket operation (unlink a key, append a key, pop the oldest key)
+    is O(1), so get and put cost the same regardless of how many keys share
+    a frequency.
     """
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """ Initialize the LFUCache.
 
         This method calls the parent class's initializer to set up the
         cache_data dictionary and initializes the supporting data structures
         for LFU management.
         """
-        super().__init__()
+        super().__init__(*args, **kwargs)
         self.frequencies = {}
         self.order = {}
         self.min_freq = 0
 
-    def put(self, key, item):
+    @timed("put")
+    def put(self, key, item, ttl=None):
         """ Add an item to the cache.
 
         This method adds an item to the cache with the given key. If the
-        number of items exceeds the maximum allowed (MAX_ITEMS), the least
-        frequently used item will be discarded. In case of a tie, the least
-        recently used item will be discarded.
+        number of items exceeds the maximum allowed (max_items), or their
+        size exceeds max_bytes, the least frequently used items will be
+        discarded. In case of a tie, the least recently used item will be
+        discarded.
 
         Args:
             key (str): The key under which the item will be stored in the
                         cache.
             item (any): The item to be cached.
+            ttl (float): Seconds before the item expires, the cache
+                        default TTL if None.
 
         If key or item is None, this method will not perform any operation.
         If adding the item exceeds the cache limit, it will discard the least
@@ -57,21 +68,26 @@ class LFUCache(BaseCaching):
         if key is None or item is None:
             return
 
+        self.expire()
+        size = self._size_of(item)
+        if self._oversized(key, size):
+            return
+
         if key in self.cache_data:
-            self.cache_data[key] = item
+            self._store(key, item, size, ttl)
             self._update_frequency(key)
+            self._shrink()
             return
 
-        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            self._evict()
-
-        self.cache_data[key] = item
+        self._make_room(size)
+        self._store(key, item, size, ttl)
         self.frequencies[key] = 1
         self.min_freq = 1
         if self.min_freq not in self.order:
-            self.order[self.min_freq] = []
-        self.order[self.min_freq].append(key)
+            self.order[self.min_freq] = OrderedDict()
+        self.order[self.min_freq][key] = None
 
+    @timed("get")
     def get(self, key):
         """ Retrieve an item from the cache.
 
@@ -86,34 +102,132 @@ class LFUCache(BaseCaching):
             The value associated with the key if it exists, or None if the
             key is None or does not exist in the cache.
         """
-        if key is None or key not in self.cache_data:
+        if (key is None or key not in self.cache_data or
+                self._expired(key)):
             return None
 
         self._update_frequency(key)
         return self.cache_data[key]
 
+    def get_many(self, keys):
+        """ Retrieve several items at once.
+
+        Skips the per-call checks and instrumentation of get. A key
+        requested several times counts as a hit, and has its frequency
+        bumped, each time, as with get.
+
+        Args:
+            keys (iterable): The keys of the items to retrieve.
+
+        Returns:
+            A dictionary of the keys found in the cache and their items.
+        """
+        cache_data = self.cache_data
+        found = {}
+        requested = hits = 0
+        for key in keys:
+            requested += 1
+            if (key is not None and key in cache_data and
+                    not self._expired(key)):
+                found[key] = cache_data[key]
+                self._update_frequency(key)
+                hits += 1
+        self.hits += hits
+        self.misses += requested - hits
+        return found
+
+    def put_many(self, mapping, ttl=None):
+        """ Add several items without the per-call overhead of put.
+
+        Items are added in mapping order and evict exactly what putting
+        them one by one would: keys already cached are updated and have
+        their frequency bumped, and each new key joins the frequency-1
+        bucket after evicting the least frequently used key if the cache
+        is full. Once the batch has filled that bucket, only keys of the
+        batch itself are evicted, so it never flushes the hot keys. The
+        expiry sweep and the instrumentation run once for the batch.
+        With a byte budget every item is put on its own.
+
+        Args:
+            mapping (dict): The items to cache, by key.
+            ttl (float): Seconds before the items expire, the cache
+                        default TTL if None.
+        """
+        if self.max_bytes is not None:
+            super().put_many(mapping, ttl)
+            return
+
+        self.expire()
+        cache_data = self.cache_data
+        for key, item in mapping.items():
+            if key is None or item is None:
+                continue
+            if key in cache_data:
+                self._store(key, item, 0, ttl)
+                self._update_frequency(key)
+                continue
+            if len(cache_data) >= self.max_items:
+                self._evict("capacity")
+            self._store(key, item, 0, ttl)
+            self.frequencies[key] = 1
+            self.order.setdefault(1, OrderedDict())[key] = None
+            self.min_freq = 1
+
     def _update_frequency(self, key):
         """ Update the frequency of the given key. """
         freq = self.frequencies[key]
         self.frequencies[key] += 1
         new_freq = self.frequencies[key]
 
-        self.order[freq].remove(key)
+        del self.order[freq][key]
         if not self.order[freq]:
             if self.min_freq == freq:
                 self.min_freq += 1
             del self.order[freq]
 
         if new_freq not in self.order:
-            self.order[new_freq] = []
-        self.order[new_freq].append(key)
-
-    def _evict(self):
-        """ Evict the least frequently used item from the cache. """
-        key_to_evict = self.order[self.min_freq].pop(0)
-        print(f"DISCARD: {key_to_evict}")
-        del self.cache_data[key_to_evict]
-        del self.frequencies[key_to_evict]
-
-        if not self.order[self.min_freq]:
-            del self.order[self.min_freq]
+            self.order[new_freq] = OrderedDict()
+        self.order[new_freq][key] = None
+
+    def _victim(self):
+        """ Return the least recently used key of the lowest frequency.
+
+        O(1) unless min_freq points at a bucket _forget emptied; then
+        the lowest frequency is found again with min(), which costs
+        O(number of distinct frequencies) once per such bucket.
+        """
+        if self.min_freq not in self.order:
+            self.min_freq = min(self.order)
+        return next(iter(self.order[self.min_freq]))
+
+    def _forget(self, key):
+        """ Drop key from its frequency bucket.
+
+        min_freq may be left pointing at a bucket that no longer exists;
+        _victim then recomputes it with a scan over the remaining
+        frequencies, O(number of distinct frequencies) rather than O(1).
+        Every put of a new key resets min_freq to 1, so the scan is only
+        paid by an eviction that follows a delete, an expiry or another
+        eviction which emptied the lowest bucket.
+        """
+        freq = self.frequencies.pop(key)
+        del self.order[freq][key]
+        if not self.order[freq]:
+            del self.order[freq]
+
+    def _snapshot_entries(self):
+        """ Snapshot keys by increasing frequency, LRU first within a
+        frequency, along with their frequency.
+        """
+        for freq in sorted(self.order):
+            for key in self.order[freq]:
+                yield key, freq
+
+    def _restore_entry(self, key, freq):
+        """ Put a restored key back in its frequency bucket. """
+        self.frequencies[key] = freq
+        if freq not in self.order:
+            self.order[freq] = OrderedDict()
+        self.order[freq][key] = None
+        if self.min_freq == 0 or freq < self.min_freq:
+            self.min_freq = freq
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+""" ARCCache module
+This module defines the ARCCache class, which implements the Adaptive
+Replacement Cache (ARC) policy, inheriting from BaseCaching.
+"""
+from collections import OrderedDict
+
+from base_caching import BaseCaching, timed
+
+
+class ARCCache(BaseCaching):
+    """ ARCCache class that inherits from BaseCaching.
+
+    ARC splits the cache between keys seen once recently (t1) and keys
+    seen at least twice (t2), and remembers the keys it recently evicted
+    from each part in two ghost lists (b1, b2). A miss that hits a ghost
+    list shifts the target size p of t1 towards the part that would have
+    kept the key. A sequential scan only ever lands in t1, so it cannot
+    flush the frequently used keys of t2 the way it flushes an LRU cache.
+
+    Attributes:
+        cache_data (dict): A dictionary that holds the cached items.
+        t1 (OrderedDict): Resident keys seen once, LRU first.
+        t2 (OrderedDict): Resident keys seen more than once, LRU first.
+        b1 (OrderedDict): Ghost keys recently evicted from t1.
+        b2 (OrderedDict): Ghost keys recently evicted from t2.
+        p (float): Target size of t1.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """ Initialize the ARCCache.
+
+        This method calls the parent class's initializer and sets up the
+        resident and ghost lists.
+        """
+        super().__init__(*args, **kwargs)
+        self.t1 = OrderedDict()
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+        self.p = 0
+        self.ghost_hit_b2 = False
+
+    @timed("put")
+    def put(self, key, item, ttl=None):
+        """ Add an item to the cache.
+
+        Args:
+            key (str): The key under which the item will be stored in the
+                        cache.
+            item (any): The item to be cached.
+            ttl (float): Seconds before the item expires, the cache
+                        default TTL if None.
+
+        If key or item is None, this method will not perform any operation.
+        If the cache is full, ARC picks the victim from t1 or t2 and
+        prints a message indicating which key was discarded.
+        """
+        if key is None or item is None:
+            return
+
+        self.expire()
+        size = self._size_of(item)
+        if self._oversized(key, size):
+            return
+
+        self.ghost_hit_b2 = False
+        if key in self.cache_data:
+            self._store(key, item, size, ttl)
+            self._touch(key)
+            self._shrink()
+            return
+
+        capacity = self.max_items
+        if key in self.b1:
+            delta = max(len(self.b2) / len(self.b1), 1)
+            self.p = min(capacity, self.p + delta)
+            del self.b1[key]
+            target = self.t2
+        elif key in self.b2:
+            delta = max(len(self.b1) / len(self.b2), 1)
+            self.p = max(0, self.p - delta)
+            del self.b2[key]
+            self.ghost_hit_b2 = True
+            target = self.t2
+        else:
+            target = self.t1
+
+        self._make_room(size)
+        self._store(key, item, size, ttl)
+        target[key] = None
+        self._trim_ghosts()
+
+    @timed("get")
+    def get(self, key):
+        """ Retrieve an item from the cache.
+
+        A hit promotes the key to the most recently used end of t2.
+
+        Args:
+            key (str): The key of the item to retrieve.
+
+        Returns:
+            The value associated with the key if it exists, or None if the
+            key is None or does not exist in the cache.
+        """
+        if (key is None or key not in self.cache_data or
+                self._expired(key)):
+            return None
+
+        self._touch(key)
+        return self.cache_data[key]
+
+    def _touch(self, key):
+        """ Move a resident key to the most recently used end of t2. """
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        else:
+            self.t2.move_to_end(key)
+
+    def _trim_ghosts(self):
+        """ Keep |t1| + |b1| <= c and the four lists within 2c keys. """
+        capacity = self.max_items
+        while self.b1 and len(self.t1) + len(self.b1) > capacity:
+            self.b1.popitem(last=False)
+        while self.b2 and (len(self.t1) + len(self.t2) + len(self.b1) +
+                           len(self.b2)) > 2 * capacity:
+            self.b2.popitem(last=False)
+
+    def _victim(self):
+        """ ARC's REPLACE: evict the LRU key of t1 when t1 is above its
+        target size p, otherwise the LRU key of t2.
+        """
+        size_t1 = len(self.t1)
+        if self.t1 and (not self.t2 or size_t1 > self.p or
+                        (self.ghost_hit_b2 and size_t1 == self.p)):
+            return next(iter(self.t1))
+        return next(iter(self.t2))
+
+    def _forget(self, key):
+        """ Move key from its resident list to the matching ghost list. """
+        if key in self.t1:
+            del self.t1[key]
+            self.b1[key] = None
+        else:
+            del self.t2[key]
+            self.b2[key] = None
+
+    def _snapshot_state(self):
+        """ Save the target size of t1 and the ghost lists. """
+        return {"p": self.p, "b1": list(self.b1), "b2": list(self.b2)}
+
+    def _restore_state(self, state):
+        """ Reload the target size of t1 and the ghost lists. """
+        self.p = state["p"]
+        self.b1 = OrderedDict.fromkeys(state["b1"])
+        self.b2 = OrderedDict.fromkeys(state["b2"])
+
+    def _snapshot_entries(self):
+        """ Snapshot t1 then t2, each LRU first. """
+        for key in self.t1:
+            yield key, 1
+        for key in self.t2:
+            yield key, 2
+
+    def _restore_entry(self, key, part):
+        """ Put a restored key back in t1 or t2. """
+        (self.t1 if part == 1 else self.t2)[key] = None
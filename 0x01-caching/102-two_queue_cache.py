@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+""" TwoQueueCache module
+This module defines the TwoQueueCache class, which implements the 2Q
+caching policy, inheriting from BaseCaching.
+"""
+from collections import OrderedDict
+
+from base_caching import BaseCaching, timed
+
+
+class TwoQueueCache(BaseCaching):
+    """ TwoQueueCache class that inherits from BaseCaching.
+
+    New keys enter a small FIFO queue (a1in). Keys evicted from it are
+    remembered in a ghost FIFO (a1out); only a key that comes back while
+    it is still remembered is admitted to the main LRU queue (am). Keys
+    touched once by a scan therefore never displace the hot keys of am.
+
+    Attributes:
+        cache_data (dict): A dictionary that holds the cached items.
+        a1in (OrderedDict): Resident keys seen once, oldest first.
+        a1out (OrderedDict): Ghost keys recently evicted from a1in.
+        am (OrderedDict): Resident hot keys, least recently used first.
+        kin (int): Size a1in may grow to before it is evicted from.
+        kout (int): Number of ghost keys remembered in a1out.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """ Initialize the TwoQueueCache.
+
+        The queue sizes follow the 2Q paper: a1in gets a quarter of the
+        capacity and a1out remembers half as many keys as the cache holds.
+        """
+        super().__init__(*args, **kwargs)
+        self.a1in = OrderedDict()
+        self.a1out = OrderedDict()
+        self.am = OrderedDict()
+        self.kin = max(1, self.max_items // 4)
+        self.kout = max(1, self.max_items // 2)
+
+    @timed("put")
+    def put(self, key, item, ttl=None):
+        """ Add an item to the cache.
+
+        Args:
+            key (str): The key under which the item will be stored in the
+                        cache.
+            item (any): The item to be cached.
+            ttl (float): Seconds before the item expires, the cache
+                        default TTL if None.
+
+        If key or item is None, this method will not perform any operation.
+        If the cache is full, the oldest key of a1in is discarded when a1in
+        is over its share, otherwise the LRU key of am, and a message
+        indicating which key was discarded is printed.
+        """
+        if key is None or item is None:
+            return
+
+        self.expire()
+        size = self._size_of(item)
+        if self._oversized(key, size):
+            return
+
+        if key in self.cache_data:
+            self._store(key, item, size, ttl)
+            if key in self.am:
+                self.am.move_to_end(key)
+            self._shrink()
+            return
+
+        if key in self.a1out:
+            del self.a1out[key]
+            target = self.am
+        else:
+            target = self.a1in
+
+        self._make_room(size)
+        self._store(key, item, size, ttl)
+        target[key] = None
+
+    @timed("get")
+    def get(self, key):
+        """ Retrieve an item from the cache.
+
+        A hit refreshes the key in am; keys in a1in keep their FIFO place.
+
+        Args:
+            key (str): The key of the item to retrieve.
+
+        Returns:
+            The value associated with the key if it exists, or None if the
+            key is None or does not exist in the cache.
+        """
+        if (key is None or key not in self.cache_data or
+                self._expired(key)):
+            return None
+
+        if key in self.am:
+            self.am.move_to_end(key)
+        return self.cache_data[key]
+
+    def _victim(self):
+        """ Evict from a1in while it is over its share, else from am. """
+        if self.a1in and (len(self.a1in) > self.kin or not self.am):
+            return next(iter(self.a1in))
+        return next(iter(self.am))
+
+    def _forget(self, key):
+        """ Drop key from its queue, remembering keys that leave a1in. """
+        if key in self.a1in:
+            del self.a1in[key]
+            self.a1out[key] = None
+            if len(self.a1out) > self.kout:
+                self.a1out.popitem(last=False)
+        else:
+            del self.am[key]
+
+    def _snapshot_state(self):
+        """ Save the ghost keys of a1out. """
+        return list(self.a1out)
+
+    def _restore_state(self, state):
+        """ Reload the ghost keys of a1out. """
+        self.a1out = OrderedDict.fromkeys(state)
+
+    def _snapshot_entries(self):
+        """ Snapshot a1in then am, each oldest first. """
+        for key in self.a1in:
+            yield key, "a1in"
+        for key in self.am:
+            yield key, "am"
+
+    def _restore_entry(self, key, queue):
+        """ Put a restored key back in its queue. """
+        (self.a1in if queue == "a1in" else self.am)[key] = None
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+""" TinyLFUCache module
+This module defines the TinyLFUCache class, which implements the
+W-TinyLFU caching policy, inheriting from BaseCaching, and the
+FrequencySketch it uses to estimate how often keys are accessed.
+"""
+from collections import OrderedDict
+
+from base_caching import BaseCaching, timed
+
+
+class FrequencySketch():
+    """ FrequencySketch class, a count-min sketch with a doorkeeper.
+
+    The first access to a key only sets its bits in the doorkeeper, a
+    small Bloom filter, so the many keys seen once never reach the
+    counters. Later accesses increment one 4-bit counter per row of the
+    sketch, and the estimate is the smallest of them. Once sample_size
+    accesses have been counted every counter is halved and the
+    doorkeeper cleared, so old popularity fades away.
+
+    Attributes:
+        width (int): Number of counters per row, a power of two.
+        rows (list): DEPTH bytearrays of counters.
+        doorkeeper (bytearray): Bits of the doorkeeper Bloom filter.
+        sample_size (int): Number of increments between two resets.
+        additions (int): Increments since the last reset.
+    """
+    DEPTH = 4
+    MAX_COUNT = 15
+    HALVE = bytes(count >> 1 for count in range(256))
+
+    def __init__(self, capacity):
+        """ Initialize the sketch for a cache of capacity entries. """
+        width = 16
+        while width < capacity:
+            width *= 2
+        self.width = width
+        self.rows = [bytearray(width) for _ in range(self.DEPTH)]
+        self.doorkeeper = bytearray(width // 2)
+        self.sample_size = 10 * max(capacity, 1)
+        self.additions = 0
+
+    def _indexes(self, key):
+        """ Return the counter index of key in every row, derived from a
+        single hash by double hashing.
+        """
+        mask = self.width - 1
+        digest = (hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        first, step = digest >> 32, (digest & 0xFFFFFFFF) | 1
+        return [(first + row * step) & mask for row in range(self.DEPTH)]
+
+    def _in_doorkeeper(self, indexes):
+        """ Tell whether the doorkeeper bits of indexes are all set. """
+        first, second = indexes[0], indexes[1]
+        return bool(self.doorkeeper[first >> 3] & (1 << (first & 7)) and
+                    self.doorkeeper[second >> 3] & (1 << (second & 7)))
+
+    def increment(self, key):
+        """ Record one access to key. """
+        indexes = self._indexes(key)
+        if not self._in_doorkeeper(indexes):
+            first, second = indexes[0], indexes[1]
+            self.doorkeeper[first >> 3] |= 1 << (first & 7)
+            self.doorkeeper[second >> 3] |= 1 << (second & 7)
+            return
+        for row, i in zip(self.rows, indexes):
+            if row[i] < self.MAX_COUNT:
+                row[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._reset()
+
+    def estimate(self, key):
+        """ Return the estimated number of recent accesses to key. """
+        indexes = self._indexes(key)
+        count = min(row[i] for row, i in zip(self.rows, indexes))
+        return count + (1 if self._in_doorkeeper(indexes) else 0)
+
+    def _reset(self):
+        """ Halve every counter and clear the doorkeeper. """
+        for row in self.rows:
+            row[:] = row.translate(self.HALVE)
+        self.doorkeeper = bytearray(len(self.doorkeeper))
+        self.additions //= 2
+
+
+class TinyLFUCache(BaseCaching):
+    """ TinyLFUCache class that inherits from BaseCaching.
+
+    New keys enter a small LRU window (1% of the capacity). A key pushed
+    out of the full window must beat the eviction candidate of the main
+    cache, as judged by the FrequencySketch, to be admitted; otherwise it
+    is the one discarded. The main cache is a segmented LRU: keys start in
+    probation and are promoted to protected (80% of the main cache) on
+    their next hit. Keys of a one-off scan lose every admission duel, so
+    the hot keys of the main cache survive it.
+
+    Attributes:
+        cache_data (dict): A dictionary that holds the cached items.
+        sketch (FrequencySketch): Access frequency estimator.
+        window (OrderedDict): Admission window, least recent first.
+        probation (OrderedDict): Main keys hit once, least recent first.
+        protected (OrderedDict): Main keys hit again, least recent first.
+        window_size (int): Capacity of the window.
+        protected_size (int): Capacity of the protected segment.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """ Initialize the TinyLFUCache.
+
+        This method calls the parent class's initializer and sizes the
+        window and main segments from max_items.
+        """
+        super().__init__(*args, **kwargs)
+        self.sketch = FrequencySketch(self.max_items)
+        self.window = OrderedDict()
+        self.probation = OrderedDict()
+        self.protected = OrderedDict()
+        self.window_size = max(1, self.max_items // 100)
+        self.protected_size = int((self.max_items - self.window_size) * 0.8)
+
+    @timed("put")
+    def put(self, key, item, ttl=None):
+        """ Add an item to the cache.
+
+        Args:
+            key (str): The key under which the item will be stored in the
+                        cache.
+            item (any): The item to be cached.
+            ttl (float): Seconds before the item expires, the cache
+                        default TTL if None.
+
+        If key or item is None, this method will not perform any operation.
+        If the cache is full, the loser of the admission duel between the
+        window candidate and the main victim is discarded and a message
+        indicating which key was discarded is printed.
+        """
+        if key is None or item is None:
+            return
+
+        self.expire()
+        self.sketch.increment(key)
+        size = self._size_of(item)
+        if self._oversized(key, size):
+            return
+
+        if key in self.cache_data:
+            self._store(key, item, size, ttl)
+            self._touch(key)
+            self._shrink()
+            return
+
+        self._make_room(size)
+        self._store(key, item, size, ttl)
+        self.window[key] = None
+        while len(self.window) > self.window_size:
+            candidate, _ = self.window.popitem(last=False)
+            self.probation[candidate] = None
+
+    @timed("get")
+    def get(self, key):
+        """ Retrieve an item from the cache.
+
+        Every lookup, hit or miss, is recorded in the frequency sketch.
+
+        Args:
+            key (str): The key of the item to retrieve.
+
+        Returns:
+            The value associated with the key if it exists, or None if the
+            key is None or does not exist in the cache.
+        """
+        if key is None:
+            return None
+
+        self.sketch.increment(key)
+        if key not in self.cache_data or self._expired(key):
+            return None
+
+        self._touch(key)
+        return self.cache_data[key]
+
+    def _touch(self, key):
+        """ Refresh a resident key, promoting it out of probation. """
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+        else:
+            del self.probation[key]
+            self.protected[key] = None
+            if len(self.protected) > self.protected_size:
+                demoted, _ = self.protected.popitem(last=False)
+                self.probation[demoted] = None
+
+    def _main_victim(self):
+        """ Return the eviction candidate of the main cache, or None. """
+        if self.probation:
+            return next(iter(self.probation))
+        if self.protected:
+            return next(iter(self.protected))
+        return None
+
+    def _victim(self):
+        """ Run the admission duel when both the window and the main cache
+        are full; the winning window candidate moves to probation.
+        """
+        victim = self._main_victim()
+        if not self.window:
+            return victim
+        candidate = next(iter(self.window))
+        if victim is None:
+            return candidate
+        if len(self.window) < self.window_size:
+            return victim
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            del self.window[candidate]
+            self.probation[candidate] = None
+            return victim
+        return candidate
+
+    def _forget(self, key):
+        """ Drop key from its segment. """
+        for segment in (self.window, self.probation, self.protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def _snapshot_state(self):
+        """ Save the frequency sketch. """
+        sketch = self.sketch
+        return {"rows": [bytes(row) for row in sketch.rows],
+                "doorkeeper": bytes(sketch.doorkeeper),
+                "additions": sketch.additions}
+
+    def _restore_state(self, state):
+        """ Reload the frequency sketch when its width matches. """
+        sketch = self.sketch
+        if len(state["doorkeeper"]) != len(sketch.doorkeeper):
+            return
+        sketch.rows = [bytearray(row) for row in state["rows"]]
+        sketch.doorkeeper = bytearray(state["doorkeeper"])
+        sketch.additions = state["additions"]
+
+    def _snapshot_entries(self):
+        """ Snapshot each segment, least recent first. """
+        for name in ("window", "probation", "protected"):
+            for key in getattr(self, name):
+                yield key, name
+
+    def _restore_entry(self, key, segment):
+        """ Put a restored key back in its segment. """
+        getattr(self, segment)[key] = None
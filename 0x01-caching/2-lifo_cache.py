@@ -4,7 +4,9 @@ This module defines the LIFOCache class, which implements
 a Last In, First Out (LIFO) caching mechanism, inheriting
 from BaseCaching.
 """
-from base_caching import BaseCaching
+from collections import OrderedDict
+
+from base_caching import BaseCaching, timed
 
 
 class LIFOCache(BaseCaching):
@@ -17,28 +19,36 @@ class LIFOCache(BaseCaching):
 
     Attributes:
         cache_data (dict): A dictionary that holds the cached items.
+        order (OrderedDict): Keys in the order they were put, the
+        last put key at the end.
     """
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """ Initialize the LIFOCache.
 
         This method calls the parent class's initializer
         to set up the cache_data dictionary and any other
         necessary initialization from BaseCaching.
         """
-        super().__init__()
+        super().__init__(*args, **kwargs)
+        self.order = OrderedDict()
 
-    def put(self, key, item):
+    @timed("put")
+    def put(self, key, item, ttl=None):
         """ Add an item to the cache.
 
         This method adds an item to the cache with the given key.
-        If the number of items exceeds the maximum allowed (MAX_ITEMS),
-        the last item added to the cache will be discarded.
+        If the number of items exceeds the maximum allowed (max_items),
+        or their size exceeds max_bytes, the last items added to the
+        cache will be discarded. Putting an existing key again makes it
+        the last added item.
 
         Args:
             key (str): The key under which the item will
             be stored in the cache.
             item (any): The item to be cached.
+            ttl (float): Seconds before the item expires,
+            the cache default TTL if None.
 
         If key or item is None, this method will not perform any operation.
         If adding the item exceeds the cache limit, it will discard
@@ -48,13 +58,19 @@ class LIFOCache(BaseCaching):
         if key is None or item is None:
             return
 
-        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            last_key = list(self.cache_data.keys())[-1]
-            print(f"DISCARD: {last_key}")
-            del self.cache_data[last_key]
+        self.expire()
+        size = self._size_of(item)
+        if self._oversized(key, size):
+            return
+
+        if key in self.cache_data:
+            self._discard(key)
 
-        self.cache_data[key] = item
+        self._make_room(size)
+        self._store(key, item, size, ttl)
+        self.order[key] = None
 
+    @timed("get")
     def get(self, key):
         """ Retrieve an item from the cache.
 
@@ -69,6 +85,24 @@ class LIFOCache(BaseCaching):
             or None if the key is None
             or does not exist in the cache.
         """
-        if key is None or key not in self.cache_data:
+        if (key is None or key not in self.cache_data or
+                self._expired(key)):
             return None
         return self.cache_data[key]
+
+    def _victim(self):
+        """ The last added key is evicted first """
+        return next(reversed(self.order))
+
+    def _forget(self, key):
+        """ Drop key from the put order """
+        del self.order[key]
+
+    def _snapshot_entries(self):
+        """ Snapshot keys in put order """
+        for key in self.order:
+            yield key, None
+
+    def _restore_entry(self, key, meta):
+        """ Restored keys arrive in put order """
+        self.order[key] = None
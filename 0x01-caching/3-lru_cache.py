@@ -4,7 +4,9 @@ This module defines the LRUCache class, which implements
 a Least Recently Used (LRU) caching mechanism,
 inheriting from BaseCaching.
 """
-from base_caching import BaseCaching
+from collections import OrderedDict
+
+from base_caching import BaseCaching, timed
 
 
 class LRUCache(BaseCaching):
@@ -17,33 +19,39 @@ class LRUCache(BaseCaching):
 
     Attributes:
         cache_data (dict): A dictionary that holds the cached items.
-        order (list): A list that tracks the order of keys
-        based on usage for LRU eviction.
+        order (OrderedDict): Keys ordered from least to most
+        recently used. Moving a key to the end and popping the
+        oldest key are both O(1), so every operation costs the
+        same no matter how large max_items is.
     """
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """ Initialize the LRUCache.
 
         This method calls the parent class's initializer to
         set up the cache_data dictionary and any other
         necessary initialization from BaseCaching.
-        It also initializes an order list to track the
+        It also initializes an ordered dictionary to track the
         usage order of cached items.
         """
-        super().__init__()
-        self.order = []
+        super().__init__(*args, **kwargs)
+        self.order = OrderedDict()
 
-    def put(self, key, item):
+    @timed("put")
+    def put(self, key, item, ttl=None):
         """ Add an item to the cache.
 
         This method adds an item to the cache with the given key.
-        If the number of items exceeds the maximum allowed (MAX_ITEMS),
-        the least recently used item will be discarded.
+        If the number of items exceeds the maximum allowed (max_items),
+        or their size exceeds max_bytes, the least recently used items
+        will be discarded.
 
         Args:
             key (str): The key under which the item will be
             stored in the cache.
             item (any): The item to be cached.
+            ttl (float): Seconds before the item expires,
+            the cache default TTL if None.
 
         If key or item is None, this method will not perform any operation.
         If adding the item exceeds the cache limit, it will discard
@@ -53,20 +61,19 @@ class LRUCache(BaseCaching):
         if key is None or item is None:
             return
 
-        if key in self.cache_data:
-            self.cache_data[key] = item
-            self.order.remove(key)
-            self.order.append(key)
+        self.expire()
+        size = self._size_of(item)
+        if self._oversized(key, size):
             return
 
-        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            lru_key = self.order.pop(0)
-            print(f"DISCARD: {lru_key}")
-            del self.cache_data[lru_key]
+        if key in self.cache_data:
+            self._discard(key)
 
-        self.cache_data[key] = item
-        self.order.append(key)
+        self._make_room(size)
+        self._store(key, item, size, ttl)
+        self.order[key] = None
 
+    @timed("get")
     def get(self, key):
         """ Retrieve an item from the cache.
 
@@ -82,10 +89,85 @@ class LRUCache(BaseCaching):
             or None if the key is None
             or does not exist in the cache.
         """
-        if key is None or key not in self.cache_data:
+        if (key is None or key not in self.cache_data or
+                self._expired(key)):
             return None
 
-        self.order.remove(key)
-        self.order.append(key)
+        self.order.move_to_end(key)
 
         return self.cache_data[key]
+
+    def _victim(self):
+        """ The least recently used key is evicted first """
+        return next(iter(self.order))
+
+    def _forget(self, key):
+        """ Drop key from the usage order """
+        del self.order[key]
+
+    def get_many(self, keys):
+        """ Retrieve several items, refreshing their usage order
+        without the per-call overhead of get.
+
+        A key requested several times counts as a hit, and is moved
+        to the most recently used end, each time, as with get.
+
+        Args:
+            keys (iterable): The keys of the items to retrieve.
+
+        Returns:
+            A dictionary of the keys found in the cache and their items.
+        """
+        cache_data = self.cache_data
+        move_to_end = self.order.move_to_end
+        found = {}
+        requested = hits = 0
+        for key in keys:
+            requested += 1
+            if (key is not None and key in cache_data and
+                    not self._expired(key)):
+                found[key] = cache_data[key]
+                move_to_end(key)
+                hits += 1
+        self.hits += hits
+        self.misses += requested - hits
+        return found
+
+    def put_many(self, mapping, ttl=None):
+        """ Add several items without the per-call overhead of put.
+
+        The items are added in mapping order with exactly the evictions
+        put would make, including keys already cached and keys of the
+        batch itself pushed out by later ones; only the expiry sweep is
+        shared. With a byte budget every item is put on its own.
+
+        Args:
+            mapping (dict): The items to cache, by key.
+            ttl (float): Seconds before the items expire,
+            the cache default TTL if None.
+        """
+        if self.max_bytes is not None:
+            super().put_many(mapping, ttl)
+            return
+
+        self.expire()
+        cache_data = self.cache_data
+        order = self.order
+        for key, item in mapping.items():
+            if key is None or item is None:
+                continue
+            if key in cache_data:
+                self._discard(key)
+            elif len(cache_data) >= self.max_items:
+                self._evict("capacity")
+            self._store(key, item, 0, ttl)
+            order[key] = None
+
+    def _snapshot_entries(self):
+        """ Snapshot keys from least to most recently used """
+        for key in self.order:
+            yield key, None
+
+    def _restore_entry(self, key, meta):
+        """ Restored keys arrive in usage order """
+        self.order[key] = None
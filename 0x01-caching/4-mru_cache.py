@@ -1,47 +1,53 @@
 #!/usr/bin/env python3
 """ MRUCache module
 """
-from base_caching import BaseCaching
+from collections import OrderedDict
+
+from base_caching import BaseCaching, timed
 
 
 class MRUCache(BaseCaching):
     """ MRUCache class that inherits from BaseCaching
     Implements a caching system that evicts the most recently used item.
+    Recency is kept in an OrderedDict so touching and evicting a key
+    are O(1).
     """
 
-    def __init__(self):
+    def __init__(self, *args, **kwargs):
         """ Initialize the MRUCache
         """
-        super().__init__()
-        self.order = []
+        super().__init__(*args, **kwargs)
+        self.order = OrderedDict()
 
-    def put(self, key, item):
+    @timed("put")
+    def put(self, key, item, ttl=None):
         """ Add an item to the cache
         Args:
             key (str): The key to add to the cache.
             item (Any): The item to be cached.
+            ttl (float): Seconds before the item expires, the cache
+                default TTL if None.
 
         If key or item is None, this method should not do anything.
-        If the number of items exceeds MAX_ITEMS, the most recently
-        used item is discarded.
+        If the number of items exceeds max_items, or their size exceeds
+        max_bytes, the most recently used items are discarded.
         """
         if key is None or item is None:
             return
 
-        if key in self.cache_data:
-            self.cache_data[key] = item
-            self.order.remove(key)
-            self.order.append(key)
+        self.expire()
+        size = self._size_of(item)
+        if self._oversized(key, size):
             return
 
-        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            most_recent_key = self.order.pop()
-            print(f"DISCARD: {most_recent_key}")
-            del self.cache_data[most_recent_key]
+        if key in self.cache_data:
+            self._discard(key)
 
-        self.cache_data[key] = item
-        self.order.append(key)
+        self._make_room(size)
+        self._store(key, item, size, ttl)
+        self.order[key] = None
 
+    @timed("get")
     def get(self, key):
         """ Get an item from the cache
         Args:
@@ -50,10 +56,31 @@ class MRUCache(BaseCaching):
         Returns:
             The value linked to the key or None if key is None or not found.
         """
-        if key is None or key not in self.cache_data:
+        if (key is None or key not in self.cache_data or
+                self._expired(key)):
             return None
 
-        self.order.remove(key)
-        self.order.append(key)
+        self.order.move_to_end(key)
 
         return self.cache_data[key]
+
+    def _victim(self):
+        """ The most recently used key is evicted first
+        """
+        return next(reversed(self.order))
+
+    def _forget(self, key):
+        """ Drop key from the usage order
+        """
+        del self.order[key]
+
+    def _snapshot_entries(self):
+        """ Snapshot keys from least to most recently used
+        """
+        for key in self.order:
+            yield key, None
+
+    def _restore_entry(self, key, meta):
+        """ Restored keys arrive in usage order
+        """
+        self.order[key] = None
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+""" ShardedCache module
+This module defines the ShardedCache class, a thread-safe wrapper that
+spreads keys over several independently locked caches of any
+BaseCaching policy.
+"""
+import threading
+
+from base_caching import BaseCaching, LatencyHistogram
+
+
+class ShardedCache():
+    """ ShardedCache class that makes any BaseCaching policy thread-safe.
+
+    Keys are hashed onto N shards. Each shard is a separate cache of the
+    wrapped policy guarded by its own lock, so threads working on keys of
+    different shards never wait for each other and contention drops as the
+    number of shards grows.
+
+    Eviction is decided per shard: each shard applies the policy to its
+    own keys, with an equal share of the capacity.
+
+    Attributes:
+        shards (list): The per-shard caches.
+        locks (list): One lock per shard.
+    """
+
+    def __init__(self, policy, shards=16, max_items=None, max_bytes=None,
+                 **kwargs):
+        """ Initialize the ShardedCache.
+
+        Args:
+            policy (type): The BaseCaching subclass used by every shard.
+            shards (int): Number of shards.
+            max_items (int): Total capacity, BaseCaching.MAX_ITEMS if None.
+                It is split over the shards so that their capacities add
+                up to max_items exactly, the first shards holding one
+                entry more when it does not divide evenly. There are never
+                more shards than max_items, so each one holds at least
+                one entry.
+            max_bytes (int): Optional total byte budget, split the same way,
+                and likewise never over more shards than max_bytes.
+            kwargs: Passed on to the policy of every shard.
+        """
+        if shards < 1:
+            raise ValueError("shards must be greater than 0")
+        if max_items is None:
+            max_items = BaseCaching.MAX_ITEMS
+        if max_items < 1:
+            raise ValueError("max_items must be greater than 0")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
+        shards = min(shards, max_items, max_bytes or shards)
+        self.shards = [
+            policy(max_items=self._share(max_items, shards, index),
+                   max_bytes=(None if max_bytes is None else
+                              self._share(max_bytes, shards, index)),
+                   **kwargs)
+            for index in range(shards)
+        ]
+        self.locks = [threading.Lock() for _ in range(shards)]
+
+    @staticmethod
+    def _share(total, shards, index):
+        """ Return the part of total given to shard number index """
+        return total // shards + (index < total % shards)
+
+    def _index(self, key):
+        """ Return the shard number that owns key """
+        return hash(key) % len(self.shards)
+
+    def put(self, key, item, ttl=None):
+        """ Add an item to the shard that owns key.
+
+        If key or item is None, this method will not perform any operation.
+        The item expires after ttl seconds, or the shards' default TTL.
+        """
+        if key is None or item is None:
+            return
+        index = self._index(key)
+        with self.locks[index]:
+            self.shards[index].put(key, item, ttl)
+
+    def get(self, key):
+        """ Retrieve an item from the shard that owns key.
+
+        Returns:
+            The value associated with the key if it exists, or None if the
+            key is None or does not exist in the cache.
+        """
+        if key is None:
+            return None
+        index = self._index(key)
+        with self.locks[index]:
+            return self.shards[index].get(key)
+
+    def expire(self):
+        """ Sweep expired entries out of every shard, one lock at a time.
+
+        Safe to call from a background timer thread.
+
+        Returns:
+            The number of entries removed.
+        """
+        removed = 0
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                removed += shard.expire()
+        return removed
+
+    def stats(self):
+        """ Return the counters of all shards combined, in the format of
+        BaseCaching.stats
+        """
+        totals = {"hits": 0, "misses": 0, "entries": 0, "bytes": 0}
+        evictions = {}
+        latency = {"get": LatencyHistogram(), "put": LatencyHistogram()}
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                totals["hits"] += shard.hits
+                totals["misses"] += shard.misses
+                totals["entries"] += len(shard.cache_data)
+                totals["bytes"] += shard.current_bytes
+                for reason, count in shard.evictions.items():
+                    evictions[reason] = evictions.get(reason, 0) + count
+                for operation, histogram in latency.items():
+                    histogram.merge(shard.latency[operation])
+        totals["evictions"] = evictions
+        for operation, histogram in latency.items():
+            totals[operation + "_p50_ns"] = histogram.percentile(0.5)
+            totals[operation + "_p99_ns"] = histogram.percentile(0.99)
+        return totals
+
+    def print_cache(self):
+        """ Print the content of every shard, sorted by key """
+        cache_data = {}
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                cache_data.update(shard.cache_data)
+        print("Current cache:")
+        for key in sorted(cache_data.keys()):
+            print("{}: {}".format(key, cache_data.get(key)))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+""" Cached decorator module
+This module defines the cached decorator, which memoizes a function or a
+coroutine in any BaseCaching policy, computing each missing value once
+even when many callers ask for it at the same time.
+"""
+import asyncio
+import functools
+import inspect
+import threading
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+KWARGS_MARK = object()
+
+
+def make_key(args, kwargs):
+    """ Build a hashable cache key from the arguments of a call.
+
+    Args:
+        args (tuple): Positional arguments.
+        kwargs (dict): Keyword arguments, sorted so their order does not
+                       matter.
+
+    Returns:
+        tuple: The key.
+    """
+    key = args
+    if kwargs:
+        key += (KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    return key
+
+
+class _Call():
+    """ _Call holds the outcome of an in-flight computation for the
+    threads waiting on it.
+    """
+
+    def __init__(self):
+        """ Initialize an unfinished call. """
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def cached(policy=LRUCache, max_items=None, ttl=None, key=make_key,
+           **options):
+    """ Memoize a function or an async def coroutine.
+
+    Results are stored in a cache of the given policy, keyed by the call
+    arguments bound to the signature with defaults applied, so f(1),
+    f(1, 10) and f(page=1) share an entry. Concurrent misses for the same
+    key are deduplicated (single-flight): the first caller computes the
+    value and the others wait for its result, or its exception, so a
+    thundering herd computes a page once. None results are never cached.
+
+    Args:
+        policy (type): The BaseCaching subclass holding the results.
+        max_items (int): Capacity of the cache, MAX_ITEMS if None.
+        ttl (float): Seconds a result stays valid, forever if None.
+        key (callable): Builds the cache key from (args, kwargs).
+        options: Passed on to the policy, e.g. max_bytes or listener.
+
+    Returns:
+        The decorator. The decorated function exposes its cache as the
+        cache attribute, e.g. for cache.stats().
+    """
+    options.setdefault("listener", None)
+
+    def decorator(function):
+        """ Wrap function with its own cache. """
+        cache = policy(max_items=max_items, ttl=ttl, **options)
+        signature = inspect.signature(function)
+
+        def call_key(args, kwargs):
+            """ Return the cache key of a call. """
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return key(bound.args, bound.kwargs)
+
+        if inspect.iscoroutinefunction(function):
+            pending = {}
+
+            def finish(cache_key, task):
+                """ Cache the result of a finished computation. """
+                del pending[cache_key]
+                if not task.cancelled() and task.exception() is None:
+                    cache.put(cache_key, task.result())
+
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                """ Return the cached value or await the shared
+                computation of it.
+                """
+                cache_key = call_key(args, kwargs)
+                value = cache.get(cache_key)
+                if value is not None:
+                    return value
+                task = pending.get(cache_key)
+                if task is None:
+                    task = asyncio.ensure_future(function(*args, **kwargs))
+                    pending[cache_key] = task
+                    task.add_done_callback(
+                        functools.partial(finish, cache_key))
+                return await asyncio.shield(task)
+
+            async_wrapper.cache = cache
+            return async_wrapper
+
+        lock = threading.Lock()
+        calls = {}
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            """ Return the cached value, computing it once per key. """
+            cache_key = call_key(args, kwargs)
+            with lock:
+                value = cache.get(cache_key)
+                if value is not None:
+                    return value
+                call = calls.get(cache_key)
+                leader = call is None
+                if leader:
+                    call = calls[cache_key] = _Call()
+
+            if not leader:
+                call.event.wait()
+                if call.error is not None:
+                    raise call.error
+                return call.result
+
+            try:
+                call.result = function(*args, **kwargs)
+            except BaseException as error:
+                call.error = error
+                raise
+            finally:
+                with lock:
+                    if call.error is None:
+                        cache.put(cache_key, call.result)
+                    del calls[cache_key]
+                call.event.set()
+            return call.result
+
+        wrapper.cache = cache
+        return wrapper
+    return decorator
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+""" 100-bench
+Stress LFUCache with a Zipfian key stream and report the average cost of
+one operation for several cache sizes. Most keys of a skewed stream sit
+at frequency 1, which used to make every hit on a cold key scan its whole
+bucket; with O(1) buckets the ns/op column no longer grows with size.
+
+Usage: ./100-bench.py [ops] [size ...]
+"""
+import contextlib
+import itertools
+import os
+import random
+import sys
+import time
+
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+
+def zipf_stream(universe, ops, seed, s=1.1):
+    """ Return ops keys drawn from range(universe) with P(k) ~ 1/(k+1)^s.
+    """
+    weights = (1 / (rank + 1) ** s for rank in range(universe))
+    cum_weights = list(itertools.accumulate(weights))
+    rng = random.Random(seed)
+    return rng.choices(range(universe), cum_weights=cum_weights, k=ops)
+
+
+def run(size, ops):
+    """ Replay a Zipfian stream over ten times more keys than the cache
+    holds. Every miss is followed by a put, like a read-through cache.
+    Returns (ns per operation, hit ratio).
+    """
+    cache = LFUCache(max_items=size)
+    stream = zipf_stream(size * 10, ops, seed=size)
+    hits = 0
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        start = time.perf_counter_ns()
+        for key in stream:
+            if cache.get(key) is None:
+                cache.put(key, key)
+            else:
+                hits += 1
+        elapsed = time.perf_counter_ns() - start
+    return elapsed / ops, hits / ops
+
+
+if __name__ == "__main__":
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    sizes = [int(arg) for arg in sys.argv[2:]] or [4, 1000, 100000]
+    print("{:>10} {:>10} {:>10}".format("size", "ns/op", "hit ratio"))
+    for size in sizes:
+        cost, ratio = run(size, ops)
+        print("{:>10} {:>10.0f} {:>10.3f}".format(size, cost, ratio))
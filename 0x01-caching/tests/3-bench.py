@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+""" 3-bench
+Measure per-operation latency of LRUCache and MRUCache as MAX_ITEMS
+grows. With O(1) recency bookkeeping the ns/op column stays flat from
+4 entries up to 1M entries.
+
+Usage: ./3-bench.py [ops] [size ...]
+"""
+import contextlib
+import os
+import random
+import sys
+import time
+
+LRUCache = __import__('3-lru_cache').LRUCache
+MRUCache = __import__('4-mru_cache').MRUCache
+
+
+def run(cache_class, size, ops):
+    """ Fill a cache of the given size, then time a mix of hits and
+    evicting inserts. Returns the average cost of one operation in ns.
+    """
+    cache = cache_class(max_items=size)
+    for key in range(size):
+        cache.put(key, key)
+
+    rng = random.Random(size)
+    hits = [rng.randrange(size) for _ in range(ops)]
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        start = time.perf_counter_ns()
+        for i, key in enumerate(hits):
+            if i % 4:
+                cache.get(key)
+            else:
+                cache.put(size + i, i)
+        elapsed = time.perf_counter_ns() - start
+    return elapsed / ops
+
+
+if __name__ == "__main__":
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    sizes = [int(arg) for arg in sys.argv[2:]] or [4, 1000, 100000, 1000000]
+    print("{:>10} {:>10} {:>10}".format("size", "LRU ns/op", "MRU ns/op"))
+    for size in sizes:
+        print("{:>10} {:>10.0f} {:>10.0f}".format(
+            size, run(LRUCache, size, ops), run(MRUCache, size, ops)))
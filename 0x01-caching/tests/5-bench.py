@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+""" 5-bench
+Multi-threaded throughput of a ShardedCache of LRUCache shards shared by
+several threads, for 1, 4, 16 and 64 shards.
+
+Usage: ./5-bench.py [threads] [ops per thread] [shards ...]
+"""
+import contextlib
+import os
+import random
+import sys
+import threading
+import time
+
+ShardedCache = __import__('5-sharded_cache').ShardedCache
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+def run(shards, threads, ops):
+    """ Let every thread replay its own random get-or-put stream against
+    one shared cache. Returns the total throughput in operations per
+    second.
+    """
+    cache = ShardedCache(LRUCache, shards=shards, max_items=10000)
+    streams = [
+        [random.Random(n).randrange(20000) for _ in range(ops)]
+        for n in range(threads)
+    ]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(stream):
+        """ Replay one stream once every thread is ready """
+        barrier.wait()
+        for key in stream:
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+    workers = [threading.Thread(target=worker, args=(stream,))
+               for stream in streams]
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        for thread in workers:
+            thread.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    return threads * ops / elapsed
+
+
+if __name__ == "__main__":
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    ops = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    shard_counts = [int(arg) for arg in sys.argv[3:]] or [1, 4, 16, 64]
+    print("{:>8} {:>12}".format("shards", "ops/sec"))
+    for shards in shard_counts:
+        print("{:>8} {:>12.0f}".format(shards, run(shards, threads, ops)))
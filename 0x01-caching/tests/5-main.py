@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+""" 5-main """
+import threading
+
+ShardedCache = __import__('5-sharded_cache').ShardedCache
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+my_cache = ShardedCache(LRUCache, shards=2, max_items=4)
+for key in range(4):
+    my_cache.put(key, "Item {}".format(key))
+my_cache.print_cache()
+print(my_cache.get(0))
+my_cache.put(4, "Item 4")
+my_cache.put(5, "Item 5")
+my_cache.print_cache()
+
+my_cache = ShardedCache(LFUCache, shards=8, max_items=64)
+
+
+def worker(offset):
+    """ Hammer the shared cache from one thread """
+    for i in range(20000):
+        key = (offset * 7 + i) % 48
+        if my_cache.get(key) is None:
+            my_cache.put(key, key)
+
+
+threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+
+print(sum(len(shard.cache_data) for shard in my_cache.shards))
+print(all(
+    sorted(shard.frequencies) == sorted(shard.cache_data) and
+    sum(len(bucket) for bucket in shard.order.values()) ==
+    len(shard.cache_data)
+    for shard in my_cache.shards))
+
+# the shards hold max_items and max_bytes in total, never more
+for shards, max_items, max_bytes in ((16, 4, None), (3, 10, 100),
+                                     (8, 64, 5)):
+    my_cache = ShardedCache(LRUCache, shards=shards, max_items=max_items,
+                            max_bytes=max_bytes, listener=None)
+    print(len(my_cache.shards),
+          [shard.max_items for shard in my_cache.shards],
+          sum(shard.max_bytes or 0 for shard in my_cache.shards))
+my_cache = ShardedCache(LRUCache, listener=None)
+for key in range(100):
+    my_cache.put(key, key)
+print(sum(len(shard.cache_data) for shard in my_cache.shards))
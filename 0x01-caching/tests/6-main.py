@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+""" 6-main """
+import asyncio
+import threading
+import time
+
+cached = __import__('6-cached_decorator').cached
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+calls = []
+
+
+@cached(max_items=2)
+def get_page(page, page_size=10):
+    """ Pretend to build a page slowly """
+    calls.append((page, page_size))
+    time.sleep(0.1)
+    return list(range((page - 1) * page_size, page * page_size))
+
+
+threads = [threading.Thread(target=get_page, args=(1,)) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+print(calls)
+print(get_page(1))
+print(get_page(1, 10) is get_page(page_size=10, page=1))
+get_page(2, 3)
+get_page(3, 3)
+get_page(1)
+print(calls)
+print(get_page.cache.stats()["hits"])
+
+
+@cached(policy=LFUCache, ttl=0.2)
+async def get_hyper(page):
+    """ Pretend to build a hypermedia page slowly """
+    calls.append(page)
+    await asyncio.sleep(0.1)
+    if page < 1:
+        raise ValueError("page must be a positive integer")
+    return {"page": page}
+
+
+async def main():
+    """ Send concurrent requests for the same pages """
+    calls.clear()
+    pages = await asyncio.gather(*(get_hyper(1) for _ in range(10)))
+    print(pages[0], pages.count(pages[0]), calls)
+    results = await asyncio.gather(get_hyper(0), get_hyper(0),
+                                   return_exceptions=True)
+    print(results, calls)
+    await asyncio.sleep(0.25)
+    await get_hyper(1)
+    print(calls)
+
+asyncio.run(main())
@@ -1,18 +1,170 @@
 #!/usr/bin/python3
 """ BaseCaching module
 """
+import functools
+import pickle
+import sys
+import time
+
+
+def deep_sizeof(obj):
+    """ Estimate the memory held by obj, in bytes.
+
+    Starts from sys.getsizeof and follows the contents of dicts, lists,
+    tuples, sets and instance __dict__s, counting every object once.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, '__dict__'):
+            stack.append(vars(current))
+    return size
+
+
+def print_discard(key, item, reason):
+    """ Default eviction listener: print the keys evicted to make room
+    """
+    if reason in ("capacity", "size"):
+        print(f"DISCARD: {key}")
+
+
+def timed(operation):
+    """ Decorate a put or get method to count it, sample its latency
+    once every LATENCY_SAMPLE calls, and for get record whether it was a
+    hit (an item is never None) or a miss
+    """
+    clock = time.perf_counter_ns
+
+    def decorator(method):
+        """ Wrap method """
+        if operation == "get":
+            @functools.wraps(method)
+            def timed_get(self, key):
+                """ Count the lookup as a hit or a miss """
+                self.get_calls += 1
+                if self.get_calls % self.LATENCY_SAMPLE:
+                    result = method(self, key)
+                else:
+                    start = clock()
+                    result = method(self, key)
+                    self.get_latency[(clock() - start).bit_length()] += 1
+                if result is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                return result
+            return timed_get
+
+        @functools.wraps(method)
+        def timed_put(self, *args, **kwargs):
+            """ Count the insertion """
+            self.put_calls += 1
+            if self.put_calls % self.LATENCY_SAMPLE:
+                return method(self, *args, **kwargs)
+            start = clock()
+            method(self, *args, **kwargs)
+            self.put_latency[(clock() - start).bit_length()] += 1
+        return timed_put
+    return decorator
+
+
+class LatencyHistogram():
+    """ LatencyHistogram counts durations in power-of-two nanosecond
+    buckets: buckets[n] holds the durations of n bits, so recording one
+    costs a single list increment
+    """
+
+    def __init__(self):
+        """ Initiliaze empty buckets
+        """
+        self.buckets = [0] * 64
+
+    def merge(self, other):
+        """ Add the samples of another histogram to this one
+        """
+        for i, count in enumerate(other.buckets):
+            self.buckets[i] += count
+
+    def percentile(self, fraction):
+        """ Upper bound in ns of the bucket holding the given fraction
+        of the samples, or 0 without samples
+        """
+        total = sum(self.buckets)
+        if not total:
+            return 0
+        threshold = fraction * total
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= threshold:
+                return 1 << i
+        return 1 << (len(self.buckets) - 1)
+
 
 class BaseCaching():
     """ BaseCaching defines:
       - constants of your caching system
       - where your data are stored (in a dictionary)
+      - the entry-count and byte budgets every policy evicts against
+      - the expiry of entries put with a TTL
     """
     MAX_ITEMS = 4
+    TTL_TICK = 0.1
+    LATENCY_SAMPLE = 16
+    SNAPSHOT_MAGIC = b"BCSNAP1\n"
 
-    def __init__(self):
+    def __init__(self, max_items=None, max_bytes=None, sizer=deep_sizeof,
+                 ttl=None, listener=print_discard):
         """ Initiliaze
+
+        Args:
+            max_items (int): Maximum number of entries, MAX_ITEMS if None.
+            max_bytes (int): Optional budget for the summed size of the
+                cached items. Sizes are only computed when it is set.
+            sizer (callable): Returns the size of an item in bytes.
+            ttl (float): Default time to live of an entry in seconds,
+                None for entries that never expire.
+            listener (callable): Called as listener(key, item, reason)
+                for every entry the cache removes on its own. reason is
+                "capacity", "size", "expired" or "oversized". None
+                disables the notification.
         """
+        if max_items is None:
+            max_items = self.MAX_ITEMS
+        if max_items < 1:
+            raise ValueError("max_items must be greater than 0")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be greater than 0")
         self.cache_data = {}
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.sizer = sizer
+        self.sizes = {}
+        self.current_bytes = 0
+        self.ttl = ttl
+        self.expires = {}
+        self.wheel = {}
+        self.swept_tick = int(time.monotonic() / self.TTL_TICK)
+        self.listener = listener
+        self.hits = 0
+        self.misses = 0
+        self.get_calls = 0
+        self.put_calls = 0
+        self.evictions = {}
+        self.latency = {"get": LatencyHistogram(), "put": LatencyHistogram()}
+        self.get_latency = self.latency["get"].buckets
+        self.put_latency = self.latency["put"].buckets
 
     def print_cache(self):
         """ Print the cache
@@ -21,7 +173,26 @@ class BaseCaching():
         for key in sorted(self.cache_data.keys()):
             print("{}: {}".format(key, self.cache_data.get(key)))
 
-    def put(self, key, item):
+    def stats(self):
+        """ Return the counters of the cache: hits, misses, evictions by
+        reason, current entries and bytes, and the p50/p99 latency of get
+        and put in ns. Latencies are the upper bounds of power-of-two
+        buckets, sampled once every LATENCY_SAMPLE calls. bytes is only
+        tracked when max_bytes is set.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": dict(self.evictions),
+            "entries": len(self.cache_data),
+            "bytes": self.current_bytes,
+            "get_p50_ns": self.latency["get"].percentile(0.5),
+            "get_p99_ns": self.latency["get"].percentile(0.99),
+            "put_p50_ns": self.latency["put"].percentile(0.5),
+            "put_p99_ns": self.latency["put"].percentile(0.99),
+        }
+
+    def put(self, key, item, ttl=None):
         """ Add an item in the cache
         """
         raise NotImplementedError("put must be implemented in your cache class")
@@ -30,3 +201,243 @@ class BaseCaching():
         """ Get an item by key
         """
         raise NotImplementedError("get must be implemented in your cache class")
+
+    def get_many(self, keys):
+        """ Get several items at once
+
+        Returns:
+            A dictionary of the keys found in the cache and their items.
+        """
+        found = {}
+        for key in keys:
+            item = self.get(key)
+            if item is not None:
+                found[key] = item
+        return found
+
+    def put_many(self, mapping, ttl=None):
+        """ Add every item of mapping to the cache, in mapping order
+        """
+        for key, item in mapping.items():
+            self.put(key, item, ttl)
+
+    def delete(self, key):
+        """ Remove key from the cache, telling whether it was there
+        """
+        if key is None or key not in self.cache_data:
+            return False
+        self._discard(key)
+        return True
+
+    def delete_many(self, keys):
+        """ Remove several keys, returning how many were in the cache
+        """
+        return sum(1 for key in keys if self.delete(key))
+
+    def snapshot(self, path):
+        """ Save the cache to path so another process can restore it warm
+
+        The file holds a header then one pickle record per entry, written
+        in the policy's own order with its metadata (recency, frequency,
+        segment) and the remaining TTL. Records are streamed one at a time,
+        so snapshotting never copies the cache in memory. Only restore
+        files you wrote yourself: they are read with pickle.
+        """
+        now = time.monotonic()
+        header = {
+            "policy": type(self).__name__,
+            "entries": len(self.cache_data),
+            "state": self._snapshot_state(),
+        }
+        with open(path, "wb") as f:
+            f.write(self.SNAPSHOT_MAGIC)
+            pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+            for key, meta in self._snapshot_entries():
+                deadline = self.expires.get(key)
+                ttl = None if deadline is None else deadline - now
+                if ttl is not None and ttl <= 0:
+                    continue
+                record = (key, self.cache_data[key], meta, ttl)
+                pickle.dump(record, f, pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, path):
+        """ Load a snapshot written by a cache of the same policy into this
+        empty cache, in time linear to the number of entries. Entries over
+        this cache's budgets are evicted afterwards.
+        """
+        if self.cache_data:
+            raise ValueError("restore needs an empty cache")
+        with open(path, "rb") as f:
+            if f.read(len(self.SNAPSHOT_MAGIC)) != self.SNAPSHOT_MAGIC:
+                raise ValueError("{} is not a cache snapshot".format(path))
+            header = pickle.load(f)
+            if header["policy"] != type(self).__name__:
+                raise ValueError("snapshot of a {}, not a {}".format(
+                    header["policy"], type(self).__name__))
+            self._restore_state(header["state"])
+            for _ in range(header["entries"]):
+                try:
+                    key, item, meta, ttl = pickle.load(f)
+                except EOFError:
+                    break
+                self._store(key, item, self._size_of(item), ttl)
+                if ttl is None:
+                    self.expires.pop(key, None)
+                self._restore_entry(key, meta)
+        while len(self.cache_data) > self.max_items:
+            self._evict("capacity")
+        self._shrink()
+
+    def _snapshot_state(self):
+        """ Policy state saved in the snapshot header
+        """
+        return None
+
+    def _restore_state(self, state):
+        """ Reload the policy state saved by _snapshot_state
+        """
+
+    def _snapshot_entries(self):
+        """ Yield (key, metadata) in the order restore must replay them
+        """
+        for key in self.cache_data:
+            yield key, None
+
+    def _restore_entry(self, key, meta):
+        """ Rebuild the policy bookkeeping of a restored key
+        """
+
+    def _size_of(self, item):
+        """ Size of item in bytes, or 0 when no byte budget is set
+        """
+        if self.max_bytes is None:
+            return 0
+        return self.sizer(item)
+
+    def _oversized(self, key, size):
+        """ Tell whether an item of size bytes can never fit the byte
+        budget. Such items are not cached and any stale value stored
+        under key is dropped.
+        """
+        if self.max_bytes is None or size <= self.max_bytes:
+            return False
+        if key in self.cache_data:
+            self._remove(key, "oversized")
+        return True
+
+    def _is_full(self, size):
+        """ Tell whether adding a new entry of size bytes would exceed
+        the entry-count or the byte budget
+        """
+        if len(self.cache_data) >= self.max_items:
+            return True
+        return (self.max_bytes is not None and
+                self.current_bytes + size > self.max_bytes)
+
+    def _make_room(self, size):
+        """ Evict entries until a new entry of size bytes fits
+        """
+        while self.cache_data and self._is_full(size):
+            if len(self.cache_data) >= self.max_items:
+                self._evict("capacity")
+            else:
+                self._evict("size")
+
+    def _shrink(self):
+        """ Evict entries until the cache is back under its byte budget,
+        after an existing entry grew in place
+        """
+        while (self.max_bytes is not None and self.cache_data and
+               self.current_bytes > self.max_bytes):
+            self._evict("size")
+
+    def expire(self):
+        """ Remove the entries whose TTL ran out before the current tick.
+
+        Deadlines are bucketed by tick on a timer wheel, so a sweep only
+        visits the buckets that came due since the last sweep and costs
+        O(expired), not O(cache size). Puts sweep on their own; call this
+        from a timer to reclaim memory while the cache is idle.
+
+        Returns:
+            The number of entries removed.
+        """
+        tick = int(time.monotonic() / self.TTL_TICK)
+        if tick <= self.swept_tick:
+            return 0
+        if tick - self.swept_tick <= len(self.wheel):
+            due = range(self.swept_tick + 1, tick + 1)
+        else:
+            due = [slot for slot in self.wheel if slot <= tick]
+        self.swept_tick = tick
+        now = time.monotonic()
+        removed = 0
+        for slot in due:
+            for key in self.wheel.pop(slot, ()):
+                if self.expires.get(key, now + 1) <= now:
+                    self._remove(key, "expired")
+                    removed += 1
+        return removed
+
+    def _expired(self, key):
+        """ Tell whether key outlived its TTL, discarding it if so
+        """
+        deadline = self.expires.get(key)
+        if deadline is None or deadline > time.monotonic():
+            return False
+        self._remove(key, "expired")
+        return True
+
+    def _store(self, key, item, size, ttl=None):
+        """ Save item under key, account for its size and schedule its
+        expiry when ttl, or the cache default TTL, is set
+        """
+        if self.max_bytes is not None:
+            self.current_bytes += size - self.sizes.get(key, 0)
+            self.sizes[key] = size
+        self.cache_data[key] = item
+        if ttl is None:
+            ttl = self.ttl
+        if ttl is None:
+            self.expires.pop(key, None)
+            return
+        deadline = time.monotonic() + ttl
+        self.expires[key] = deadline
+        slot = int(deadline / self.TTL_TICK) + 1
+        self.wheel.setdefault(slot, set()).add(key)
+
+    def _discard(self, key):
+        """ Remove key from the cache and from the policy bookkeeping.
+        Its timer wheel slot is left behind and skipped by expire.
+        """
+        item = self.cache_data.pop(key)
+        self.current_bytes -= self.sizes.pop(key, 0)
+        self.expires.pop(key, None)
+        self._forget(key)
+        return item
+
+    def _forget(self, key):
+        """ Remove key from the policy bookkeeping. Policies that track
+        more than cache_data override this.
+        """
+
+    def _victim(self):
+        """ Return the key the policy wants to evict next
+        """
+        raise NotImplementedError("_victim must be implemented "
+                                  "in your cache class")
+
+    def _remove(self, key, reason):
+        """ Discard key on the cache's own initiative, count it under
+        reason and notify the listener
+        """
+        item = self._discard(key)
+        self.evictions[reason] = self.evictions.get(reason, 0) + 1
+        if self.listener is not None:
+            self.listener(key, item, reason)
+
+    def _evict(self, reason):
+        """ Evict the policy's victim to satisfy the budget named by
+        reason
+        """
+        self._remove(self._victim(), reason)
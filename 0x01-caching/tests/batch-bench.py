@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+""" batch-bench
+Compare get_many/put_many with the equivalent per-key loops of get/put
+for LRUCache and LFUCache.
+
+Usage: ./batch-bench.py [batches] [batch size]
+"""
+import random
+import sys
+import time
+
+POLICIES = [
+    ('LRU', __import__('3-lru_cache').LRUCache),
+    ('LFU', __import__('100-lfu_cache').LFUCache),
+]
+
+
+def run(policy, batches, batch_size, bulk):
+    """ Replay read-through batches: look up batch_size keys, then put
+    the missing ones. Returns the average cost of one key in ns.
+    """
+    cache = policy(max_items=10000, listener=None)
+    rng = random.Random(0)
+    workload = [[rng.randrange(30000) for _ in range(batch_size)]
+                for _ in range(batches)]
+    start = time.perf_counter_ns()
+    for keys in workload:
+        if bulk:
+            found = cache.get_many(keys)
+            cache.put_many({key: key for key in keys if key not in found})
+        else:
+            for key in keys:
+                if cache.get(key) is None:
+                    cache.put(key, key)
+    elapsed = time.perf_counter_ns() - start
+    return elapsed / (batches * batch_size)
+
+
+if __name__ == "__main__":
+    batches = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    print("{:>8} {:>12} {:>12}".format(
+        "policy", "loop ns/key", "batch ns/key"))
+    for name, policy in POLICIES:
+        print("{:>8} {:>12.0f} {:>12.0f}".format(
+            name, run(policy, batches, batch_size, False),
+            run(policy, batches, batch_size, True)))
@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+""" batch-main """
+FIFOCache = __import__('1-fifo_cache').FIFOCache
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+for cache_class in (FIFOCache, LRUCache, LFUCache):
+    my_cache = cache_class()
+    my_cache.put_many({"A": "Hello", "B": "World", "C": "Holberton"})
+    print(my_cache.get_many(["A", "C", "Z"]))
+    my_cache.put_many({"D": "School", "E": "Battery", "A": "Street"})
+    my_cache.print_cache()
+    print(my_cache.delete_many(["D", "Z"]))
+    my_cache.put_many({str(i): i for i in range(6)})
+    my_cache.print_cache()
+    print(my_cache.stats()["hits"], my_cache.stats()["misses"])
+
+# a batch of new keys evicts like put one by one: the hot key stays
+my_cache = LFUCache(listener=None)
+my_cache.put_many({"A": 0, "B": 1, "C": 2, "D": 3})
+for _ in range(5):
+    my_cache.get("A")
+my_cache.put_many({str(i): i for i in range(6)})
+print(sorted(my_cache.cache_data), my_cache.stats()["evictions"])
+
+# a key requested several times counts, and is used, each time
+for cache_class in (LRUCache, LFUCache):
+    my_cache = cache_class(listener=None)
+    my_cache.put_many({"k": 0, "j": 1})
+    print(my_cache.get_many(["k", "k", "k"]), my_cache.stats()["hits"],
+          my_cache.stats()["misses"])
+    if cache_class is LFUCache:
+        print(my_cache.frequencies)
+
+# existing keys pushed out by the batch are discarded as with put
+my_cache = LRUCache(max_items=3)
+my_cache.put_many({2: "a", 5: "b"})
+my_cache.put_many({1: "c", 0: "d", 3: "e", 2: "f"})
+my_cache.print_cache()
@@ -0,0 +1,29 @@
+#!/usr/bin/python3
+""" budgets-main """
+FIFOCache = __import__('1-fifo_cache').FIFOCache
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+my_cache = FIFOCache(max_items=2)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton")
+my_cache.print_cache()
+
+my_cache = LRUCache(max_items=10, max_bytes=12, sizer=len)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+print(my_cache.get("A"))
+my_cache.put("C", "Bye")
+my_cache.print_cache()
+print(my_cache.current_bytes)
+my_cache.put("D", "Too big for the budget")
+my_cache.print_cache()
+
+my_cache = LFUCache(max_bytes=10, sizer=len)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+print(my_cache.get("B"))
+my_cache.put("B", "Holberton")
+my_cache.print_cache()
+print(my_cache.current_bytes)
@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+""" policies-bench
+Trace-driven comparison of every eviction policy. The trace mixes
+Zipfian lookups of hot keys with sequential crawls over a key range much
+larger than the cache, like a client paging through the whole baby-names
+dataset. Each lookup that misses is followed by a put. Reports the hit
+ratio and throughput of each policy.
+
+Usage: ./policies-bench.py [ops] [cache size]
+"""
+import contextlib
+import itertools
+import os
+import random
+import sys
+import time
+
+POLICIES = [
+    ('FIFO', __import__('1-fifo_cache').FIFOCache),
+    ('LIFO', __import__('2-lifo_cache').LIFOCache),
+    ('LRU', __import__('3-lru_cache').LRUCache),
+    ('MRU', __import__('4-mru_cache').MRUCache),
+    ('LFU', __import__('100-lfu_cache').LFUCache),
+    ('ARC', __import__('101-arc_cache').ARCCache),
+    ('2Q', __import__('102-two_queue_cache').TwoQueueCache),
+    ('W-TinyLFU', __import__('103-tinylfu_cache').TinyLFUCache),
+]
+DATASET_ROWS = 19419
+
+
+def make_trace(ops, size, seed=0):
+    """ Return ops keys: Zipfian hot lookups over 5 * size keys, with a
+    crawl over DATASET_ROWS fresh keys after every 20 * size lookups.
+    """
+    rng = random.Random(seed)
+    hot = 5 * size
+    cum_weights = list(itertools.accumulate(
+        1 / (rank + 1) for rank in range(hot)))
+    trace = []
+    while len(trace) < ops:
+        trace.extend(rng.choices(range(hot), cum_weights=cum_weights,
+                                 k=20 * size))
+        trace.extend(("page", row) for row in range(DATASET_ROWS))
+    return trace[:ops]
+
+
+def replay(policy, trace, size):
+    """ Replay trace against a read-through cache of the given size.
+    Returns (hit ratio, operations per second).
+    """
+    cache = policy(max_items=size)
+    hits = 0
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        for key in trace:
+            if cache.get(key) is None:
+                cache.put(key, key)
+            else:
+                hits += 1
+        elapsed = time.perf_counter() - start
+    return hits / len(trace), len(trace) / elapsed
+
+
+if __name__ == "__main__":
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    trace = make_trace(ops, size)
+    print("{:>10} {:>10} {:>10}".format("policy", "hit ratio", "ops/sec"))
+    for name, policy in POLICIES:
+        ratio, throughput = replay(policy, trace, size)
+        print("{:>10} {:>10.3f} {:>10.0f}".format(name, ratio, throughput))
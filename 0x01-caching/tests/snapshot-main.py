@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+""" snapshot-main """
+import os
+import tempfile
+
+FIFOCache = __import__('1-fifo_cache').FIFOCache
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+ARCCache = __import__('101-arc_cache').ARCCache
+TinyLFUCache = __import__('103-tinylfu_cache').TinyLFUCache
+
+path = os.path.join(tempfile.mkdtemp(), "cache.snap")
+
+for cache_class in (FIFOCache, LRUCache, LFUCache, ARCCache, TinyLFUCache):
+    my_cache = cache_class(listener=None)
+    my_cache.put("A", "Hello")
+    my_cache.put("B", "World")
+    my_cache.put("C", "Holberton", ttl=60)
+    my_cache.put("D", "School")
+    my_cache.get("A")
+    my_cache.get("A")
+    my_cache.get("C")
+    my_cache.snapshot(path)
+
+    warm_cache = cache_class()
+    warm_cache.restore(path)
+    warm_cache.print_cache()
+    my_cache.put("E", "Battery")
+    warm_cache.put("E", "Battery")
+    print(sorted(my_cache.cache_data) == sorted(warm_cache.cache_data))
+    print(0 < warm_cache.expires["C"] - my_cache.expires["C"] < 1)
+
+try:
+    LRUCache().restore(os.devnull)
+except ValueError as error:
+    print(error)
+try:
+    FIFOCache().restore(path)
+except ValueError as error:
+    print(error)
+os.remove(path)
@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+""" stats-main """
+import time
+
+LRUCache = __import__('3-lru_cache').LRUCache
+ShardedCache = __import__('5-sharded_cache').ShardedCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+my_cache = LRUCache()
+for key in "ABCDEF":
+    my_cache.put(key, key.lower())
+print(my_cache.get("A"))
+print(my_cache.get("F"))
+stats = my_cache.stats()
+print(stats["hits"], stats["misses"], stats["evictions"], stats["entries"])
+print(stats["get_p50_ns"] <= stats["get_p99_ns"])
+
+evicted = []
+my_cache = LRUCache(
+    max_items=2, ttl=0.1,
+    listener=lambda key, item, reason: evicted.append((key, reason)))
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton")
+time.sleep(0.15)
+print(my_cache.get("C"))
+print(evicted)
+print(my_cache.stats()["evictions"])
+
+my_cache = ShardedCache(LFUCache, shards=4, max_items=8, listener=None)
+for key in range(20):
+    my_cache.put(key, key)
+    my_cache.get(key - 1)
+stats = my_cache.stats()
+print(stats["hits"], stats["misses"], stats["evictions"], stats["entries"])
@@ -0,0 +1,36 @@
+#!/usr/bin/python3
+""" ttl-main """
+import time
+
+LRUCache = __import__('3-lru_cache').LRUCache
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+my_cache = LRUCache(ttl=0.2)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World", ttl=10)
+my_cache.put("C", "Holberton", ttl=0.1)
+my_cache.print_cache()
+time.sleep(0.15)
+print(my_cache.get("C"))
+print(my_cache.get("A"))
+time.sleep(0.1)
+print(my_cache.get("A"))
+print(list(my_cache.order))
+my_cache.put("D", "School")
+my_cache.put("E", "Battery")
+my_cache.put("F", "Mission")
+my_cache.print_cache()
+
+my_cache = LFUCache(max_items=100)
+for i in range(50):
+    my_cache.put(i, i, ttl=0.1)
+for i in range(50, 60):
+    my_cache.put(i, i)
+print(my_cache.get(1))
+time.sleep(0.3)
+print(my_cache.expire())
+print(len(my_cache.cache_data), len(my_cache.frequencies))
+print(sorted(my_cache.order.keys()))
+print(my_cache.get(55))
+my_cache.put(60, 60)
+print(my_cache.expire())